@@ -20,24 +20,68 @@ Features:
 """
 
 import csv
+import io
 import json
 import sys
 import os
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict, Counter
+from collections import defaultdict, deque, Counter
+from contextlib import nullcontext
 from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from operator import attrgetter, itemgetter, methodcaller
+from itertools import chain, islice, repeat
+from typing import Iterator
+from array import array
+import struct
 import time
 import platform
+import re
 import difflib
-
-# Optional Pandas for faster CSV parsing (5-10x speedup for large files)
+import hashlib
+import shutil
+import tempfile
+import heapq
+import mmap
+import zlib
+import base64
+
+# Optional Pandas for faster CSV parsing (5-10x speedup for large files).
+# Older releases lack pd.factorize(use_na_sentinel=...) and use the row parsers.
+PANDAS_MIN_VERSION = (1, 5)
 try:
     import pandas as pd
+    import numpy as np
+    if tuple(map(int, re.findall(r"\d+", pd.__version__)[:2])) < PANDAS_MIN_VERSION:
+        raise ImportError(f"pandas {pd.__version__} is older than 1.5")
     USE_PANDAS = True
 except ImportError:
     USE_PANDAS = False
     pd = None
+    np = None
+
+# Optional pyarrow for Parquet exports of normalized findings; without it
+# exports use the stdlib columnar scan format (.pdscan)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    USE_PYARROW = True
+except ImportError:
+    pa = None
+    pq = None
+    USE_PYARROW = False
+
+# Optional shared memory for handing worker results to the parent without
+# pickling every row (Python 3.8+). POSIX only: on Windows a segment is
+# destroyed as soon as the creating worker closes it.
+try:
+    from multiprocessing import shared_memory, resource_tracker
+    USE_SHARED_MEMORY = os.name == "posix"
+except ImportError:
+    shared_memory = None
+    resource_tracker = None
+    USE_SHARED_MEMORY = False
 
 
 VERSION = "4.8.0"
@@ -282,43 +326,305 @@ DEFAULT_FRAMEWORK = {
 }
 
 
-def parse_csv(filepath: str) -> tuple[list[dict], str]:
-    """Parse semicolon-delimited Prowler CSV.
-    
+# Files above this size are parsed with Pandas when it is installed
+PANDAS_SIZE_THRESHOLD = 10 * 1024 * 1024  # 10MB
+
+# Rows buffered from the head of a stream for format/framework/date detection
+DETECTION_SAMPLE_ROWS = 100
+
+# Raw CSV columns read by `normalize_row`, per format. Unlisted columns are
+# never decoded by the mmap tokenizer nor converted by Pandas (usecols).
+FORMAT_COLUMNS = {
+    "main": frozenset({
+        "ACCOUNT_UID", "ACCOUNT_NAME", "REGION", "CHECK_ID", "CHECK_TITLE", "STATUS", "STATUS_EXTENDED",
+        "SEVERITY", "SERVICE_NAME", "RESOURCE_UID", "RESOURCE_NAME", "COMPLIANCE",
+    }),
+    "compliance": frozenset({
+        "ACCOUNTID", "REGION", "REQUIREMENTS_ID", "REQUIREMENTS_DESCRIPTION", "STATUS", "STATUSEXTENDED",
+        "REQUIREMENTS_ATTRIBUTES_SERVICE", "REQUIREMENTS_ATTRIBUTES_SECTION", "RESOURCEID", "RESOURCENAME",
+        "FRAMEWORK", "COMPLIANCE", "REQUIREMENTS_ATTRIBUTES_PROFILE",
+    }),
+}
+
+# Long per-check text shown in the finding detail panel. Optional: with
+# --no-details these columns are not parsed at all.
+DETAIL_COLUMNS = {
+    "main": frozenset({"RISK", "REMEDIATION_RECOMMENDATION_TEXT", "REMEDIATION_RECOMMENDATION_URL"}),
+    "compliance": frozenset({
+        "REQUIREMENTS_ATTRIBUTES_REMEDIATIONPROCEDURE", "REQUIREMENTS_ATTRIBUTES_RATIONALESTATEMENT",
+    }),
+}
+
+# Read from the head of the file by format/framework/date detection
+DETECTION_COLUMNS = frozenset({
+    "SEVERITY", "CHECK_ID", "REQUIREMENTS_ATTRIBUTES_PROFILE", "REQUIREMENTS_ID", "COMPLIANCE",
+    "TIMESTAMP", "ASSESSMENTDATE",
+})
+
+NORMALIZED_COLUMNS = DETECTION_COLUMNS.union(*FORMAT_COLUMNS.values(), *DETAIL_COLUMNS.values())
+
+
+def parse_columns(keep_columns: list[str] = None, details: bool = True) -> frozenset:
+    """Raw columns to parse for the dashboard.
+
+    Covers every format's manifest, since the format is only known after the
+    head of the file is read; a file carries just its own format's columns.
+    """
+    columns = DETECTION_COLUMNS.union(*FORMAT_COLUMNS.values(), keep_columns or ())
+    if details:
+        columns = columns.union(*DETAIL_COLUMNS.values())
+    return columns
+
+PARSER_NAMES = {
+    "pandas": "Pandas (Vectorized)",
+    "stdlib": "CSV Stdlib",
+    "mmap": "CSV mmap",
+}
+
+
+def choose_parser(filepath: str, columns=None) -> str:
+    """Pick the CSV parser for a file: 'pandas', 'mmap' or 'stdlib'.
+
     Performance strategy based on benchmarking:
     - stdlib csv: Faster for files <10MB (typical Prowler scans)
     - Pandas: Only for files >10MB (large enterprise scans with 50K+ rows)
-    
+    - mmap: Replaces stdlib csv when the caller only needs `columns`
+
     Benchmarks show stdlib is ~2x faster for typical Prowler CSVs because
-    Pandas has significant overhead and `to_dict('records')` is slow.
-    
-    Returns:
-        tuple(rows, parser_name)
+    Pandas has significant overhead and `to_dict('records')` is slow. The
+    10MB cutoff is replaced by the measured one after `--calibrate`.
     """
-    PANDAS_SIZE_THRESHOLD = 10 * 1024 * 1024  # 10MB
-    
     file_size = os.path.getsize(filepath)
-    use_pandas = USE_PANDAS and file_size > PANDAS_SIZE_THRESHOLD
-    
-    if use_pandas:
+    if USE_PANDAS:
+        threshold = parser_thresholds().get("pandas", PANDAS_SIZE_THRESHOLD)
+        if threshold is not None and file_size > threshold:
+            return "pandas"
+    return "stdlib" if columns is None else "mmap"
+
+
+# Bytes of the memory-mapped file tokenized per block by the mmap parser
+MMAP_BLOCK_BYTES = 1024 * 1024
+# Records needing the csv module before the rest of a block goes to it in one pass
+MMAP_DENSE_QUOTED = 32
+
+# csv only treats a quote specially at the start of a field. A "simple" quoted
+# field holds no ;, quote or line break, so dropping its quotes and splitting
+# on ";" gives the same fields as the csv module; any other field-start quote
+# sends its record to the csv module. Patterns lead with the quote (found by
+# a fast literal scan); the lookbehind then checks it opens a field. A record
+# that is only "" is complex too: stripped, it would be skipped as a blank line
+# where csv reads one empty field.
+SIMPLE_QUOTED_FIELD = re.compile(r'"(?<![^;\n]")([^;"\n]*)"(?=;|$)', re.M)
+COMPLEX_QUOTE = re.compile(rb'"(?<![^;\r\n]")(?:(?![^;"\r\n]*"(?:;|\r|$))|(?<![^\r\n]")"(?:\r|$))', re.M)
+
+
+def _iter_mmap_rows(filepath: str, columns, span: tuple = None, fieldnames: list = None) -> Iterator[dict]:
+    """Tokenize a Prowler CSV over a memory-mapped bytes buffer.
+
+    The file is walked in newline-aligned blocks, each decoded in one call
+    and split on newlines and ";"; only the fields named in `columns` are
+    picked into each row dict, and fields past the last wanted column are
+    never split out. Records with quoted fields that need the full dialect
+    (embedded ;, escaped quotes, line breaks) are read with the csv module
+    one at a time, so rows match `csv.DictReader` for every column returned,
+    including None for fields missing from short rows.
+
+    With `span=(start, stop)` only the records starting before `stop` are
+    read, beginning at `start` (a record start, after the header when
+    `fieldnames` is given). The generator returns the field names and the
+    offset where its last record ended, which is past `stop` when that record
+    runs on beyond it.
+    """
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_BLOCK_BYTES:
+            buf = f.read()  # A single block: one read is cheaper than mapping it
+        else:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with buf if isinstance(buf, mmap.mmap) else nullcontext():
+        size = len(buf)
+        find = buf.find
+        pos, stop = span or (0, size)
+        pending = False
+
+        def following_lines():
+            # Lines from `pos` on, advancing it as the csv module pulls them.
+            # `pending` is set while lines split off a lone \r are still unread.
+            nonlocal pos, pending
+            while pos < size:
+                end = find(b"\n", pos)
+                end = size if end < 0 else end + 1
+                text = buf[pos:end].decode("utf-8")
+                pos = end
+                if "\r" in text:
+                    lines = io.StringIO(text, newline=None).readlines()  # Universal newlines, like open()
+                    for k, line in enumerate(lines, 1):
+                        pending = k < len(lines)
+                        yield line
+                    pending = False
+                else:
+                    yield text
+
+        def csv_records(reader):
+            # Records up to the end of the line `pos` is at, padded like DictReader
+            while True:
+                fields = next(reader, None)
+                if fields:
+                    if len(fields) < width:
+                        fields += [None] * (width - len(fields))
+                    yield dict(zip(names, fields if pick is None else pick(fields)))
+                if not pending:
+                    return
+
+        header_end = find(b"\n")
+        header = buf[:size if header_end < 0 else header_end].rstrip(b"\r")
+        if fieldnames is not None:
+            pass  # Header already read by the caller; `pos` is a record start
+        elif header and b'"' not in header and b"\r" not in header:
+            fieldnames = header.decode("utf-8").split(";")
+            pos = size if header_end < 0 else header_end + 1
+        else:
+            reader = csv.reader(following_lines(), delimiter=";", quotechar='"')
+            fieldnames = next(reader, None)
+            while fieldnames == []:  # csv.DictReader skips blank lines before the header too
+                fieldnames = next(reader, None)
+            if fieldnames is None:
+                return None, pos
+            header_reader = reader
+        # Last occurrence wins for duplicate names, as with DictReader
+        positions = sorted({name: i for i, name in enumerate(fieldnames) if name in columns}.values())
+        names = [fieldnames[i] for i in positions]
+        width = positions[-1] + 1 if positions else 0
+        if positions == list(range(width)):
+            pick = None  # Leading columns only: zip() stops at the last name
+        elif len(positions) == 1:
+            pick = lambda fields: (fields[positions[0]],)  # noqa: E731
+        else:
+            pick = itemgetter(*positions)
+        if pending:
+            yield from csv_records(header_reader)  # Records after a lone \r on the header line
+
+        def split_lines(data: bytes):
+            text = data.decode("utf-8")
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            quotes = text.count('"')
+            if quotes:
+                # Every field-start quote here opens a simple field; when those
+                # account for all quotes, no quote inside a field needs keeping
+                opening = text.count(';"') + text.count('\n"') + text.startswith('"')
+                text = text.replace('"', "") if quotes == 2 * opening else SIMPLE_QUOTED_FIELD.sub(r"\1", text)
+            lines = list(filter(None, text.split("\n")))
+            if lines and min(map(methodcaller("count", ";"), lines)) < width - 1:
+                records = []  # Some rows are short: pad them like DictReader
+                for fields in map(methodcaller("split", ";", width), lines):
+                    if len(fields) < width:
+                        fields += [None] * (width - len(fields))
+                    records.append(fields)
+            else:
+                # Lazily, so each field list is freed as soon as its dict is built
+                records = map(methodcaller("split", ";", width), lines)
+            yield from map(dict, map(zip, repeat(names), records if pick is None else map(pick, records)))
+
+        while pos < stop:
+            if pos + MMAP_BLOCK_BYTES < stop:
+                end = buf.rfind(b"\n", pos, pos + MMAP_BLOCK_BYTES)
+                if end < 0:
+                    end = find(b"\n", pos + MMAP_BLOCK_BYTES)  # One line longer than a block
+                end = size if end < 0 else end + 1
+            else:
+                end = stop
+            block = buf[pos:end]
+            base = pos
+            i = 0
+            reader = None
+            fallbacks = 0
+            while i < len(block):
+                match = COMPLEX_QUOTE.search(block, i) if b'"' in block else None
+                if match is None:
+                    yield from split_lines(block[i:])
+                    pos = end
+                    break
+                if fallbacks >= MMAP_DENSE_QUOTED:
+                    # Quoted records are the norm in this block: one csv pass over the rest
+                    lines = list(io.StringIO(block[i:].decode("utf-8"), newline=None))
+                    pos = end
+                    reader = csv.reader(chain(lines, following_lines()), delimiter=";", quotechar='"')
+                    for fields in reader:
+                        if fields:
+                            if len(fields) < width:
+                                fields += [None] * (width - len(fields))
+                            yield dict(zip(names, fields if pick is None else pick(fields)))
+                        if reader.line_num >= len(lines) and not pending:
+                            break  # Rest of the block consumed (plus any continuation lines)
+                    break
+                fallbacks += 1
+                line_start = block.rfind(b"\n", i, match.start()) + 1 or i
+                if line_start > i:
+                    yield from split_lines(block[i:line_start])
+                    reader = None
+                if reader is None:
+                    pos = base + line_start
+                    reader = csv.reader(following_lines(), delimiter=";", quotechar='"')
+                # One record, pulling continuation lines (even past the block) as needed,
+                # and any further records on its last line
+                yield from csv_records(reader)
+                i = pos - base
+        return fieldnames, pos
+
+
+def iter_csv_rows(filepath: str, parser: str = None, columns=None) -> Iterator[dict]:
+    """Stream rows of a semicolon-delimited Prowler CSV one at a time.
+
+    Only one Pandas chunk (or one stdlib row) is alive at any point, so peak
+    memory is bounded by the chunk size rather than the file size. With
+    `columns`, rows may contain only those columns (the mmap tokenizer skips
+    decoding the rest, Pandas converting them).
+    """
+    if parser is None:
+        parser = choose_parser(filepath, columns)
+
+    if parser == "mmap":
+        rows = _iter_mmap_rows(filepath, columns)
         try:
-            # Use chunksize to avoid loading entire DataFrame into memory at once
-            # This prevents holding both the DF and the list[dict] in memory simultaneously
-            rows = []
-            with pd.read_csv(filepath, delimiter=";", dtype=str, keep_default_na=False, chunksize=5000) as reader:
+            first = next(rows, None)
+        except OSError:
+            rows = None  # Not mappable (e.g. a pipe); nothing consumed yet, so re-read with csv
+        if rows is not None:
+            try:
+                if first is not None:
+                    yield first
+                    yield from rows
+                return
+            except Exception as e:
+                print(f"  ❌ Failed to parse {os.path.basename(filepath)}: {e}")
+                raise
+
+    if parser == "pandas":
+        yielded = False
+        try:
+            usecols = None if columns is None else columns.__contains__
+            with pd.read_csv(filepath, delimiter=";", dtype=str, keep_default_na=False, chunksize=5000,
+                             usecols=usecols) as reader:
                 for chunk in reader:
-                    rows.extend(chunk.to_dict('records'))
-            return rows, "Pandas (Chunked)"
+                    for record in chunk.to_dict('records'):
+                        yielded = True
+                        yield record
+            if yielded:
+                return
+            # No rows, or none of `columns` in the header (Pandas then drops every
+            # row): let the csv module decide, as it would have without Pandas
         except MemoryError:
             print(f"  ⚠️  Memory error parsing {os.path.basename(filepath)} - file too large")
             print("      Consider splitting the file or increasing system memory")
             raise
         except Exception as e:
+            # Rows already handed downstream cannot be re-read without duplicating them
+            if yielded:
+                raise
             print(f"  ⚠️  Pandas parsing failed for {os.path.basename(filepath)}: {e}")
             print("      Falling back to standard CSV parser...")
-    
+
     # stdlib csv: faster for typical Prowler files, PyPy-optimized
-    rows = []
     try:
         with open(filepath, "r", encoding="utf-8") as f:
             # PRD FR-A1: Handle malformed CSV with unescaped quotes
@@ -326,12 +632,24 @@ def parse_csv(filepath: str) -> tuple[list[dict], str]:
             # might still fail. For now, we rely on standard strict=False behavior if possible
             # or just standard DictReader which handles simple quoting.
             reader = csv.DictReader(f, delimiter=";", quotechar='"')
-            for row in reader:
-                rows.append(row)
+            yield from reader
     except Exception as e:
         print(f"  ❌ Failed to parse {os.path.basename(filepath)}: {e}")
         raise
-    return rows, "CSV Stdlib"
+
+
+def parse_csv(filepath: str, columns=None) -> tuple[list[dict], str]:
+    """Parse semicolon-delimited Prowler CSV into memory.
+
+    Convenience wrapper around `iter_csv_rows` for callers that need the whole
+    file at once; the dashboard pipeline streams instead. With `columns`
+    (e.g. `parse_columns()`), other columns are not parsed or kept.
+
+    Returns:
+        tuple(rows, parser_name)
+    """
+    parser = choose_parser(filepath, columns)
+    return list(iter_csv_rows(filepath, parser, columns)), PARSER_NAMES[parser]
 
 
 def detect_format(rows: list[dict]) -> str:
@@ -433,7 +751,7 @@ def detect_primary_framework(rows: list[dict], filepath: str = "", user_framewor
     # Analyze COMPLIANCE column - look for frameworks across all entries
     framework_counts = Counter()
 
-    for row in rows[:100]:  # Sample first 100 rows
+    for row in rows[:DETECTION_SAMPLE_ROWS]:  # Sample first rows
         compliance = row.get("COMPLIANCE", "")
         frameworks = extract_frameworks_from_compliance(compliance)
         # Count ALL frameworks mentioned, not just the first
@@ -531,55 +849,364 @@ def get_scan_date(rows: list[dict]) -> str:
     return "Unknown"
 
 
-def normalize_row(row: dict, csv_format: str) -> dict:
-    """Normalize row to common format regardless of CSV type."""
-    if csv_format == "main":
-        return {
-            "acctId": row.get("ACCOUNT_UID", ""),
-            "acctName": row.get("ACCOUNT_NAME", ""),
-            "region": row.get("REGION", ""),
-            "checkId": row.get("CHECK_ID", ""),
-            "checkTitle": row.get("CHECK_TITLE", ""),
-            "status": row.get("STATUS", ""),
-            "statusExt": row.get("STATUS_EXTENDED", ""),
-            "severity": row.get("SEVERITY", "").lower(),
-            "service": row.get("SERVICE_NAME", ""),
-            "resourceId": row.get("RESOURCE_UID", ""),
-            "resourceName": row.get("RESOURCE_NAME", ""),
-            "risk": row.get("RISK", ""),
-            "remediation": row.get("REMEDIATION_RECOMMENDATION_TEXT", ""),
-            "remediationUrl": row.get("REMEDIATION_RECOMMENDATION_URL", ""),
-            "compliance": row.get("COMPLIANCE", ""),
-            "mitre": extract_mitre_techniques(row.get("COMPLIANCE", "")),
-            "_raw": row,
+class SymbolTable:
+    """Per-run dictionary encoder for repeated column values.
+
+    `intern` returns one canonical object per distinct value so repeated
+    strings (region, status, check title...) are stored once per run;
+    `code` returns the value's small integer index into `values`, which is
+    what the dashboard JSON embeds as a lookup table.
+    """
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def __len__(self):
+        return len(self.values)
+
+    def code(self, value) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def intern(self, value):
+        return self.values[self.code(value)]
+
+
+# Finding fields whose values repeat across rows and are interned during
+# normalization. resourceId/resourceName/statusExt are near-unique per row.
+INTERNED_FIELDS = (
+    "acctId", "acctName", "region", "checkId", "checkTitle", "status", "severity", "service",
+    "risk", "remediation", "remediationUrl", "compliance", "mitre", "profile", "section", "rationale",
+)
+
+# DATA.findings keys emitted as integer codes into DATA.dictionaries
+ENCODED_COLUMNS = (
+    "id", "title", "status", "severity", "delta", "oldStatus", "oldSeverity", "acctId", "acct",
+    "region", "service", "risk", "remediation", "remediationUrl", "profile", "section", "rationale", "mitre",
+)
+
+
+# Field layout of a Finding record. The order is also the positional
+# constructor order used when unpickling records sent back from workers.
+FINDING_FIELDS = (
+    "acctId", "acctName", "region", "checkId", "checkTitle", "status", "statusExt",
+    "severity", "service", "resourceId", "resourceName", "risk", "remediation",
+    "remediationUrl", "compliance", "mitre", "profile", "section", "rationale",
+    "extra", "delta", "oldStatus", "oldSeverity", "acct",
+)
+
+
+class Finding:
+    """Compact record for one normalized finding.
+
+    A single `__slots__` object is used from `normalize_row` through
+    `calculate_delta` to JSON emission, instead of a fresh 20-key dict at each
+    stage. Dict-style access (`row["acctId"]`, `row.get("delta")`) is kept so
+    the aggregation helpers work on Findings and plain dicts alike; fields
+    holding None behave like missing dict keys.
+    """
+
+    __slots__ = FINDING_FIELDS
+
+    # Internal field -> key used in DATA.findings (the dashboard JSON)
+    DISPLAY_NAMES = {"checkId": "id", "checkTitle": "title", "resourceId": "resource"}
+    _ALIASES = {display: field for field, display in DISPLAY_NAMES.items()}
+    _FIELDS = frozenset(FINDING_FIELDS)
+
+    def __init__(self, acctId="", acctName="", region="", checkId="", checkTitle="", status="", statusExt="",
+                 severity="", service="", resourceId="", resourceName="", risk="", remediation="",
+                 remediationUrl="", compliance="", mitre=(), profile="", section="", rationale="",
+                 extra=None, delta=None, oldStatus=None, oldSeverity=None, acct=None):
+        self.acctId = acctId
+        self.acctName = acctName
+        self.region = region
+        self.checkId = checkId
+        self.checkTitle = checkTitle
+        self.status = status
+        self.statusExt = statusExt
+        self.severity = severity
+        self.service = service
+        self.resourceId = resourceId
+        self.resourceName = resourceName
+        self.risk = risk
+        self.remediation = remediation
+        self.remediationUrl = remediationUrl
+        self.compliance = compliance
+        self.mitre = mitre
+        self.profile = profile
+        self.section = section
+        self.rationale = rationale
+        self.extra = extra
+        self.delta = delta
+        self.oldStatus = oldStatus
+        self.oldSeverity = oldSeverity
+        self.acct = acct
+
+    @classmethod
+    def from_dict(cls, row: dict) -> "Finding":
+        """Build a Finding from a normalized dict, ignoring unknown keys."""
+        fields = cls._FIELDS
+        aliases = cls._ALIASES
+        return cls(**{aliases.get(k, k): v for k, v in row.items() if aliases.get(k, k) in fields})
+
+    def _field(self, key: str) -> str:
+        field = self._ALIASES.get(key, key)
+        if field not in self._FIELDS:
+            raise KeyError(key)
+        return field
+
+    def __getitem__(self, key):
+        return getattr(self, self._field(key))
+
+    def __setitem__(self, key, value):
+        setattr(self, self._field(key), value)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def get(self, key, default=None):
+        field = self._ALIASES.get(key, key)
+        value = getattr(self, field) if field in self._FIELDS else None
+        return default if value is None else value
+
+    def keys(self) -> list[str]:
+        return [f for f in FINDING_FIELDS if getattr(self, f) is not None]
+
+    def values_tuple(self) -> tuple:
+        return tuple(getattr(self, f) for f in FINDING_FIELDS)
+
+    def __reduce__(self):
+        # Positional tuple pickles far smaller than the default slot-name dict
+        return (Finding, self.values_tuple())
+
+    def __eq__(self, other):
+        if not isinstance(other, Finding):
+            return NotImplemented
+        return self.values_tuple() == other.values_tuple()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Finding({self.acctId!r}, {self.region!r}, {self.checkId!r}, {self.resourceId!r}, {self.status!r})"
+
+    def to_display(self, dictionaries: dict = None) -> dict:
+        """Render the record as a DATA.findings entry.
+
+        With `dictionaries` (column -> SymbolTable), ENCODED_COLUMNS are
+        emitted as integer codes into those tables.
+        """
+        finding = {
+            "id": self.checkId,
+            "title": self.checkTitle,
+            "status": self.status,
+            "severity": self.severity,
+            "delta": self.delta or "unchanged",
+            "oldStatus": self.oldStatus,
+            "oldSeverity": self.oldSeverity,
+            "acctId": self.acctId,
+            "region": self.region,
+            "service": self.service,
+            "resource": self.resourceId,
+            "resourceName": self.resourceName,
+            "statusExt": self.statusExt,
+            "risk": self.risk,
+            "remediation": self.remediation,
+            "remediationUrl": self.remediationUrl,
+            # CIS-specific (from compliance format)
+            "profile": self.profile,
+            "section": self.section,
+            "rationale": self.rationale,
+            "mitre": self.mitre,
         }
+        # User-selected raw columns (--keep-columns), omitted when unused
+        if self.extra:
+            finding["extra"] = self.extra
+        if self.acct is not None:
+            finding["acct"] = self.acct
+        if dictionaries:
+            finding["mitre"] = tuple(self.mitre)
+            for col in ENCODED_COLUMNS:
+                if col in finding:
+                    finding[col] = dictionaries[col].code(finding[col])
+        return finding
+
+
+# DATA.findings column -> Finding field, in emission order. 'extra' and 'acct'
+# are left out when no finding sets them.
+DISPLAY_COLUMNS = {
+    "id": "checkId", "title": "checkTitle", "status": "status", "severity": "severity", "delta": "delta",
+    "oldStatus": "oldStatus", "oldSeverity": "oldSeverity", "acctId": "acctId", "region": "region",
+    "service": "service", "resource": "resourceId", "resourceName": "resourceName", "statusExt": "statusExt",
+    "risk": "risk", "remediation": "remediation", "remediationUrl": "remediationUrl", "profile": "profile",
+    "section": "section", "rationale": "rationale", "mitre": "mitre", "extra": "extra", "acct": "acct",
+}
+OPTIONAL_COLUMNS = ("extra", "acct")
+
+# Display keys of the DETAIL_COLUMNS text. Identical for every resource under
+# a check, so dashboards emit each distinct tuple once, outside DATA, and each
+# finding holds a "detail" code into them.
+DETAIL_FIELDS = ("risk", "remediation", "remediationUrl", "rationale")
+
+# DATA.removed columns: old-scan findings that matched nothing in the new scan
+REMOVED_COLUMNS = ("id", "title", "status", "severity", "acctId", "region", "resource")
+
+# Finding fields the dashboard keyword filter reads from the search corpus
+# block; the other searched columns are matched through their dictionaries
+SEARCH_FIELDS = ("resourceId", "resourceName", "statusExt")
+
+
+class FindingColumn:
+    """One DATA.findings column, materialized a slice at a time while it is serialized.
+
+    With a SymbolTable the values are emitted as integer codes into it. A
+    tuple `field` reads several attributes and codes the tuple of values.
+    """
+
+    __slots__ = ("findings", "field", "table")
+
+    def __init__(self, findings: list, field: str | tuple, table: SymbolTable = None):
+        self.findings = findings
+        self.field = field
+        self.table = table
+
+    def __len__(self):
+        return len(self.findings)
+
+    def __getitem__(self, index: slice) -> list:
+        fields = self.field if isinstance(self.field, tuple) else (self.field,)
+        values = list(map(attrgetter(*fields), self.findings[index]))
+        if self.field == "delta":
+            values = [v or "unchanged" for v in values]
+        if self.table is not None:
+            if self.field == "mitre":
+                values = map(tuple, values)
+            values = list(map(self.table.code, values))
+        return values
+
+
+class FindingColumns(dict):
+    """Column-oriented DATA.findings: {"count": n, column: [values...], ...}.
+
+    Field names are written once per column instead of once per finding, and
+    with `dictionaries` (column -> SymbolTable) ENCODED_COLUMNS hold integer
+    codes. Columns are `FindingColumn`s, so `iter_safe_json` streams them
+    without building the arrays.
+
+    With `details`, DETAIL_FIELDS are replaced by a single "detail" column
+    of codes into that SymbolTable, emitted as an `iter_html` block.
+    `columns` restricts the output to those DISPLAY_COLUMNS.
+    """
+
+    def __init__(self, findings: list, dictionaries: dict = None, details: SymbolTable = None,
+                 columns: tuple = None):
+        super().__init__(count=len(findings))
+        dictionaries = dictionaries or {}
+        for column, field in DISPLAY_COLUMNS.items():
+            if columns is not None and column not in columns:
+                continue
+            if column in OPTIONAL_COLUMNS and not any(map(attrgetter(field), findings)):
+                continue
+            if details is not None and column in DETAIL_FIELDS:
+                continue
+            self[column] = FindingColumn(findings, field, dictionaries.get(column))
+        if details is not None:
+            self["detail"] = FindingColumn(findings, tuple(DISPLAY_COLUMNS[c] for c in DETAIL_FIELDS), details)
+
+
+class SearchCorpus(FindingColumn):
+    """Lowercase keyword-filter text per finding, one string per finding.
+
+    Holds SEARCH_FIELDS, the searched columns that are not dictionary-coded
+    (the template matches those through DATA.dictionaries). A value contained
+    in another one of the same finding is dropped: search terms never
+    contain whitespace, so it cannot match a term the other does not.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, findings: list):
+        super().__init__(findings, SEARCH_FIELDS)
+
+    def __getitem__(self, index: slice) -> list:
+        return [_search_text(values) for values in super().__getitem__(index)]
+
+
+def _search_text(values: tuple) -> str:
+    kept = []
+    for value in sorted(map(str.lower, values), key=len, reverse=True):
+        if value and not any(value in other for other in kept):
+            kept.append(value)
+    # Newlines separate findings once the template joins the corpus
+    return " ".join(kept).replace("\n", " ")
+
+
+def normalize_row(row: dict, csv_format: str, keep_columns: list[str] = None,
+                  symbols: SymbolTable = None) -> Finding:
+    """Normalize row to common format regardless of CSV type.
+
+    The original CSV row is not retained. Columns listed in `keep_columns`
+    are copied verbatim into an `extra` dict for display in the dashboard.
+    With `symbols`, INTERNED_FIELDS share one object per distinct value.
+    """
+    extra = {col: row.get(col, "") for col in keep_columns} if keep_columns else None
+    if csv_format == "main":
+        finding = Finding(
+            acctId=row.get("ACCOUNT_UID", ""),
+            acctName=row.get("ACCOUNT_NAME", ""),
+            region=row.get("REGION", ""),
+            checkId=row.get("CHECK_ID", ""),
+            checkTitle=row.get("CHECK_TITLE", ""),
+            status=row.get("STATUS", ""),
+            statusExt=row.get("STATUS_EXTENDED", ""),
+            severity=row.get("SEVERITY", "").lower(),
+            service=row.get("SERVICE_NAME", ""),
+            resourceId=row.get("RESOURCE_UID", ""),
+            resourceName=row.get("RESOURCE_NAME", ""),
+            risk=row.get("RISK", ""),
+            remediation=row.get("REMEDIATION_RECOMMENDATION_TEXT", ""),
+            remediationUrl=row.get("REMEDIATION_RECOMMENDATION_URL", ""),
+            compliance=row.get("COMPLIANCE", ""),
+            mitre=tuple(extract_mitre_techniques(row.get("COMPLIANCE", ""))),
+            extra=extra,
+        )
     else:
         # Compliance format
-        return {
-            "acctId": row.get("ACCOUNTID", ""),
-            "acctName": "",
-            "region": row.get("REGION", ""),
-            "checkId": row.get("REQUIREMENTS_ID", ""),
-            "checkTitle": row.get("REQUIREMENTS_DESCRIPTION", ""),
-            "status": row.get("STATUS", ""),
-            "statusExt": row.get("STATUSEXTENDED", ""),
-            "severity": "",  # Not available in compliance format
-            "service": row.get("REQUIREMENTS_ATTRIBUTES_SERVICE", "") or row.get("REQUIREMENTS_ATTRIBUTES_SECTION", ""),
-            "resourceId": row.get("RESOURCEID", ""),
-            "resourceName": row.get("RESOURCENAME", ""),
-            "risk": "",
-            "remediation": row.get("REQUIREMENTS_ATTRIBUTES_REMEDIATIONPROCEDURE", ""),
-            "remediationUrl": "",
-            
-            "compliance": row.get("FRAMEWORK", ""),
-            "mitre": list(set(extract_mitre_techniques(row.get("FRAMEWORK", "")) + 
-                            extract_mitre_techniques(row.get("REQUIREMENTS_ATTRIBUTES_SECTION", "")) + 
-                            extract_mitre_techniques(row.get("COMPLIANCE", "")))),
-            "profile": row.get("REQUIREMENTS_ATTRIBUTES_PROFILE", ""),
-            "section": row.get("REQUIREMENTS_ATTRIBUTES_SECTION", ""),
-            "rationale": row.get("REQUIREMENTS_ATTRIBUTES_RATIONALESTATEMENT", ""),
-            "_raw": row,
-        }
+        finding = Finding(
+            acctId=row.get("ACCOUNTID", ""),
+            acctName="",
+            region=row.get("REGION", ""),
+            checkId=row.get("REQUIREMENTS_ID", ""),
+            checkTitle=row.get("REQUIREMENTS_DESCRIPTION", ""),
+            status=row.get("STATUS", ""),
+            statusExt=row.get("STATUSEXTENDED", ""),
+            severity="",  # Not available in compliance format
+            service=row.get("REQUIREMENTS_ATTRIBUTES_SERVICE", "") or row.get("REQUIREMENTS_ATTRIBUTES_SECTION", ""),
+            resourceId=row.get("RESOURCEID", ""),
+            resourceName=row.get("RESOURCENAME", ""),
+            risk="",
+            remediation=row.get("REQUIREMENTS_ATTRIBUTES_REMEDIATIONPROCEDURE", ""),
+            remediationUrl="",
+            compliance=row.get("FRAMEWORK", ""),
+            mitre=tuple(dict.fromkeys(extract_mitre_techniques(row.get("FRAMEWORK", "")) +
+                                      extract_mitre_techniques(row.get("REQUIREMENTS_ATTRIBUTES_SECTION", "")) +
+                                      extract_mitre_techniques(row.get("COMPLIANCE", "")))),
+            profile=row.get("REQUIREMENTS_ATTRIBUTES_PROFILE", ""),
+            section=row.get("REQUIREMENTS_ATTRIBUTES_SECTION", ""),
+            rationale=row.get("REQUIREMENTS_ATTRIBUTES_RATIONALESTATEMENT", ""),
+            extra=extra,
+        )
+
+    if symbols is not None:
+        intern = symbols.intern
+        for field in INTERNED_FIELDS:
+            setattr(finding, field, intern(getattr(finding, field)))
+    return finding
 
 
 def create_key(row: dict) -> str:
@@ -587,79 +1214,238 @@ def create_key(row: dict) -> str:
     return f"{row['acctId']}|{row['region']}|{row['checkId']}|{row['resourceId']}"
 
 
-def calculate_delta(new_rows: list[dict], old_rows: list[dict]) -> list[dict]:
-    """Compare scans and mark delta status with robust matching."""
-    if not old_rows:
-        return [dict(r, delta="unchanged", oldStatus=None) for r in new_rows]
+def annotate_delta(row, delta: str, old_status: str = None, old_severity: str = None):
+    """Attach delta fields to a row.
 
-    # 1. Strict Map (Primary) - Matches on Resource UID / ARN
-    old_map_strict = {create_key(r): r for r in old_rows}
-    
-    # 2. Name Map (Secondary) - Matches on Resource Name
+    Finding records are annotated in place (no per-row copy); plain dicts are
+    copied as before so callers' inputs are left untouched.
+    """
+    if isinstance(row, Finding):
+        row.delta = delta
+        row.oldStatus = old_status
+        row.oldSeverity = old_severity
+        return row
+    return dict(row, delta=delta, oldStatus=old_status, oldSeverity=old_severity)
+
+
+# Fuzzy resource matching: a new row with no strict/name match is paired with
+# the most similar old resource ID in its acct|region|check bucket, provided
+# the difflib ratio exceeds FUZZY_THRESHOLD. Buckets up to FUZZY_SCAN_LIMIT are
+# exact; larger ones only score a trigram shortlist and are approximate.
+FUZZY_THRESHOLD = 0.7
+FUZZY_SCAN_LIMIT = 32       # Buckets up to this size are scored exhaustively
+FUZZY_SHORTLIST = 16        # Candidates scored per row in larger buckets
+FUZZY_NGRAM = 3
+
+
+def _ngrams(text: str) -> set:
+    return {text[i:i + FUZZY_NGRAM] for i in range(len(text) - FUZZY_NGRAM + 1)}
+
+
+class FuzzyMatcher:
+    """
+    Indexed best-match search over the old resource IDs of one bucket.
+
+    Candidates are pruned before any SequenceMatcher run: a length bound and a
+    character-multiset bound (difflib's real_quick_ratio/quick_ratio) skip every
+    candidate that cannot beat the threshold or the best ratio found so far.
+    Buckets larger than FUZZY_SCAN_LIMIT additionally shortlist candidates by
+    shared trigrams, ignoring trigrams common to most of the bucket (the shared
+    ARN prefix), and score only the top FUZZY_SHORTLIST of them.
+
+    Small buckets return exactly what the linear scan did, ties included. In
+    large buckets the result is approximate: trigram overlap does not bound
+    difflib's ratio, so the best candidate can fall outside the shortlist. The
+    pick is then a lower-ratio (still above threshold) candidate, or in rare
+    cases no match at all.
+    """
+
+    __slots__ = ("candidates", "_rids", "_chars", "_matchers", "_postings")
+
+    def __init__(self, candidates: list):
+        self.candidates = candidates
+        self._rids = [c.get("resourceId", "") for c in candidates]
+        self._chars = [None] * len(candidates)
+        self._matchers = [None] * len(candidates)
+        self._postings = None
+
+    def _build_postings(self) -> dict:
+        postings = defaultdict(list)
+        for idx, rid in enumerate(self._rids):
+            for gram in _ngrams(rid):
+                postings[gram].append(idx)
+        limit = len(self._rids) // 2
+        return {gram: ids for gram, ids in postings.items() if len(ids) <= limit}
+
+    def _shortlist(self, rid: str, taken) -> list[int]:
+        if self._postings is None:
+            self._postings = self._build_postings()
+        shared = Counter()
+        for gram in _ngrams(rid):
+            ids = self._postings.get(gram)
+            if ids:
+                shared.update(ids)
+        items = shared.items()
+        if taken:
+            items = [(idx, count) for idx, count in items if idx not in taken]
+        # Most-shared first, so a strong match is found early and bounds prune the rest
+        return [idx for idx, _count in heapq.nlargest(FUZZY_SHORTLIST, items, key=lambda x: x[1])]
+
+    def best_index(self, rid: str, taken=()) -> tuple:
+        """
+        Return (index, ratio) of the candidate most similar to `rid`, skipping
+        indexes in `taken`, or (None, FUZZY_THRESHOLD) if none exceeds it.
+        """
+        if len(self._rids) <= FUZZY_SCAN_LIMIT:
+            order = [idx for idx in range(len(self._rids)) if idx not in taken]
+        else:
+            order = self._shortlist(rid, taken)
+
+        best_ratio = FUZZY_THRESHOLD
+        best_idx = None
+        rid_len = len(rid)
+        rid_chars = None
+        for idx in order:
+            cand_rid = self._rids[idx]
+            total = rid_len + len(cand_rid)
+            if not total:
+                return idx, 1.0  # Two empty IDs are identical
+            # Candidates may arrive out of order; on equal ratios the earliest index wins
+            later = best_idx is not None and idx > best_idx
+            bound = 2.0 * min(rid_len, len(cand_rid)) / total
+            if bound < best_ratio or (bound == best_ratio and (later or best_idx is None)):
+                continue
+
+            if rid_chars is None:
+                rid_chars = Counter(rid)
+            cand_chars = self._chars[idx]
+            if cand_chars is None:
+                cand_chars = self._chars[idx] = Counter(cand_rid)
+            bound = 2.0 * sum((rid_chars & cand_chars).values()) / total
+            if bound < best_ratio or (bound == best_ratio and (later or best_idx is None)):
+                continue
+
+            # seq2 (the candidate) carries difflib's cached index; reuse it across rows
+            matcher = self._matchers[idx]
+            if matcher is None:
+                matcher = self._matchers[idx] = difflib.SequenceMatcher(None, "", cand_rid)
+            matcher.set_seq1(rid)
+            ratio = matcher.ratio()
+            if ratio > best_ratio or (ratio == best_ratio and best_idx is not None and not later):
+                best_ratio = ratio
+                best_idx = idx
+
+        return best_idx, best_ratio
+
+    def best_match(self, rid: str):
+        """Return the candidate whose resource ID is most similar to `rid`, or None."""
+        idx, _ratio = self.best_index(rid)
+        return None if idx is None else self.candidates[idx]
+
+    def assign(self, rids: dict, taken: set) -> Iterator[tuple]:
+        """
+        Greedy best-first one-to-one assignment of new resource IDs to candidates.
+
+        `rids` maps a caller key (e.g. the new row's position) to its resource
+        ID. The globally most similar pair is assigned first; rows whose best
+        candidate was taken meanwhile are re-scored against what is left.
+        Yields (key, candidate index) and adds assigned indexes to `taken`.
+        """
+        heap = []
+        for key, rid in rids.items():
+            idx, ratio = self.best_index(rid, taken)
+            if idx is not None:
+                heap.append((-ratio, key, idx))
+        heapq.heapify(heap)
+
+        while heap:
+            _neg_ratio, key, idx = heapq.heappop(heap)
+            if idx in taken:
+                idx, ratio = self.best_index(rids[key], taken)
+                if idx is not None:
+                    heapq.heappush(heap, (-ratio, key, idx))
+                continue
+            taken.add(idx)
+            yield key, idx
+
+
+def diff_scans(new_rows: list[dict], old_rows: list[dict]) -> tuple[list[dict], list[dict]]:
+    """
+    Compare scans with one-to-one matching and mark delta status.
+
+    Every old finding is consumed by at most one new finding. Strategies run
+    as phases over all rows so a weak match never steals a stronger one:
+    strict (resource UID), then resource name, then within each
+    acct|region|check bucket a singleton match or a greedy best-first fuzzy
+    assignment. Returns (annotated new rows, old rows left unmatched - i.e.
+    resources that disappeared since the old scan).
+    """
+    if not old_rows:
+        return [annotate_delta(r, "unchanged") for r in new_rows], []
+
+    matched = [None] * len(new_rows)   # new position -> old row index
+    consumed = bytearray(len(old_rows))
+
+    # 1. Strict (Primary) - Matches on Resource UID / ARN
+    old_map_strict = defaultdict(deque)
+    for i, r in enumerate(old_rows):
+        old_map_strict[create_key(r)].append(i)
+    for pos, row in enumerate(new_rows):
+        queue = old_map_strict.get(create_key(row))
+        if queue:
+            matched[pos] = queue.popleft()
+            consumed[matched[pos]] = 1
+
+    # 2. Name (Secondary) - Matches on Resource Name
     # Useful when ARN changes (e.g. AWS account move, recreation) but logical name stays same
-    old_map_name = {}
-    for r in old_rows:
-        if r.get("resourceName"):
-            # Key: acct|region|check|resourceName
-            k = f"{r['acctId']}|{r['region']}|{r['checkId']}|{r['resourceName']}"
-            old_map_name[k] = r
-
-    # 3. Fallback Map (Tertiary) - Matches on Check Context (Singleton)
-    # Key: "acctId|region|checkId" -> List of rows
+    old_map_name = defaultdict(deque)
+    for i, r in enumerate(old_rows):
+        if not consumed[i] and r.get("resourceName"):
+            old_map_name[f"{r['acctId']}|{r['region']}|{r['checkId']}|{r['resourceName']}"].append(i)
+    if old_map_name:
+        for pos, row in enumerate(new_rows):
+            if matched[pos] is None and row.get("resourceName"):
+                queue = old_map_name.get(f"{row['acctId']}|{row['region']}|{row['checkId']}|{row['resourceName']}")
+                if queue:
+                    matched[pos] = queue.popleft()
+                    consumed[matched[pos]] = 1
+
+    # 3. Context (Tertiary) - Singleton or fuzzy within acct|region|check
     fallback_map = defaultdict(list)
-    for r in old_rows:
-        short_key = f"{r['acctId']}|{r['region']}|{r['checkId']}"
-        fallback_map[short_key].append(r)
+    for i, r in enumerate(old_rows):
+        fallback_map[f"{r['acctId']}|{r['region']}|{r['checkId']}"].append(i)
+    pending = defaultdict(dict)
+    for pos, row in enumerate(new_rows):
+        if matched[pos] is None:
+            pending[f"{row['acctId']}|{row['region']}|{row['checkId']}"][pos] = row.get("resourceId", "")
+
+    for short_key, rids in pending.items():
+        bucket = fallback_map.get(short_key)
+        if not bucket:
+            continue
+        if len(bucket) == 1:
+            # Singleton bucket - its only old finding is the intended target, if still free
+            if not consumed[bucket[0]]:
+                pos = next(iter(rids))
+                matched[pos] = bucket[0]
+                consumed[bucket[0]] = 1
+            continue
+        taken = {j for j, i in enumerate(bucket) if consumed[i]}
+        if len(taken) == len(bucket):
+            continue
+        matcher = FuzzyMatcher([old_rows[i] for i in bucket])
+        for pos, j in matcher.assign(rids, taken):
+            matched[pos] = bucket[j]
+            consumed[bucket[j]] = 1
 
     results = []
-    
-    for row in new_rows:
-        full_key = create_key(row)
-        
-        # Strategy A: Strict Match (UID)
-        old = old_map_strict.get(full_key)
-        
-        # Strategy B: Name Match
-        if not old and row.get("resourceName"):
-            name_key = f"{row['acctId']}|{row['region']}|{row['checkId']}|{row['resourceName']}"
-            old = old_map_name.get(name_key)
-            
-        # Strategy C: Context Match (Singleton)
-        if not old:
-            short_key = f"{row['acctId']}|{row['region']}|{row['checkId']}"
-            candidates = fallback_map.get(short_key, [])
-        # Strategy C: Context Match (Singleton or Fuzzy)
-        if not old:
-            short_key = f"{row['acctId']}|{row['region']}|{row['checkId']}"
-            candidates = fallback_map.get(short_key, [])
-            
-            if len(candidates) == 1:
-                # Singleton match - assume it's the intended target
-                old = candidates[0]
-            elif len(candidates) > 1:
-                # Multiple candidates? Try fuzzy matching on Resource ID
-                # This handles cases where we have 5 buckets, and 1 changed name slightly
-                best_ratio = 0
-                best_cand = None
-                curr_rid = row.get("resourceId", "")
-                
-                for cand in candidates:
-                    cand_rid = cand.get("resourceId", "")
-                    # Calculate similarity ratio
-                    ratio = difflib.SequenceMatcher(None, curr_rid, cand_rid).ratio()
-                    if ratio > best_ratio:
-                        best_ratio = ratio
-                        best_cand = cand
-                
-                # If similarity is high enough (>0.7), accept it
-                if best_ratio > 0.7:
-                    old = best_cand
-
+    for row, old_idx in zip(new_rows, matched):
         delta = "unchanged"
         old_status = None
         old_severity = None
 
-        if old:
+        if old_idx is not None:
+            old = old_rows[old_idx]
             old_status = old.get("status")
             old_severity = old.get("severity")
             if old_status == "FAIL" and row.get("status") == "PASS":
@@ -669,39 +1455,15 @@ def calculate_delta(new_rows: list[dict], old_rows: list[dict]) -> list[dict]:
         elif row.get("status") == "FAIL":
             delta = "new-fail"
 
-        results.append(dict(row, delta=delta, oldStatus=old_status, oldSeverity=old_severity))
+        results.append(annotate_delta(row, delta, old_status, old_severity))
 
-    return results
+    removed = [old_rows[i] for i in range(len(old_rows)) if not consumed[i]]
+    return results, removed
 
 
-def compute_stats(data: list[dict], old_data: list[dict]) -> dict:
-    """Compute aggregate statistics including severity breakdown."""
-    stats = {
-        "total": len(data),
-        "fail": sum(1 for r in data if r.get("status") == "FAIL"),
-        "pass": sum(1 for r in data if r.get("status") == "PASS"),
-        "manual": sum(1 for r in data if r.get("status") == "MANUAL"),
-        "fixed": sum(1 for r in data if r.get("delta") == "fixed"),
-        "newFail": sum(1 for r in data if r.get("delta") == "new-fail"),
-        # Severity breakdown (for failures only)
-        "critical": sum(1 for r in data if r.get("status") == "FAIL" and r.get("severity") == "critical"),
-        "high": sum(1 for r in data if r.get("status") == "FAIL" and r.get("severity") == "high"),
-        "medium": sum(1 for r in data if r.get("status") == "FAIL" and r.get("severity") == "medium"),
-        "low": sum(1 for r in data if r.get("status") == "FAIL" and r.get("severity") == "low"),
-    }
-
-    if old_data:
-        old_fail = sum(1 for r in old_data if r.get("status") == "FAIL")
-        old_pass = sum(1 for r in old_data if r.get("status") == "PASS")
-        stats["failDelta"] = stats["fail"] - old_fail
-        stats["passDelta"] = stats["pass"] - old_pass
-        stats["hasComparison"] = True
-    else:
-        stats["failDelta"] = 0
-        stats["passDelta"] = 0
-        stats["hasComparison"] = False
-
-    return stats
+def calculate_delta(new_rows: list[dict], old_rows: list[dict]) -> list[dict]:
+    """Compare scans and mark delta status with robust one-to-one matching."""
+    return diff_scans(new_rows, old_rows)[0]
 
 
 def get_accounts(data: list[dict]) -> dict:
@@ -729,99 +1491,166 @@ def get_accounts(data: list[dict]) -> dict:
     return accounts
 
 
-def compute_by_account(data: list[dict], accounts: dict) -> dict:
-    """Stats grouped by account for charts (uses display names)."""
-    by_acct = defaultdict(lambda: {"fail": 0, "pass": 0, "total": 0})
-    for r in data:
-        acct_id = r.get("acctId", "unknown")
-        # Use short name for chart labels
+# =============================================================================
+# PARTIAL AGGREGATES - map-reduce summaries emitted by workers
+# =============================================================================
+# A summary is a Counter of finding counts keyed by SUMMARY_KEY_FIELDS. Workers
+# summarize their own file, the parent only merges these (small) Counters, and
+# every dashboard statistic is derived from the merged summary.
+
+SUMMARY_KEY_FIELDS = ("acctId", "region", "service", "severity", "status", "delta")
+SEVERITY_LEVELS = ["critical", "high", "medium", "low"]
+
+
+def _summary_key(r) -> tuple:
+    return (r.get("acctId", "unknown"), r.get("region", ""), r.get("service", ""),
+            r.get("severity", ""), r.get("status", ""), r.get("delta", "unchanged"))
+
+
+def summarize_rows(rows) -> Counter:
+    """Map step: count rows by (acctId, region, service, severity, status, delta)."""
+    return Counter(map(_summary_key, rows))
+
+
+def merge_summaries(summaries) -> Counter:
+    """Reduce step: add partial summaries together (key order is first appearance)."""
+    merged = Counter()
+    for summary in summaries:
+        merged.update(summary)
+    return merged
+
+
+def _empty_stats() -> dict:
+    return {"total": 0, "fail": 0, "pass": 0, "manual": 0, "fixed": 0, "newFail": 0,
+            "critical": 0, "high": 0, "medium": 0, "low": 0}
+
+
+def aggregate_summary(summary: Counter, accounts: dict, old_summary: Counter = None) -> dict:
+    """
+    Single fused pass over a summary filling every dashboard counter at once:
+    global stats, per-account tab stats, per-account chart bars, per-service
+    and per-severity breakdowns, plus the region/service filter lists.
+    """
+    stats = _empty_stats()
+    per_acct = {}
+    by_acct = {}
+    by_svc = {}
+    by_sev = {s: 0 for s in SEVERITY_LEVELS}
+    regions = set()
+    services = set()
+
+    for (acct_id, region, svc, severity, status, delta), n in summary.items():
+        acct = per_acct.get(acct_id)
+        if acct is None:
+            acct = per_acct[acct_id] = _empty_stats()
         key = accounts.get(acct_id, {}).get("short", acct_id)
-        by_acct[key]["total"] += 1
-        if r.get("status") == "FAIL":
-            by_acct[key]["fail"] += 1
-        elif r.get("status") == "PASS":
-            by_acct[key]["pass"] += 1
-    return dict(by_acct)
+        bar = by_acct.get(key)
+        if bar is None:
+            bar = by_acct[key] = {"fail": 0, "pass": 0, "total": 0}
+        if region:
+            regions.add(region)
+        if svc:
+            services.add(svc)
+
+        stats["total"] += n
+        acct["total"] += n
+        bar["total"] += n
+        if status == "FAIL":
+            stats["fail"] += n
+            acct["fail"] += n
+            bar["fail"] += n
+            # Service bars only count FAIL and PASS; MANUAL-only services get none
+            by_svc.setdefault(svc or "Unknown", {"fail": 0, "pass": 0})["fail"] += n
+            if severity in by_sev:
+                stats[severity] += n
+                acct[severity] += n
+            sev = (severity or "").lower()
+            if sev in by_sev:
+                by_sev[sev] += n
+        elif status == "PASS":
+            stats["pass"] += n
+            acct["pass"] += n
+            bar["pass"] += n
+            by_svc.setdefault(svc or "Unknown", {"fail": 0, "pass": 0})["pass"] += n
+        elif status == "MANUAL":
+            stats["manual"] += n
+            acct["manual"] += n
+        if delta == "fixed":
+            stats["fixed"] += n
+            acct["fixed"] += n
+        elif delta == "new-fail":
+            stats["newFail"] += n
+            acct["newFail"] += n
+
+    if old_summary:
+        old_fail = old_pass = 0
+        for (_acct, _region, _svc, _sev, status, _delta), n in old_summary.items():
+            if status == "FAIL":
+                old_fail += n
+            elif status == "PASS":
+                old_pass += n
+        stats["failDelta"] = stats["fail"] - old_fail
+        stats["passDelta"] = stats["pass"] - old_pass
+        stats["hasComparison"] = True
+    else:
+        stats["failDelta"] = 0
+        stats["passDelta"] = 0
+        stats["hasComparison"] = False
 
+    top_svcs = sorted(by_svc.items(), key=lambda x: x[1]["fail"], reverse=True)[:6]
+    return {
+        "stats": stats,
+        "account_stats": {acct_id: per_acct[acct_id] for acct_id in accounts if acct_id in per_acct},
+        "by_account": by_acct,
+        "by_service": [{"name": n, **v} for n, v in top_svcs],
+        "by_severity": [{"name": s, "count": by_sev[s]} for s in SEVERITY_LEVELS],
+        "regions": sorted(regions),
+        "services": sorted(services),
+    }
 
-def compute_account_stats(data: list[dict], accounts: dict) -> dict:
-    """Compute full stats for each account (for tabs)."""
-    account_stats = {}
 
-    for acct_id in accounts.keys():
-        acct_data = [r for r in data if r.get("acctId") == acct_id]
-        if not acct_data:
-            continue
+def aggregate_findings(data: list[dict], accounts: dict = None, old_data: list[dict] = None) -> dict:
+    """Aggregate findings in one pass over `data` (and one over `old_data`)."""
+    if accounts is None:
+        accounts = get_accounts(data)
+    old_summary = summarize_rows(old_data) if old_data else None
+    return aggregate_summary(summarize_rows(data), accounts, old_summary)
 
-        account_stats[acct_id] = {
-            "total": len(acct_data),
-            "fail": sum(1 for r in acct_data if r.get("status") == "FAIL"),
-            "pass": sum(1 for r in acct_data if r.get("status") == "PASS"),
-            "manual": sum(1 for r in acct_data if r.get("status") == "MANUAL"),
-            "fixed": sum(1 for r in acct_data if r.get("delta") == "fixed"),
-            "newFail": sum(1 for r in acct_data if r.get("delta") == "new-fail"),
-            "critical": sum(1 for r in acct_data if r.get("status") == "FAIL" and r.get("severity") == "critical"),
-            "high": sum(1 for r in acct_data if r.get("status") == "FAIL" and r.get("severity") == "high"),
-            "medium": sum(1 for r in acct_data if r.get("status") == "FAIL" and r.get("severity") == "medium"),
-            "low": sum(1 for r in acct_data if r.get("status") == "FAIL" and r.get("severity") == "low"),
-        }
 
-    return account_stats
+def compute_stats(data: list[dict], old_data: list[dict]) -> dict:
+    """Compute aggregate statistics including severity breakdown."""
+    return aggregate_findings(data, {}, old_data)["stats"]
+
+
+def compute_by_account(data: list[dict], accounts: dict) -> dict:
+    """Stats grouped by account for charts (uses display names)."""
+    return aggregate_findings(data, accounts)["by_account"]
+
+
+def compute_account_stats(data: list[dict], accounts: dict) -> dict:
+    """Compute full stats for each account (for tabs)."""
+    return aggregate_findings(data, accounts)["account_stats"]
 
 
 def compute_by_service(data: list[dict]) -> list[dict]:
     """Stats grouped by service, top 6."""
-    by_svc = defaultdict(lambda: {"fail": 0, "pass": 0})
-    for r in data:
-        svc = r.get("service") or "Unknown"
-        if r.get("status") == "FAIL":
-            by_svc[svc]["fail"] += 1
-        elif r.get("status") == "PASS":
-            by_svc[svc]["pass"] += 1
-
-    sorted_svcs = sorted(by_svc.items(), key=lambda x: x[1]["fail"], reverse=True)[:6]
-    return [{"name": n, **v} for n, v in sorted_svcs]
+    return aggregate_findings(data, {})["by_service"]
 
 
 def compute_by_severity(data: list[dict]) -> list[dict]:
     """Stats grouped by severity (failures only)."""
-    severity_order = ["critical", "high", "medium", "low"]
-    by_sev = {s: 0 for s in severity_order}
-
-    for r in data:
-        if r.get("status") == "FAIL":
-            sev = r.get("severity", "").lower()
-            if sev in by_sev:
-                by_sev[sev] += 1
+    return aggregate_findings(data, {})["by_severity"]
 
-    return [{"name": s, "count": by_sev[s]} for s in severity_order]
 
+def extract_finding(row) -> Finding:
+    """Return the display record for a row.
 
-def extract_finding(row: dict) -> dict:
-    """Extract fields needed for display."""
-    return {
-        "id": row.get("checkId", ""),
-        "title": row.get("checkTitle", ""),
-        "status": row.get("status", ""),
-        "severity": row.get("severity", ""),
-        "delta": row.get("delta", "unchanged"),
-        "oldStatus": row.get("oldStatus"),
-        "oldSeverity": row.get("oldSeverity"),
-        "acctId": row.get("acctId", ""),
-        "region": row.get("region", ""),
-        "service": row.get("service", ""),
-        "resource": row.get("resourceId", ""),
-        "resourceName": row.get("resourceName", ""),
-        "statusExt": row.get("statusExt", ""),
-        "risk": row.get("risk", ""),
-        "remediation": row.get("remediation", ""),
-        "remediationUrl": row.get("remediationUrl", ""),
-        # CIS-specific (from compliance format)
-        "profile": row.get("profile", ""),
-        "section": row.get("section", ""),
-        "rationale": row.get("rationale", ""),
-        "mitre": row.get("mitre", []),
-    }
+    Findings already carry everything the dashboard needs and are returned
+    as-is; plain dicts are converted.
+    """
+    if isinstance(row, Finding):
+        return row
+    return Finding.from_dict(row)
 
 
 def sort_findings(findings: list[dict]) -> list[dict]:
@@ -835,28 +1664,134 @@ def sort_findings(findings: list[dict]) -> list[dict]:
     ))
 
 
+# List items (findings) encoded and escaped per piece when streaming DATA
+JSON_CHUNK_ROWS = 1000
+# gzip level for --compress dashboards (DATA decompressed by the browser)
+HTML_GZIP_LEVEL = 6
+
+
+def _json_default(obj, dictionaries: dict = None):
+    """Serialize Finding records, columns and SymbolTables embedded in dashboard data."""
+    if isinstance(obj, Finding):
+        return obj.to_display(dictionaries)
+    if isinstance(obj, FindingColumn):
+        return obj[:]
+    if isinstance(obj, SymbolTable):
+        return obj.values
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _escape_json(json_str: str) -> str:
+    """Escape <, > and / in encoded JSON so it cannot close the script tag."""
+    # replace / with \/ to prevent </script> attacks
+    # replace < with \u003c
+    # replace > with \u003e
+    return json_str.replace("/", "\\/").replace("<", "\\u003c").replace(">", "\\u003e")
+
+
+def iter_safe_json(data, chunk_rows: int = JSON_CHUNK_ROWS) -> Iterator[str]:
+    """Yield `safe_json_dumps(data)` in escaped pieces.
+
+    Dicts are walked key by key and lists (or `FindingColumn`s) encoded in
+    chunks of `chunk_rows` items, so the largest string alive is one chunk
+    rather than the whole document. Each chunk is a single C-encoder call,
+    escaped while it is still small enough to be cache-resident.
+    """
+    dictionaries = data.get("dictionaries") if isinstance(data, dict) else None
+    dumps = partial(json.dumps, separators=(",", ":"), default=partial(_json_default, dictionaries=dictionaries))
+    return _iter_json(data, dumps, chunk_rows)
+
+
+def _iter_json(value, dumps, chunk_rows: int) -> Iterator[str]:
+    if isinstance(value, dict):
+        separator = "{"
+        for key, item in value.items():
+            yield _escape_json(f"{separator}{dumps(key)}:")
+            separator = ","
+            yield from _iter_json(item, dumps, chunk_rows)
+        yield "}" if separator == "," else "{}"
+    elif isinstance(value, (list, FindingColumn)):
+        yield "["
+        for start in range(0, len(value), chunk_rows):
+            chunk = dumps(value[start:start + chunk_rows])[1:-1]  # Without the brackets
+            yield _escape_json("," + chunk if start else chunk)
+        yield "]"
+    else:
+        yield _escape_json(dumps(value))
+
+
 def safe_json_dumps(data: dict) -> str:
     """Dump JSON with escaping to prevent XSS when embedded in HTML.
     
     Escapes <, >, and / characters to prevent breaking out of script tags
     or executing arbitrary HTML.
+
+    If `data` has a "dictionaries" entry (column -> SymbolTable), findings
+    are dictionary-encoded into it. Keys are serialized in insertion order,
+    so "dictionaries" must come after "findings" to be emitted complete.
     """
-    # Standard JSON dump
-    json_str = json.dumps(data, separators=(",", ":"))
-    
-    # Replace unsafe characters
-    # replace / with \/ to prevent </script> attacks
-    # replace < with \u003c
-    # replace > with \u003e
-    return json_str.replace("/", "\\/").replace("<", "\\u003c").replace(">", "\\u003e")
+    return "".join(iter_safe_json(data))
+
+
+def iter_gzip_base64(pieces, level: int = HTML_GZIP_LEVEL) -> Iterator[str]:
+    """Gzip a stream of strings and yield it base64-encoded, piece by piece."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    pending = b""
+    for piece in pieces:
+        pending += compressor.compress(piece.encode("utf-8"))
+        cut = len(pending) - len(pending) % 3  # Whole base64 quanta only, no padding mid-stream
+        if cut:
+            yield base64.b64encode(pending[:cut]).decode("ascii")
+            pending = pending[cut:]
+    yield base64.b64encode(pending + compressor.flush()).decode("ascii")
+
+
+def iter_html(data: dict, framework: str, compress: bool = False, blocks: dict = None) -> Iterator[str]:
+    """Yield the dashboard HTML: template head, streamed DATA, template tail.
+
+    With `compress`, DATA is embedded as base64 gzip (`DATA_GZIP`) and
+    decompressed by the template with the browser's DecompressionStream.
+
+    `blocks` (element id -> list) are written after the main script as
+    `application/json` elements, which the browser keeps as unparsed text:
+    the template parses each one the first time it needs it. They are
+    emitted after DATA, so they may be filled while it is serialized.
+    """
+    head, rest = get_template(framework).split("/*__DATA__*/", 1)
+    middle, tail = rest.split("<!--__BLOCKS__-->", 1)
+    yield head
+    if compress:
+        yield 'let DATA; const DATA_GZIP = "'
+        yield from iter_gzip_base64(iter_safe_json(data))
+        yield '";'
+    else:
+        yield "const DATA = "
+        # iter_safe_json escapes each piece to prevent XSS
+        yield from iter_safe_json(data)
+        yield ";"
+    yield middle
+    for element_id, values in (blocks or {}).items():
+        yield f'<script type="application/json" id="{element_id}">'
+        if compress:
+            # A JSON string: the template gunzips it like DATA_GZIP
+            yield '"'
+            yield from iter_gzip_base64(iter_safe_json(values))
+            yield '"'
+        else:
+            yield from iter_safe_json(values)
+        yield "</script>"
+    yield tail
 
 
-def generate_html(data: dict, framework: str) -> str:
+def generate_html(data: dict, framework: str, compress: bool = False, blocks: dict = None) -> str:
     """Generate complete HTML with embedded data."""
-    template = get_template(framework)
-    # Use safe_json_dumps to prevent XSS
-    json_data = safe_json_dumps(data)
-    return template.replace("/*__DATA__*/", f"const DATA = {json_data};")
+    return "".join(iter_html(data, framework, compress, blocks))
+
+
+def write_html(data: dict, framework: str, path, compress: bool = False, blocks: dict = None) -> None:
+    """Stream the dashboard HTML to `path` without building it in memory."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(iter_html(data, framework, compress, blocks))
 
 
 def get_template(framework: str) -> str:
@@ -897,9 +1832,22 @@ OPTIONS
   --output, -o <path>     Output directory (default: ./output)
   --framework, -f <name>  Force specific framework (auto-detected if omitted)
   --max-workers <num>     Limit number of parallel workers (default: auto)
-  --max-workers <num>     Limit number of parallel workers (default: auto)
+  --keep-columns <cols>   Comma-separated raw CSV columns to show in the detail panel
+  --no-details            Skip the risk/remediation/rationale text columns (faster
+                          parsing, smaller dashboards without detail text)
+  --compress              Embed dashboard data gzip-compressed (5-10x smaller files,
+                          decompressed by the browser when the dashboard opens)
+  --cache-dir <path>      Parse cache location (default: ~/.cache/prowldash)
+  --no-cache              Always re-parse input files; don't read or write the cache
+  --export <dir>          Also write each input's normalized findings to <dir> as a
+                          columnar scan file (.parquet with pyarrow, else .pdscan);
+                          scan files are accepted as inputs in place of the CSVs
   --no-timestamp          Don't create timestamped subfolder
+  --incremental           Rebuild only dashboards whose inputs changed since the
+                          last --incremental run into the same output directory
   --verbose               Show detailed execution statistics
+  --calibrate             Benchmark the CSV parsers on this machine and store the
+                          file sizes at which each one is used
   --list-frameworks       List all supported frameworks
 
 EXAMPLES
@@ -975,11 +1923,789 @@ def show_version():
     print("Python 3.7+ required | PyPy compatible for extra speed")
 
 
-def process_single_file(args: tuple) -> dict | None:
-    """Process a single CSV file. Designed for parallel execution.
+# =============================================================================
+# COLUMNAR BATCHES - compact worker -> parent transport for findings
+# =============================================================================
+# Layout: magic, uint32 header length, JSON header, then per column a JSON
+# list of distinct values followed by an array of codes into that list.
+
+BATCH_MAGIC = b"PDB1"
+
+
+def _pack_batch(count: int, columns: list) -> bytes:
+    """Lay out (field, distinct values, codes) columns, in FINDING_FIELDS order, as a batch.
+
+    `codes` index into the distinct values and may be a list, an array or a
+    NumPy array. The 'extra' column passes its row values with codes None
+    (dicts are unhashable; stored verbatim).
+    """
+    header_columns = []
+    blobs = []
+    for field, distinct, codes in columns:
+        values = json.dumps(list(distinct), separators=(",", ":")).encode("utf-8")
+        if codes is None or len(distinct) <= 1:
+            typecode, code_bytes = "", b""  # 'extra' or a constant column
+        else:
+            typecode = "B" if len(distinct) <= 0x100 else "H" if len(distinct) <= 0x10000 else "I"
+            if hasattr(codes, "astype"):
+                code_bytes = codes.astype(typecode).tobytes()  # NumPy shares the C typecodes
+            else:
+                code_bytes = array(typecode, codes).tobytes()
+        blobs.append(values)
+        blobs.append(code_bytes)
+        header_columns.append([field, typecode, len(values), len(code_bytes)])
+
+    header = json.dumps({"rows": count, "columns": header_columns}).encode("utf-8")
+    return b"".join([BATCH_MAGIC, struct.pack("<I", len(header)), header] + blobs)
+
+
+def encode_batch(findings: list[Finding]) -> bytes:
+    """Encode findings column by column with per-column dictionary encoding."""
+    columns = []
+    for field in FINDING_FIELDS:
+        values = [getattr(f, field) for f in findings]
+        if field == "extra":
+            columns.append((field, values, None))
+            continue
+        codes = {}
+        encoded = [codes.setdefault(v, len(codes)) for v in values]
+        columns.append((field, list(codes), encoded))
+    return _pack_batch(len(findings), columns)
+
+
+def encode_findings(findings) -> tuple[bytes, Counter, int]:
+    """`encode_batch` and `summarize_rows` of an iterable in one streaming pass.
+
+    Each finding is coded and counted as it arrives and then dropped, so
+    memory grows by a few bytes of codes per row rather than a Finding.
+    Returns (batch, summary, row count).
+    """
+    coded = {field: ({}, array("I")) for field in FINDING_FIELDS if field != "extra"}
+    extras = []
+    summary = Counter()
+    for finding in findings:
+        for field, (codes, column) in coded.items():
+            column.append(codes.setdefault(getattr(finding, field), len(codes)))
+        extras.append(finding.extra)
+        summary[_summary_key(finding)] += 1
+    columns = [(field, extras, None) if field == "extra" else (field, list(coded[field][0]), coded[field][1])
+               for field in FINDING_FIELDS]
+    return _pack_batch(len(extras), columns), summary, len(extras)
+
+
+def _read_batch(buf) -> tuple[int, list]:
+    """Split a batch into its row count and (field, typecode, distinct values, code bytes) columns."""
+    if bytes(buf[:4]) != BATCH_MAGIC:
+        raise ValueError("Not a ProwlDash findings batch")
+    (header_len,) = struct.unpack("<I", buf[4:8])
+    pos = 8 + header_len
+    header = json.loads(bytes(buf[8:pos]))
+
+    columns = []
+    for field, typecode, distinct_len, codes_len in header["columns"]:
+        distinct = json.loads(bytes(buf[pos:pos + distinct_len]))
+        pos += distinct_len
+        if field == "mitre":
+            distinct = [tuple(m) for m in distinct]
+        columns.append((field, typecode, distinct, buf[pos:pos + codes_len]))
+        pos += codes_len
+    return header["rows"], columns
+
+
+def decode_batch(buf) -> list[Finding]:
+    """Decode a batch produced by `encode_batch` (bytes or memoryview)."""
+    count, batch_columns = _read_batch(buf)
+    columns = []
+    for field, typecode, distinct, code_bytes in batch_columns:
+        if field == "extra":
+            columns.append(distinct)
+        elif not typecode:
+            columns.append([distinct[0] if distinct else None] * count)
+        else:
+            codes = array(typecode)
+            codes.frombytes(code_bytes)
+            columns.append(list(map(distinct.__getitem__, codes)))
+    return list(map(Finding, *columns))
+
+
+def concat_batches(payloads: list) -> bytes:
+    """Join encoded batches end to end without decoding their rows.
+
+    Per-column dictionaries are merged in first-seen order and the codes
+    remapped, so the result is the batch `encode_batch` would have produced
+    for all the rows at once.
+    """
+    batches = [_read_batch(p) for p in payloads]
+    columns = []
+    for i, field in enumerate(FINDING_FIELDS):
+        if field == "extra":
+            columns.append((field, [v for _, batch_columns in batches for v in batch_columns[i][2]], None))
+            continue
+        codes = {}
+        encoded = array("I")
+        for rows, batch_columns in batches:
+            _, typecode, distinct, code_bytes = batch_columns[i]
+            remap = [codes.setdefault(v, len(codes)) for v in distinct]
+            if typecode:
+                part = array(typecode)
+                part.frombytes(code_bytes)
+                # Codes already line up while the merged dictionary only grows at its end
+                identity = remap[-1] == len(remap) - 1 and remap == list(range(len(remap)))
+                encoded.extend(iter(part) if identity else map(remap.__getitem__, part))
+            else:
+                encoded.extend(remap[:1] * rows)  # constant (or empty) column
+        columns.append((field, list(codes), encoded))
+    return _pack_batch(sum(rows for rows, _ in batches), columns)
+
+
+def _shm_has_room(size: int) -> bool:
+    """Check /dev/shm can take `size` bytes; writing past a full tmpfs kills the worker with SIGBUS."""
+    try:
+        st = os.statvfs("/dev/shm")
+    except OSError:
+        return True  # No tmpfs mount (e.g. macOS); segments are not size-limited the same way
+    return st.f_bavail * st.f_frsize > 2 * size
+
+
+def share_batch(findings: list[Finding], payload=None) -> dict | None:
+    """Write findings into a shared-memory segment and return a small picklable handle.
+
+    `payload` may be an already encoded batch (e.g. read from the parse cache),
+    in which case `findings` is not used. Returns None if shared memory is
+    unavailable or too small, in which case the caller should send the rows
+    the normal (pickled) way.
+    """
+    if not USE_SHARED_MEMORY:
+        return None
+    if payload is None:
+        payload = encode_batch(findings)
+    if not _shm_has_room(len(payload)):
+        return None
+    try:
+        shm = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+    except OSError:
+        return None
+    shm.buf[:len(payload)] = payload
+    handle = {"shm": shm.name, "size": len(payload)}
+    # The parent unlinks the segment once it has read it
+    shm.close()
+    return handle
+
+
+def load_batch(handle: dict) -> list[Finding]:
+    """Read findings back from a `share_batch` handle and free the segment."""
+    shm = shared_memory.SharedMemory(name=handle["shm"])
+    try:
+        with shm.buf[:handle["size"]] as view:
+            return decode_batch(view)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def load_payload(handle: dict) -> bytes:
+    """Copy the encoded batch out of a `share_batch` handle and free the segment."""
+    shm = shared_memory.SharedMemory(name=handle["shm"])
+    try:
+        return bytes(shm.buf[:handle["size"]])
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def process_file_shared(args: tuple) -> dict | None:
+    """Pool entry point: process a file and return its rows through shared memory.
+
+    Only the segment name travels back through the executor's pipe; rows fall
+    back to regular pickling when shared memory cannot be used.
+    """
+    return share_result(process_single_file(args, decode=False))
+
+
+def share_result(result: dict | None) -> dict | None:
+    """Move a `process_single_file(decode=False)` result's rows into shared memory."""
+    if result and 'error' not in result:
+        payload = result.pop('payload', None)
+        handle = share_batch(result.get('rows'), payload)
+        if handle is not None:
+            result.pop('rows', None)
+            result['batch'] = handle
+        elif 'rows' not in result:
+            result['rows'] = decode_batch(payload)
+    return result
+
+
+def collect_rows(result: dict) -> list[Finding]:
+    """Return the rows of a worker result, loading them from shared memory if needed."""
+    if 'batch' in result:
+        result['rows'] = load_batch(result.pop('batch'))
+    return result['rows']
+
+
+# =============================================================================
+# COLUMNAR PANDAS PATH - vectorized normalization for large files
+# =============================================================================
+# When Pandas parses a file, each chunk stays columnar from read_csv to the
+# encoded batch: raw columns are renamed to Finding fields instead of running
+# normalize_row per row, SEVERITY is lowered with one vectorized call, MITRE
+# IDs are extracted once per distinct compliance value, partial aggregates
+# come from a groupby and pd.factorize produces the batch's dictionary codes.
+# Finding records are only built when a dashboard is generated.
+
+PANDAS_CHUNK_ROWS = 50_000
+
+# Finding field -> raw column, per format (the rest are derived or constant)
+FRAME_FIELDS = {
+    "main": {
+        "acctId": "ACCOUNT_UID", "acctName": "ACCOUNT_NAME", "region": "REGION", "checkId": "CHECK_ID",
+        "checkTitle": "CHECK_TITLE", "status": "STATUS", "statusExt": "STATUS_EXTENDED", "severity": "SEVERITY",
+        "service": "SERVICE_NAME", "resourceId": "RESOURCE_UID", "resourceName": "RESOURCE_NAME", "risk": "RISK",
+        "remediation": "REMEDIATION_RECOMMENDATION_TEXT", "remediationUrl": "REMEDIATION_RECOMMENDATION_URL",
+        "compliance": "COMPLIANCE",
+    },
+    "compliance": {
+        "acctId": "ACCOUNTID", "region": "REGION", "checkId": "REQUIREMENTS_ID",
+        "checkTitle": "REQUIREMENTS_DESCRIPTION", "status": "STATUS", "statusExt": "STATUSEXTENDED",
+        "resourceId": "RESOURCEID", "resourceName": "RESOURCENAME",
+        "remediation": "REQUIREMENTS_ATTRIBUTES_REMEDIATIONPROCEDURE", "compliance": "FRAMEWORK",
+        "profile": "REQUIREMENTS_ATTRIBUTES_PROFILE", "section": "REQUIREMENTS_ATTRIBUTES_SECTION",
+        "rationale": "REQUIREMENTS_ATTRIBUTES_RATIONALESTATEMENT",
+    },
+}
+
+
+def _per_distinct(func, *columns):
+    """Apply `func` once per distinct combination of column values; one result per row."""
+    keys = columns[0] if len(columns) == 1 else pd.MultiIndex.from_arrays(columns)
+    codes, uniques = pd.factorize(keys)
+    results = np.empty(len(uniques), dtype=object)
+    for i, key in enumerate(uniques):
+        results[i] = func(*key) if len(columns) > 1 else func(key)  # Element-wise: results may be tuples
+    return results[codes]
+
+
+def _mitre_from(*values) -> tuple:
+    return tuple(dict.fromkeys(chain.from_iterable(extract_mitre_techniques(v) for v in values)))
+
+
+def normalize_frame(chunk, csv_format: str, keep_columns: list[str] = None) -> dict:
+    """Vectorized `normalize_row` over a DataFrame chunk.
+
+    Returns Finding field -> column (Series or array), or a scalar for fields
+    that are constant; fields left out keep the Finding default.
+    """
+    chunk = chunk.reset_index(drop=True)
+    chunk = chunk.astype(object).where(chunk.notna(), None)  # Missing fields are None, as with csv.DictReader
+
+    def column(name):
+        return chunk[name] if name in chunk.columns else ""
+
+    columns = {field: column(name) for field, name in FRAME_FIELDS[csv_format].items()}
+    if csv_format == "main":
+        severity = columns["severity"]
+        if not isinstance(severity, str):
+            columns["severity"] = severity.str.lower().where(severity.notna(), None)
+        compliance = chunk["COMPLIANCE"].fillna("") if "COMPLIANCE" in chunk.columns else None
+        columns["mitre"] = () if compliance is None else _per_distinct(
+            lambda value: tuple(extract_mitre_techniques(value)), compliance)
+    else:
+        columns["acctName"] = ""
+        columns["severity"] = ""  # Not available in compliance format
+        service = column("REQUIREMENTS_ATTRIBUTES_SERVICE")
+        section = column("REQUIREMENTS_ATTRIBUTES_SECTION")
+        if isinstance(service, str):
+            columns["service"] = section
+        else:
+            # `service or section`: empty and missing services fall back to the section
+            columns["service"] = service.where(service.fillna("").astype(bool), section)
+        sources = [column(name) for name in ("FRAMEWORK", "REQUIREMENTS_ATTRIBUTES_SECTION", "COMPLIANCE")]
+        sources = [s.fillna("") if not isinstance(s, str) else pd.Series(s, index=chunk.index) for s in sources]
+        columns["mitre"] = _per_distinct(_mitre_from, *sources)
+        columns["risk"] = ""
+        columns["remediationUrl"] = ""
+    if keep_columns:
+        kept = [column(name) for name in keep_columns]
+        kept = [[k] * len(chunk) if isinstance(k, str) else k.tolist() for k in kept]
+        columns["extra"] = [dict(zip(keep_columns, values)) for values in zip(*kept)]
+    return columns
+
+
+def encode_frame(columns: dict, count: int) -> bytes:
+    """`encode_batch` for `normalize_frame` output, coded with pd.factorize."""
+    defaults = Finding()
+    packed = []
+    for field in FINDING_FIELDS:
+        values = columns.get(field, getattr(defaults, field))
+        if field == "extra":
+            packed.append((field, [None] * count if values is None else values, None))
+        elif isinstance(values, (str, tuple)) or values is None:
+            packed.append((field, [values] if count else [], None))  # Constant column
+        else:
+            codes, uniques = pd.factorize(values, use_na_sentinel=False)
+            packed.append((field, [None if v is None or v != v else v for v in uniques], codes))
+    return _pack_batch(count, packed)
+
+
+def summarize_frame(columns: dict, count: int) -> Counter:
+    """`summarize_rows` as a groupby over `normalize_frame` output."""
+    if not count:
+        return Counter()
+    defaults = {"acctId": "unknown", "delta": "unchanged"}
+    keys = pd.DataFrame({
+        field: pd.Series(columns.get(field, None), index=range(count), dtype=object).fillna(defaults.get(field, ""))
+        for field in SUMMARY_KEY_FIELDS
+    })
+    sizes = keys.groupby(list(SUMMARY_KEY_FIELDS), sort=False).size()
+    return Counter({key: int(n) for key, n in sizes.items()})
+
+
+def parse_csv_frames(filepath: str, columns, keep_columns: list[str] = None, user_framework: str = None) -> dict:
+    """Parse and normalize a CSV with Pandas without building per-row dicts.
+
+    Returns the detected 'csv_format', 'framework' and 'scan_date' with the
+    encoded batch of all rows ('payload'), its 'summary' and 'row_count', or
+    None when Pandas reads no rows. That includes a header without any of
+    `columns`, where Pandas drops every row but the row parsers still return
+    them (with empty fields), so callers fall back to those.
+    """
+    payloads = []
+    summaries = []
+    detected = None
+    with pd.read_csv(filepath, delimiter=";", dtype=str, keep_default_na=False, chunksize=PANDAS_CHUNK_ROWS,
+                     usecols=columns.__contains__) as reader:
+        for chunk in reader:
+            if detected is None:
+                head = chunk.head(DETECTION_SAMPLE_ROWS).to_dict("records")
+                if not head:
+                    break
+                csv_format = detect_format(head)
+                detected = {'csv_format': csv_format,
+                            'framework': detect_primary_framework(head, filepath, user_framework),
+                            'scan_date': get_scan_date(head)}
+            normalized = normalize_frame(chunk, csv_format, keep_columns)
+            payloads.append(encode_frame(normalized, len(chunk)))
+            summaries.append(summarize_frame(normalized, len(chunk)))
+    if detected is None:
+        return None
+    summary = merge_summaries(summaries)
+    return dict(detected, payload=concat_batches(payloads), summary=summary, row_count=sum(summary.values()))
+
+
+# =============================================================================
+# SPLIT PARSING - one large CSV parsed across several workers
+# =============================================================================
+# A CSV big enough to keep several workers busy is cut into byte ranges at
+# newlines that look like record starts. Each worker tokenizes and normalizes
+# the records starting in its range and reports where its last record really
+# ended; a range whose start does not match the end of the one before (a cut
+# inside a multi-line quoted field) is re-parsed from the right offset, so the
+# rows always equal a sequential parse.
+
+SPLIT_RANGE_BYTES = 32 * 1024 * 1024  # Smallest byte range worth a worker of its own
+
+
+def split_count(filepath: str, workers: int) -> int:
+    """Number of byte ranges to parse a file in: 1 unless it can keep several workers busy."""
+    if workers < 2 or is_scan_export(filepath):
+        return 1
+    try:
+        size = os.path.getsize(filepath)
+    except OSError:
+        return 1
+    return max(1, min(workers, size // SPLIT_RANGE_BYTES))
+
+
+def csv_header(filepath: str) -> tuple[list[str] | None, int]:
+    """Return a CSV's field names and the byte offset its first record starts at."""
+    try:
+        next(_iter_mmap_rows(filepath, (), span=(0, 0)))  # An empty span stops after the header
+    except StopIteration as done:
+        return done.value
+
+
+def split_ranges(filepath: str, data_start: int, width: int, parts: int) -> list[tuple[int, int]]:
+    """Cut the records of a CSV into about `parts` byte ranges of similar size.
+
+    Each cut is moved forward to the first newline followed by a line with at
+    least `width - 1` separators, which a continuation line of a quoted field
+    almost never has; `parse_csv_ranges` verifies the cuts either way.
+    """
+    size = os.path.getsize(filepath)
+    cuts = [data_start]
+    with open(filepath, "rb") as f:
+        for i in range(1, parts):
+            f.seek(max(data_start + (size - data_start) * i // parts, cuts[-1]))
+            f.readline()  # Rest of the line the cut fell in
+            for _ in range(DETECTION_SAMPLE_ROWS):
+                cut = f.tell()
+                line = f.readline()
+                if not line or line.count(b";") >= width - 1:
+                    break
+            else:
+                cut = f.tell()  # No record-like line nearby; the check below still applies
+            cuts.append(cut)
+    cuts.append(size)
+    return [(a, b) for a, b in zip(cuts, cuts[1:]) if a < b]
+
+
+def parse_csv_range(args: tuple) -> dict:
+    """Parse and normalize the records starting in one byte range of a CSV.
+
+    Args:
+        args: Tuple of (filepath, start, stop, fieldnames, columns, csv_format,
+            keep_columns); `start` must be the start of a record.
+
+    Returns:
+        Dict with the range 'start', the 'end' offset of its last record,
+        its normalized rows as an encoded batch ('payload') and their 'summary'.
+    """
+    filepath, start, stop, fieldnames, columns, csv_format, keep_columns = args
+    symbols = SymbolTable()
+    rows = _iter_mmap_rows(filepath, columns, (start, stop), fieldnames)
+    end = None
+
+    def normalized():
+        nonlocal end
+        while True:
+            try:
+                row = next(rows)
+            except StopIteration as done:
+                end = done.value[1]
+                return
+            yield normalize_row(row, csv_format, keep_columns, symbols)
+
+    payload, summary, _ = encode_findings(normalized())
+    return {'start': start, 'end': end, 'payload': payload, 'summary': summary}
+
+
+def parse_range_shared(args: tuple) -> dict:
+    """Pool entry point: parse a byte range and return its rows as an encoded batch."""
+    result = parse_csv_range(args)
+    payload = result.pop('payload')
+    handle = share_batch(None, payload)
+    if handle is not None:
+        result['batch'] = handle
+    else:
+        result['payload'] = payload
+    return result
+
+
+def parse_csv_ranges(executor, filepath: str, columns, csv_format: str, keep_columns,
+                     parts: int) -> tuple[bytes, Counter, int]:
+    """Parse a CSV in byte ranges across the pool.
+
+    Returns the encoded batch of all its rows (in file order), their summary
+    and the row count, identical to a sequential parse of the file.
+    """
+    fieldnames, data_start = csv_header(filepath)
+    if fieldnames is None:
+        return encode_batch([]), Counter(), 0
+    width = len(fieldnames)
+    jobs = [(filepath, start, stop, fieldnames, columns, csv_format, keep_columns)
+            for start, stop in split_ranges(filepath, data_start, width, parts)]
+    futures = [executor.submit(parse_range_shared, job) for job in jobs]
+    payloads = []
+    summaries = []
+    expected = data_start
+    try:
+        for job, future in zip(jobs, futures):
+            try:
+                result = future.result()
+            except Exception:
+                result = None  # Re-read below; only a range cut in the wrong place fails here
+            if result is not None:
+                payload = load_payload(result['batch']) if 'batch' in result else result['payload']
+            if result is None or result['start'] != expected:
+                # The previous range's last record ran past this cut, or the cut
+                # fell inside a quoted field: re-read from where that record ended
+                if expected >= job[2]:
+                    continue  # Swallowed whole by the previous range's last record
+                result = parse_csv_range((filepath, expected, *job[2:]))
+                payload = result.pop('payload')
+            payloads.append(payload)
+            summaries.append(result['summary'])
+            expected = result['end']
+    except BaseException:
+        # Free every segment the workers write, including ranges still being
+        # parsed: cancel the ones not started yet and wait for the rest
+        for future in futures:
+            future.cancel()
+        for future in futures:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            if 'batch' in future.result():
+                try:
+                    load_payload(future.result()['batch'])
+                except FileNotFoundError:
+                    pass  # Already freed above
+        raise
+    summary = merge_summaries(summaries)
+    return concat_batches(payloads), summary, sum(summary.values())
+
+
+# =============================================================================
+# SCAN FILES - columnar intermediate format for normalized findings
+# =============================================================================
+# `--export` writes each input's normalized findings to a scan file that
+# ProwlDash reads back as input instead of re-tokenizing CSV text. With
+# pyarrow installed exports are Parquet (dictionary-encoded, zstd); otherwise
+# they use the stdlib .pdscan layout: magic, uint32 header length, JSON header
+# (scan metadata + compression), then an `encode_batch` payload, zlib
+# compressed for exports and stored raw (memory-mapped on read) in the cache.
+
+SCAN_MAGIC = b"PDS1"
+SCAN_SUFFIX = ".pdscan"
+PARQUET_SUFFIX = ".parquet"
+SCAN_META_KEY = b"prowldash"
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write via a temp file + rename so concurrent workers never see partial files."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_scan_file(path, meta: dict, payload: bytes, compress: bool = True):
+    """Write scan metadata and an encoded findings batch to a .pdscan file."""
+    body = zlib.compress(payload, 6) if compress else payload
+    header = json.dumps(dict(meta, compression="zlib" if compress else None),
+                        separators=(",", ":")).encode("utf-8")
+    _write_atomic(Path(path), b"".join([SCAN_MAGIC, struct.pack("<I", len(header)), header, body]))
+
+
+def read_scan_file(path) -> tuple[dict, memoryview]:
+    """Return (metadata, encoded batch) from a .pdscan file.
+
+    Uncompressed files are memory-mapped, so the batch is decoded straight
+    from the page cache without reading the file into a bytes object first.
+    """
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"Empty scan file: {path}")
+    if data[:4] != SCAN_MAGIC:
+        raise ValueError(f"Not a ProwlDash scan file: {path}")
+    (header_len,) = struct.unpack("<I", data[4:8])
+    meta = json.loads(data[8:8 + header_len])
+    body = memoryview(data)[8 + header_len:]
+    if meta.pop("compression", None) == "zlib":
+        body = memoryview(zlib.decompress(body))
+    return meta, body
+
+
+def write_parquet_file(path, meta: dict, findings: list[Finding]):
+    """Write findings as a Parquet table (requires pyarrow), metadata in the schema."""
+    columns = {field: [getattr(f, field) for f in findings] for field in FINDING_FIELDS}
+    columns["mitre"] = [list(m) for m in columns["mitre"]]
+    columns["extra"] = [json.dumps(e) if e else None for e in columns["extra"]]
+    table = pa.table(columns).replace_schema_metadata({SCAN_META_KEY: json.dumps(meta).encode("utf-8")})
+    pq.write_table(table, str(path), use_dictionary=True, compression="zstd")
+
+
+def read_parquet_file(path) -> tuple[dict, list[Finding]]:
+    """Return (metadata, findings) from a Parquet file written by `write_parquet_file`."""
+    if not USE_PYARROW:
+        raise ValueError("Reading Parquet scans requires pyarrow (pip install pyarrow)")
+    table = pq.read_table(str(path), memory_map=True)
+    metadata = table.schema.metadata or {}
+    if SCAN_META_KEY not in metadata:
+        raise ValueError(f"Not a ProwlDash Parquet export: {path}")
+    columns = [table.column(field).to_pylist() for field in FINDING_FIELDS]
+    columns[FINDING_FIELDS.index("mitre")] = [tuple(m or ()) for m in columns[FINDING_FIELDS.index("mitre")]]
+    columns[FINDING_FIELDS.index("extra")] = [json.loads(e) if e else None
+                                              for e in columns[FINDING_FIELDS.index("extra")]]
+    return json.loads(metadata[SCAN_META_KEY]), list(map(Finding, *columns))
+
+
+def is_scan_export(filepath: str) -> bool:
+    """True for inputs that are ProwlDash exports rather than Prowler CSVs."""
+    return str(filepath).endswith((SCAN_SUFFIX, PARQUET_SUFFIX))
+
+
+def export_scan(export_dir, filepath: str, meta: dict, findings=None, payload=None) -> Path:
+    """Export one input's findings next to the others in `export_dir`.
+
+    Takes decoded findings and/or an already encoded batch, whichever the
+    caller has; Parquet when pyarrow is available, .pdscan otherwise.
+    """
+    stem = Path(filepath).stem
+    if USE_PYARROW:
+        path = Path(export_dir) / f"{stem}{PARQUET_SUFFIX}"
+        write_parquet_file(path, meta, findings if findings is not None else decode_batch(payload))
+    else:
+        path = Path(export_dir) / f"{stem}{SCAN_SUFFIX}"
+        write_scan_file(path, meta, payload if payload is not None else encode_batch(findings))
+    return path
+
+
+# =============================================================================
+# PARSE CACHE - normalized scans persisted across runs
+# =============================================================================
+# Entries are keyed by the file's content hash plus the options that shape its
+# findings. A tiny "<stat id>.stat" file maps (path, size, mtime) to that hash,
+# so unchanged files are not even re-read. Entries are uncompressed scan files
+# (see SCAN FILES) so hits are memory-mapped rather than read.
+# Least recently used entries (by mtime, refreshed on every hit) are evicted
+# once the directory grows past CACHE_MAX_BYTES.
+
+# Format of cached findings. Bump whenever normalize_row, Finding fields or the
+# batch/scan encoding change, so entries written by older code are not reused.
+CACHE_SCHEMA = 1
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Per-user cache directory ($XDG_CACHE_HOME/prowldash or ~/.cache/prowldash)."""
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "prowldash"
+
+
+def file_digest(filepath: str) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def input_digest(filepath: str, cache_dir=None) -> str:
+    """Content hash of an input, reusing the cache's (path, size, mtime) record when possible."""
+    if not cache_dir:
+        return file_digest(filepath)
+    st = os.stat(filepath)
+    stat_id = hashlib.sha256(f"{os.path.abspath(filepath)}|{st.st_size}|{st.st_mtime_ns}".encode()).hexdigest()
+    stat_path = Path(cache_dir) / f"{stat_id[:32]}.stat"
+    try:
+        digest = stat_path.read_text()
+    except OSError:
+        digest = ""
+    if len(digest) != 64:
+        digest = file_digest(filepath)
+        _write_atomic(stat_path, digest.encode())
+    return digest
+
+
+def cache_key(filepath: str, user_framework: str | None, keep_columns: list, cache_dir,
+              details: bool = True) -> str:
+    """Cache key for a file: its content hash plus everything that affects normalization."""
+    digest = input_digest(filepath, cache_dir)
+    options = json.dumps([VERSION, CACHE_SCHEMA, SCAN_MAGIC.decode(), BATCH_MAGIC.decode(), FINDING_FIELDS,
+                          user_framework, keep_columns or [], details])
+    return f"{digest[:40]}-{hashlib.sha256(options.encode()).hexdigest()[:12]}"
+
+
+def load_cached_scan(cache_dir, key: str) -> tuple[dict, memoryview] | None:
+    """Return (metadata, encoded batch) for a cache entry, or None on a miss."""
+    path = Path(cache_dir) / f"{key}.pdc"
+    try:
+        scan = read_scan_file(path)
+        os.utime(path)  # Refresh for LRU eviction
+    except (OSError, ValueError):
+        return None
+    return scan
+
+
+def store_cached_scan(cache_dir, key: str, meta: dict, payload: bytes):
+    """Write a cache entry (see `load_cached_scan`)."""
+    write_scan_file(Path(cache_dir) / f"{key}.pdc", meta, payload, compress=False)
+
+
+def prune_cache(cache_dir, max_bytes: int = CACHE_MAX_BYTES) -> int:
+    """Evict least recently used cache files until the directory fits in `max_bytes`.
+
+    Returns the number of files removed.
+    """
+    entries = []
+    for path in Path(cache_dir).iterdir():
+        if path.suffix in (".pdc", ".stat"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+    total = sum(size for _mtime, size, _path in entries)
+    removed = 0
+    for _mtime, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def _scan_result(filepath: str, meta: dict, start_time: float, parser: str, decode: bool,
+                 payload=None, findings=None) -> dict:
+    """Build a `process_single_file` result from scan metadata (cache hit or export)."""
+    result = {
+        'filepath': filepath,
+        'framework': meta['framework'],
+        'fw_info': get_framework_info(meta['framework']),
+        'csv_format': meta['csv_format'],
+        'summary': Counter({tuple(k[:-1]): k[-1] for k in meta['summary']}),
+        'scan_date': meta['scan_date'],
+        'row_count': meta['row_count'],
+        'parser': parser,
+        'parse_duration': time.time() - start_time,
+        'file_size': os.path.getsize(filepath),
+    }
+    if findings is not None:
+        result['rows'] = findings
+    elif decode:
+        result['rows'] = decode_batch(payload)
+    else:
+        result['payload'] = payload
+    return result
+
+
+def _read_scan_export(filepath: str, user_framework: str | None, start_time: float, decode: bool) -> dict:
+    """Process a .pdscan/.parquet export as if it were the CSV it was made from."""
+    try:
+        if filepath.endswith(PARQUET_SUFFIX):
+            meta, findings = read_parquet_file(filepath)
+            payload, parser = None, "Parquet"
+        else:
+            (meta, payload), findings, parser = read_scan_file(filepath), None, "Scan file"
+    except (OSError, ValueError, KeyError) as e:
+        return {'error': f"Parse error: {e}", 'filepath': filepath}
+    if user_framework:
+        meta['framework'] = user_framework
+    return _scan_result(filepath, meta, start_time, parser, decode, payload, findings)
+
+
+def _export_result(result: dict, export_dir, meta: dict, findings=None, payload=None):
+    """Export a parsed file, recording the export path or error on its result."""
+    try:
+        result['export'] = str(export_scan(export_dir, result['filepath'], meta, findings, payload))
+    except OSError as e:
+        result['export_error'] = str(e)
+
+
+def process_single_file(args: tuple, decode: bool = True, executor=None, parts: int = 1,
+                        parser: str = None) -> dict | None:
+    """Process a single CSV file or scan export. Designed for parallel execution.
     
     Args:
-        args: Tuple of (filepath, user_framework) for multiprocessing compatibility
+        args: Tuple of (filepath, user_framework, keep_columns[, cache_dir[, export_dir[, details]]])
+            for multiprocessing compatibility. A cache_dir of None disables the
+            parse cache; an export_dir also writes the findings as a scan file;
+            details=False skips the DETAIL_COLUMNS text.
+        decode: If False, a cache hit returns the encoded batch as 'payload'
+            instead of decoding it into 'rows'.
+        executor: Process pool to parse a large CSV in `parts` byte ranges
+            with (see `parse_csv_ranges`); rows come back as a 'payload'.
+        parser: Force a parser engine instead of `choose_parser` (calibration).
         
     Returns:
         Dict with processed file data, or None if file should be skipped
@@ -987,41 +2713,245 @@ def process_single_file(args: tuple) -> dict | None:
     Raises:
         Exception: Re-raises parsing errors with context for proper error reporting
     """
-    filepath, user_framework = args
+    filepath, user_framework, keep_columns = args[:3]
+    cache_dir = args[3] if len(args) > 3 else None
+    export_dir = args[4] if len(args) > 4 else None
+    details = args[5] if len(args) > 5 else True
     
     if not os.path.exists(filepath):
         return {'error': f"File not found: {filepath}", 'filepath': filepath}
     
     start_time = time.time()
+    if is_scan_export(filepath):
+        return _read_scan_export(filepath, user_framework, start_time, decode)
+
+    key = None
+    if cache_dir:
+        try:
+            key = cache_key(filepath, user_framework, keep_columns, cache_dir, details)
+            cached = load_cached_scan(cache_dir, key)
+        except (OSError, ValueError):
+            key, cached = None, None
+        if cached:
+            meta, payload = cached
+            result = _scan_result(filepath, meta, start_time, "Cache", decode, payload)
+            result['cached'] = True
+            if export_dir:
+                _export_result(result, export_dir, meta, payload=payload)
+            return result
+
     try:
-        rows, parser_name = parse_csv(filepath)
+        columns = parse_columns(keep_columns, details)
+        parser = "mmap" if parts > 1 else parser or choose_parser(filepath, columns)
+        parsed = None
+        if parser == "pandas":
+            try:
+                parsed = parse_csv_frames(filepath, columns, keep_columns, user_framework)
+            except MemoryError:
+                raise
+            except Exception as e:
+                print(f"  ⚠️  Pandas parsing failed for {os.path.basename(filepath)}: {e}")
+                print("      Falling back to standard CSV parser...")
+                parser = "mmap"
+            else:
+                if parsed is None:
+                    parser = "mmap"  # Empty, or no manifest column: the row parser decides
+        if parsed is not None:
+            csv_format, fw, scan_date = parsed['csv_format'], parsed['framework'], parsed['scan_date']
+            payload, summary, row_count = parsed['payload'], parsed['summary'], parsed['row_count']
+            normalized = decode_batch(payload) if decode else None
+        else:
+            rows = iter_csv_rows(filepath, parser, columns)
+            # Detection only needs the head of the file; the rest is streamed
+            # straight into normalize_row so raw rows are never all in memory.
+            head = list(islice(rows, DETECTION_SAMPLE_ROWS))
+            if not head:
+                return {'error': "Empty file", 'filepath': filepath}
+
+            csv_format = detect_format(head)
+            fw = detect_primary_framework(head, filepath, user_framework)
+            scan_date = get_scan_date(head)
+            if parts > 1:
+                rows.close()
+                payload, summary, row_count = parse_csv_ranges(executor, filepath, columns, csv_format,
+                                                               keep_columns, parts)
+                normalized = decode_batch(payload) if decode else None
+            else:
+                symbols = SymbolTable()
+                findings = (normalize_row(r, csv_format, keep_columns, symbols) for r in chain(head, rows))
+                if decode:
+                    normalized = list(findings)
+                    payload, summary, row_count = None, summarize_rows(normalized), len(normalized)
+                else:
+                    # Workers hand back a batch anyway: encode while parsing
+                    # instead of holding every Finding until the end
+                    normalized = None
+                    payload, summary, row_count = encode_findings(findings)
     except Exception as e:
         return {'error': f"Parse error: {e}", 'filepath': filepath}
     
-    if not rows:
-        return {'error': "Empty file", 'filepath': filepath}
-    
     duration = time.time() - start_time
     file_size = os.path.getsize(filepath)
-    
-    csv_format = detect_format(rows)
-    fw = detect_primary_framework(rows, filepath, user_framework)
-    scan_date = get_scan_date(rows)
-    normalized = [normalize_row(r, csv_format) for r in rows]
     fw_info = get_framework_info(fw)
     
-    return {
+    result = {
         'filepath': filepath,
         'framework': fw,
         'fw_info': fw_info,
         'csv_format': csv_format,
-        'rows': normalized,
+        'summary': summary,
         'scan_date': scan_date,
-        'row_count': len(rows),
-        'parser': parser_name,
+        'row_count': row_count,
+        'parser': PARSER_NAMES[parser] + (f" ({parts} ranges)" if parts > 1 else ""),
         'parse_duration': duration,
         'file_size': file_size
     }
+    if normalized is not None:
+        result['rows'] = normalized
+
+    if key or export_dir:
+        if payload is None:
+            payload = encode_batch(normalized)
+        meta = {'framework': fw, 'csv_format': csv_format, 'scan_date': scan_date,
+                'row_count': row_count, 'summary': [[*k, n] for k, n in summary.items()]}
+        if key:
+            try:
+                store_cached_scan(cache_dir, key, meta, payload)
+            except OSError:
+                pass  # A read-only or full cache directory only costs the next run a re-parse
+        if export_dir:
+            _export_result(result, export_dir, meta, normalized, payload)
+    if not decode and payload is not None:
+        result['payload'] = payload
+
+    return result
+
+
+def build_dashboard(job: tuple) -> dict:
+    """Build and write one framework's dashboard. Designed for parallel execution.
+
+    Args:
+        job: Tuple of (framework_id, file_entries, output_dir[, compress]).
+            Each entry is a dict with 'filepath', 'scan_date' and either
+            'rows' or a shared-memory 'batch' handle; compress embeds DATA
+            gzipped (see `iter_html`).
+
+    Returns:
+        Dict with the framework, output path, stats and log lines for the
+        parent to print (workers do not write to stdout directly).
+    """
+    fw, file_list, output_dir = job[:3]
+    compress = job[3] if len(job) > 3 else False
+    fw_info = get_framework_info(fw)
+    log = [f"Generating {fw_info['name']} dashboard..."]
+
+    # Group files by scan date
+    date_groups = {}
+    date_summaries = defaultdict(list)
+    for entry in file_list:
+        scan_date = entry['scan_date']
+        if scan_date not in date_groups:
+            date_groups[scan_date] = []
+        date_groups[scan_date].extend(collect_rows(entry))
+        if entry.get('summary') is not None:
+            date_summaries[scan_date].append(entry['summary'])
+
+    sorted_dates = sorted(
+        date_groups.keys(),
+        key=lambda d: datetime.strptime(d, "%b %d, %Y") if d != "Unknown" else datetime.min
+    )
+
+    def group_summary(date):
+        # Worker partials cover every file of the group unless an entry came without one
+        partials = date_summaries[date]
+        if len(partials) == sum(1 for e in file_list if e['scan_date'] == date):
+            return merge_summaries(partials)
+        return summarize_rows(date_groups[date])
+
+    if len(sorted_dates) >= 2:
+        old_date = sorted_dates[0]
+        new_date = sorted_dates[-1]
+        old_rows = date_groups[old_date]
+        new_rows = date_groups[new_date]
+        old_summary = group_summary(old_date)
+        scan_info = f"Comparing {old_date} vs {new_date}"
+        log.append(f"  Old scan ({old_date}): {len(old_rows)} rows")
+        log.append(f"  New scan ({new_date}): {len(new_rows)} rows")
+    else:
+        new_date = sorted_dates[0]
+        new_rows = date_groups[new_date]
+        old_rows = []
+        old_summary = None
+        scan_info = f"Scan: {new_date}"
+
+    # Process
+    data, removed = diff_scans(new_rows, old_rows)
+    accounts = get_accounts(data)
+    if old_rows:
+        log.append(f"  Removed since old scan: {len(removed)} findings")
+
+    # Without an old scan every delta is "unchanged", so the merged worker
+    # partials are exact; otherwise the deltas just computed must be counted.
+    summary = summarize_rows(data) if old_rows else group_summary(new_date)
+
+    agg = aggregate_summary(summary, accounts, old_summary)
+    stats = agg["stats"]
+    by_account = agg["by_account"]
+    by_service = agg["by_service"]
+    by_severity = agg["by_severity"]
+    account_stats = agg["account_stats"]  # Per-account stats for tabs
+    regions = agg["regions"]
+    services = agg["services"]
+    stats["removed"] = len(removed)
+
+    findings = [extract_finding(r) for r in data]
+    for f in findings:
+        f["acct"] = accounts.get(f["acctId"], {}).get("short", "unknown")
+    findings = sort_findings(findings)
+    removed = sort_findings([extract_finding(r) for r in removed])
+
+    # Determine if multi-account mode
+    is_multi_account = len(accounts) > 1
+
+    # Filled while findings are serialized, so it must stay after them
+    dictionaries = {col: SymbolTable() for col in ENCODED_COLUMNS if col not in DETAIL_FIELDS}
+    details = SymbolTable()
+    dashboard_data = {
+        "scanInfo": scan_info,
+        "framework": fw,
+        "frameworkInfo": fw_info,  # Include framework metadata
+        "stats": stats,
+        "accountStats": account_stats,  # Per-account stats for tabs
+        "isMultiAccount": is_multi_account,
+        "byAccount": by_account,
+        "byService": by_service,
+        "bySeverity": by_severity,
+        "regions": regions,
+        "services": services,
+        "accounts": accounts,
+        "findings": FindingColumns(findings, dictionaries, details),
+        "removed": FindingColumns(removed, dictionaries, columns=REMOVED_COLUMNS),
+        "dictionaries": dictionaries,
+    }
+
+    # Generate HTML (pass fw_info for theming), streamed to disk
+    output_path = Path(output_dir) / f"{fw}_dashboard.html"
+    blocks = {"detailData": details.values, "searchData": SearchCorpus(findings)}
+    write_html(dashboard_data, fw, output_path, compress, blocks)
+
+    sev_info = f"[{stats['critical']}C/{stats['high']}H/{stats['medium']}M/{stats['low']}L]"
+    log.append(f"  Stats: {stats['fail']} FAIL {sev_info}, {stats['pass']} PASS, {stats['fixed']} fixed")
+    log.append(f"  Output: {output_path}")
+
+    return {
+        'framework': fw,
+        'account_stats': account_stats,
+        'fw_info': fw_info,
+        'output_path': str(output_path),
+        'stats': stats,
+        'scan_info': scan_info,
+        'log': log,
+    }
 
 
 def generate_landing_page(generated_files: list, scan_info: str, stats_by_fw: dict) -> str:
@@ -1177,6 +3107,13 @@ def parse_args(argv: list) -> dict:
 
         'max_workers': None,
         'verbose': False,
+        'keep_columns': [],
+        'cache_dir': None,
+        'no_cache': False,
+        'incremental': False,
+        'export': None,
+        'no_details': False,
+        'compress': False,
     }
 
     i = 1
@@ -1212,6 +3149,38 @@ def parse_args(argv: list) -> dict:
             else:
                 print("Error: --max-workers requires a number")
                 sys.exit(1)
+        elif arg == '--keep-columns':
+            if i + 1 < len(argv):
+                args['keep_columns'] = [c.strip() for c in argv[i + 1].split(',') if c.strip()]
+                i += 2
+                continue
+            else:
+                print("Error: --keep-columns requires a comma-separated list of column names")
+                sys.exit(1)
+        elif arg == '--cache-dir':
+            if i + 1 < len(argv):
+                args['cache_dir'] = argv[i + 1]
+                i += 2
+                continue
+            else:
+                print("Error: --cache-dir requires a path argument")
+                sys.exit(1)
+        elif arg == '--export':
+            if i + 1 < len(argv):
+                args['export'] = argv[i + 1]
+                i += 2
+                continue
+            else:
+                print("Error: --export requires a directory argument")
+                sys.exit(1)
+        elif arg == '--no-cache':
+            args['no_cache'] = True
+        elif arg == '--no-details':
+            args['no_details'] = True
+        elif arg == '--compress':
+            args['compress'] = True
+        elif arg == '--incremental':
+            args['incremental'] = True
         elif arg == '--no-timestamp':
             args['no_timestamp'] = True
         elif arg == '--list-frameworks':
@@ -1225,6 +3194,241 @@ def parse_args(argv: list) -> dict:
     return args
 
 
+# =============================================================================
+# PARSER CALIBRATION - measured parser crossover sizes for this machine
+# =============================================================================
+# PANDAS_SIZE_THRESHOLD was measured on one laptop; the crossover moves a lot
+# between CPUs and interpreters (PyPy). `prowldash --calibrate` times every
+# available engine against the mmap tokenizer on synthetic Prowler files of
+# growing size and stores, per interpreter, the file size above which each
+# engine wins. `choose_parser` uses those thresholds when they exist.
+
+CALIBRATION_NAME = "parser_calibration.json"
+CALIBRATION_SIZES = tuple(kb * 1024 for kb in (256, 1024, 4096, 16384, 49152))
+
+
+def calibration_path() -> Path:
+    return default_cache_dir() / CALIBRATION_NAME
+
+
+def runtime_key() -> str:
+    """Interpreter and CPU a calibration applies to, e.g. 'CPython-3.11-x86_64'."""
+    return f"{platform.python_implementation()}-{sys.version_info[0]}.{sys.version_info[1]}-{platform.machine()}"
+
+
+def engine_versions() -> dict:
+    """Installed alternative parser engines and their versions."""
+    return {"pandas": pd.__version__} if USE_PANDAS else {}
+
+
+@lru_cache(maxsize=None)
+def parser_thresholds() -> dict:
+    """Calibrated {engine: file size above which it is used} for this interpreter.
+
+    Engines whose installed version differs from the calibrated one are left
+    out, so callers fall back to the defaults for them. None means the engine
+    never won and should not be used.
+    """
+    try:
+        with open(calibration_path(), "r", encoding="utf-8") as f:
+            entry = json.load(f).get(runtime_key(), {})
+    except (OSError, ValueError):
+        return {}
+    versions = engine_versions()
+    return {engine: threshold for engine, threshold in entry.get("thresholds", {}).items()
+            if entry.get("engines", {}).get(engine) == versions.get(engine)}
+
+
+def crossover_threshold(sizes, base_times, engine_times) -> int | None:
+    """File size above which an engine beats the baseline at every larger measured size.
+
+    Returns the geometric midpoint between the last losing and the first
+    winning size, 0 if the engine won everywhere and None if it lost at the
+    largest size.
+    """
+    threshold = None
+    for i in range(len(sizes) - 1, -1, -1):
+        if engine_times[i] >= base_times[i]:
+            break
+        threshold = 0 if i == 0 else int((sizes[i - 1] * sizes[i]) ** 0.5)
+    return threshold
+
+
+def write_calibration_csv(path, size: int):
+    """Write a synthetic Prowler main-format CSV of about `size` bytes."""
+    columns = sorted(FORMAT_COLUMNS["main"] | DETAIL_COLUMNS["main"] | {
+        "TIMESTAMP", "PROVIDER", "PARTITION", "DESCRIPTION", "RESOURCE_DETAILS", "RESOURCE_TAGS", "CATEGORIES",
+    })
+    statuses = ("PASS", "FAIL", "FAIL", "MANUAL")
+    severities = ("critical", "high", "medium", "low")
+    written = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, delimiter=";")
+        writer.writerow(columns)
+        i = 0
+        while written < size:
+            check = f"check_{i % 250}"
+            values = {
+                "ACCOUNT_UID": f"{100000000000 + i % 40}", "ACCOUNT_NAME": f"account-{i % 40}",
+                "REGION": ("us-east-1", "eu-west-1", "ap-south-1")[i % 3], "CHECK_ID": check,
+                "CHECK_TITLE": f"Ensure {check} is configured", "STATUS": statuses[i % 4],
+                "STATUS_EXTENDED": f"Resource res-{i} is not compliant with {check}",
+                "SEVERITY": severities[i % 4], "SERVICE_NAME": ("iam", "s3", "ec2")[i % 3],
+                "RESOURCE_UID": f"arn:aws:s3:::bucket-{i}", "RESOURCE_NAME": f"bucket-{i}",
+                "RISK": f"Risk of {check}: " + "unrestricted access may expose data; " * 6,
+                "REMEDIATION_RECOMMENDATION_TEXT": f"Remediate {check} by restricting access. " * 4,
+                "REMEDIATION_RECOMMENDATION_URL": "https://docs.aws.amazon.com/",
+                "COMPLIANCE": "CIS-2.0: 1.10 | MITRE-ATTACK: T1078",
+                "RESOURCE_DETAILS": '{"Name": "bucket-%d", "Versioning": "Enabled"}' % i,
+            }
+            row = [values.get(c, c.lower()) for c in columns]
+            writer.writerow(row)
+            written += sum(map(len, row)) + len(row)
+            i += 1
+
+
+def calibrate_parsers(sizes=CALIBRATION_SIZES, repeat: int = 3) -> dict:
+    """Time the parsers on synthetic files, store the thresholds and return the entry."""
+    engines = engine_versions()
+    times = {engine: [] for engine in ["mmap", *engines]}
+    tmp = Path(tempfile.mkdtemp(prefix="prowldash-calibrate-"))
+    try:
+        for size in sizes:
+            path = tmp / f"calibration_{size}.csv"
+            write_calibration_csv(path, size)
+            row = [f"{size / (1024 * 1024):9.2f}MB"]
+            for engine in times:
+                best = float("inf")
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    process_single_file((str(path), None, None), decode=False, parser=engine)
+                    best = min(best, time.perf_counter() - start)
+                times[engine].append(best)
+                row.append(f"{engine}: {best * 1000:9.1f}ms")
+            print("  " + "  ".join(row))
+            path.unlink()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    entry = {
+        "calibrated": datetime.now().isoformat(timespec="seconds"),
+        "engines": engines,
+        "thresholds": {engine: crossover_threshold(sizes, times["mmap"], times[engine]) for engine in engines},
+        "sizes": list(sizes),
+        "times": times,
+    }
+    path = calibration_path()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            calibration = json.load(f)
+    except (OSError, ValueError):
+        calibration = {}
+    calibration[runtime_key()] = entry
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(path, json.dumps(calibration, indent=2).encode("utf-8"))
+    parser_thresholds.cache_clear()
+    return entry
+
+
+# =============================================================================
+# INCREMENTAL BUILDS - manifest of the inputs behind each dashboard
+# =============================================================================
+# With --incremental the output directory keeps a manifest recording every
+# input's content hash and framework, plus the inputs and landing-page stats
+# behind each dashboard. The next run re-parses only changed inputs and
+# rebuilds only the frameworks they (or removed inputs) belong to. A rebuilt
+# framework is regenerated whole: its unchanged inputs come from the parse
+# cache, not from the manifest.
+
+MANIFEST_NAME = "prowldash_manifest.json"
+
+
+def load_manifest(output_dir) -> dict:
+    """Read the output directory's manifest ({} if missing or unreadable)."""
+    try:
+        return json.loads((Path(output_dir) / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_manifest(output_dir, manifest: dict):
+    """Atomically write the output directory's manifest."""
+    _write_atomic(Path(output_dir) / MANIFEST_NAME, json.dumps(manifest, indent=1).encode("utf-8"))
+
+
+def unchanged_inputs(files: list, digests: dict, manifest: dict, options: list) -> dict:
+    """Map each input whose content matches the manifest to its recorded framework."""
+    if manifest.get("options") != options:
+        return {}
+    previous = manifest.get("inputs", {})
+    known = {}
+    for f in files:
+        entry = previous.get(os.path.abspath(f))
+        if entry and digests.get(f) == entry["digest"]:
+            known[f] = entry["framework"]
+    return known
+
+
+def stale_frameworks(manifest: dict, known: dict, parsed_frameworks, output_dir) -> set:
+    """Frameworks whose dashboard must be rebuilt: new/changed/removed inputs or missing output."""
+    stale = set(parsed_frameworks)
+    unchanged_paths = {os.path.abspath(f) for f in known}
+    for path, entry in manifest.get("inputs", {}).items():
+        if path not in unchanged_paths:
+            stale.add(entry["framework"])
+    dashboards = manifest.get("dashboards", {})
+    for fw in set(known.values()):
+        dashboard = dashboards.get(fw)
+        if not dashboard or not (Path(output_dir) / dashboard["output"]).exists():
+            stale.add(fw)
+    return stale
+
+
+def parse_files(executor, paths: list, parse_options: tuple, workers: int = 1):
+    """Parse files in the pool (rows returned via shared memory) or in-process without one.
+
+    Files large enough to keep several workers busy are parsed in byte ranges
+    across the pool instead of by a single worker. Results are in input order.
+    """
+    file_args = [(f, *parse_options) for f in paths]
+    if not executor:
+        return map(process_single_file, file_args)
+    parts = {f: split_count(f, workers) for f in paths}
+    whole = executor.map(process_file_shared, [a for a in file_args if parts[a[0]] == 1])
+
+    def results():
+        for a in file_args:
+            if parts[a[0]] > 1:
+                yield share_result(process_single_file(a, decode=False, executor=executor, parts=parts[a[0]]))
+            else:
+                yield next(whole)
+    return results()
+
+
+def _record_parse_result(result, framework_files, processed_files_stats, errors):
+    """Move a worker result's rows into its framework's build entries and report it."""
+    if result and 'error' not in result:
+        processed_files_stats.append(result)
+        fw = result['framework']
+        # Rows (or their shared-memory handle) move to the build job;
+        # the parent never decodes them
+        entry = {'filepath': result['filepath'], 'scan_date': result['scan_date'],
+                 'summary': result['summary']}
+        if 'batch' in result:
+            entry['batch'] = result.pop('batch')
+        else:
+            entry['rows'] = result.pop('rows')
+        framework_files[fw].append(entry)
+        print(f"  ✓ {os.path.basename(result['filepath'])}: {result['fw_info']['name']}, "
+              f"{result['csv_format']} format, {result['row_count']} rows, {result['scan_date']}"
+              f"{' (cached)' if result.get('cached') else ''}")
+        if 'export_error' in result:
+            print(f"    ⚠️  Export failed: {result['export_error']}")
+    elif result and 'error' in result:
+        errors.append(result)
+        print(f"  ✗ {os.path.basename(result['filepath'])}: {result['error']}")
+
+
 def main():
     total_start_time = time.time()
     print_banner()
@@ -1241,10 +3445,28 @@ def main():
         list_frameworks()
         sys.exit(0)
 
+    if '--calibrate' in sys.argv:
+        print(f"Calibrating CSV parsers for {runtime_key()}...")
+        try:
+            entry = calibrate_parsers()
+        except OSError as e:
+            print(f"❌ Calibration failed: {e}")
+            sys.exit(1)
+        for engine, threshold in entry["thresholds"].items():
+            if threshold is None:
+                print(f"  ✓ {PARSER_NAMES[engine]}: never faster, disabled")
+            else:
+                print(f"  ✓ {PARSER_NAMES[engine]}: used above {threshold / (1024 * 1024):.1f}MB")
+        if not entry["thresholds"]:
+            print("  ⚠️  Only the built-in tokenizer is available; install pandas to calibrate it")
+        print(f"✓ Saved to {calibration_path()}")
+        sys.exit(0)
+
     # Parse arguments
     args = parse_args(sys.argv)
     files = args['files']
     user_framework = args.get('framework')
+    keep_columns = args.get('keep_columns')
 
     if args.get('list_frameworks'):
         list_frameworks()
@@ -1261,55 +3483,36 @@ def main():
     # Adaptive worker count:
     # 1. User override if provided
     # 2. Otherwise min(cpu_count, file_count) to avoid overhead for small batches
+    # 3. All cores when a CSV is large enough to be parsed in byte ranges
     if args.get('max_workers'):
         worker_count = args['max_workers']
     else:
         worker_count = min(cpu_count, len(files))
+        if any(split_count(f, cpu_count) > 1 for f in files):
+            worker_count = cpu_count
         
     perf_mode = "Pandas + Parallel" if USE_PANDAS else "Parallel"
     print(f"Processing {len(files)} file(s) [{perf_mode}, {worker_count} workers]...")
 
-    # Group files by framework (dynamic, not hardcoded)
-    framework_files = defaultdict(list)  # {framework_id: [(filepath, rows, scan_date), ...]}
-    errors = []  # Collect errors for summary
-
-    if len(files) == 1:
-        # Single file: skip parallelism overhead
-        result = process_single_file((files[0], user_framework))
-        processed_files_stats = []
-        if result and 'error' not in result:
-            processed_files_stats.append(result)
-            fw = result['framework']
-            framework_files[fw].append((result['filepath'], result['rows'], result['scan_date']))
-            print(f"  ✓ {os.path.basename(result['filepath'])}: {result['fw_info']['name']}, "
-                  f"{result['csv_format']} format, {result['row_count']} rows, {result['scan_date']}")
-        elif result and 'error' in result:
-            errors.append(result)
-            print(f"  ✗ {os.path.basename(result['filepath'])}: {result['error']}")
-    else:
-        # Multiple files: process in parallel
-        with ProcessPoolExecutor(max_workers=worker_count) as executor:
-            # Submit all files for processing
-            file_args = [(f, user_framework) for f in files]
-            results = executor.map(process_single_file, file_args)
-            processed_files_stats = []
-            
-            for result in results:
-                if result and 'error' not in result:
-                    processed_files_stats.append(result)
-                    fw = result['framework']
-                    framework_files[fw].append((result['filepath'], result['rows'], result['scan_date']))
-                    print(f"  ✓ {os.path.basename(result['filepath'])}: {result['fw_info']['name']}, "
-                          f"{result['csv_format']} format, {result['row_count']} rows, {result['scan_date']}")
-                elif result and 'error' in result:
-                    errors.append(result)
-                    print(f"  ✗ {os.path.basename(result['filepath'])}: {result['error']}")
-
-    # Report any errors clearly
-    if errors:
-        print(f"\n⚠️  {len(errors)} file(s) had errors:")
-        for err in errors:
-            print(f"   - {os.path.basename(err['filepath'])}: {err['error']}")
+    # Parse cache: unchanged inputs skip parsing entirely
+    cache_dir = None
+    if not args['no_cache']:
+        cache_dir = Path(args['cache_dir']) if args['cache_dir'] else default_cache_dir()
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"⚠️  Parse cache disabled: {e}")
+            cache_dir = None
+
+    # Scan exports: normalized findings written as columnar scan files
+    export_dir = None
+    if args['export']:
+        export_dir = Path(args['export'])
+        try:
+            export_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"❌ Cannot create export directory: {e}")
+            sys.exit(1)
 
     # Determine output directory
     if args['output']:
@@ -1317,8 +3520,8 @@ def main():
     else:
         base_output = Path(__file__).parent / "output"
 
-    # Create timestamped subfolder by default
-    if args['no_timestamp']:
+    # Create timestamped subfolder by default (incremental runs reuse one folder)
+    if args['no_timestamp'] or args['incremental']:
         output_dir = base_output
     else:
         now = datetime.now()
@@ -1326,101 +3529,137 @@ def main():
         time_folder = now.strftime("%H-%M-%S")
         output_dir = base_output / date_folder / time_folder
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-    print(f"\nOutput directory: {output_dir}")
-
-    generated = []  # List of (framework_id, path, fw_info) tuples
-    stats_by_fw = {}  # Store stats for landing page
-    scan_info_combined = ""
-
-    # Process each detected framework
-    for fw, file_list in framework_files.items():
-        if not file_list:
-            continue
-
-        fw_info = get_framework_info(fw)
-        print(f"\nGenerating {fw_info['name']} dashboard...")
-
-        # Group files by scan date
-        date_groups = {}
-        for filepath, rows, scan_date in file_list:
-            if scan_date not in date_groups:
-                date_groups[scan_date] = []
-            date_groups[scan_date].extend(rows)
-
-        sorted_dates = sorted(
-            date_groups.keys(),
-            key=lambda d: datetime.strptime(d, "%b %d, %Y") if d != "Unknown" else datetime.min
-        )
+    # Incremental: inputs unchanged since the manifest are only parsed if
+    # their framework has to be rebuilt anyway
+    manifest = load_manifest(output_dir) if args['incremental'] else {}
+    options = [VERSION, CACHE_SCHEMA, user_framework, keep_columns] + (["no-details"] if args['no_details'] else [])
+    options += ["compress"] if args['compress'] else []
+    digests = {}
+    known = {}
+    if args['incremental']:
+        for f in files:
+            try:
+                digests[f] = input_digest(f, cache_dir)
+            except OSError:
+                pass  # Missing/unreadable files are reported by the parse step
+        known = unchanged_inputs(files, digests, manifest, options)
 
-        if len(sorted_dates) >= 2:
-            old_date = sorted_dates[0]
-            new_date = sorted_dates[-1]
-            old_rows = date_groups[old_date]
-            new_rows = date_groups[new_date]
-            scan_info = f"Comparing {old_date} vs {new_date}"
-            print(f"  Old scan ({old_date}): {len(old_rows)} rows")
-            print(f"  New scan ({new_date}): {len(new_rows)} rows")
+    # Group files by framework (dynamic, not hardcoded)
+    framework_files = defaultdict(list)  # {framework_id: [{filepath, scan_date, rows|batch}, ...]}
+    errors = []  # Collect errors for summary
+    processed_files_stats = []
+
+    # Single small file: skip parallelism overhead. Otherwise one pool serves
+    # both the parse phase and the per-framework build phase.
+    use_pool = len(files) > 1 or any(split_count(f, worker_count) > 1 for f in files)
+    if use_pool and USE_SHARED_MEMORY:
+        # Start the tracker before forking so workers share it and
+        # segments left behind by a crash are still cleaned up
+        resource_tracker.ensure_running()
+
+    with (ProcessPoolExecutor(max_workers=worker_count) if use_pool else nullcontext()) as executor:
+        parse_options = (user_framework, keep_columns, cache_dir and str(cache_dir),
+                         export_dir and str(export_dir), not args['no_details'])
+        for result in parse_files(executor, [f for f in files if f not in known], parse_options, worker_count):
+            _record_parse_result(result, framework_files, processed_files_stats, errors)
+
+        stale = set()
+        if args['incremental']:
+            stale = stale_frameworks(manifest, known, framework_files, output_dir)
+            reparse = [f for f in files if known.get(f) in stale]
+            print(f"Incremental: {len(known)} unchanged input(s), "
+                  f"rebuilding {', '.join(sorted(stale)) if stale else 'nothing'}")
+            for result in parse_files(executor, reparse, parse_options, worker_count):
+                _record_parse_result(result, framework_files, processed_files_stats, errors)
+
+        if cache_dir:
+            try:
+                prune_cache(cache_dir)
+            except OSError:
+                pass
+
+        # Report any errors clearly
+        if errors:
+            print(f"\n⚠️  {len(errors)} file(s) had errors:")
+            for err in errors:
+                print(f"   - {os.path.basename(err['filepath'])}: {err['error']}")
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        print(f"\nOutput directory: {output_dir}")
+
+        # Build each detected framework's dashboard, in parallel when there are several
+        jobs = [(fw, file_list, str(output_dir), args['compress'])
+                for fw, file_list in framework_files.items() if file_list]
+        if executor and len(jobs) > 1:
+            built = executor.map(build_dashboard, jobs)
         else:
-            new_date = sorted_dates[0]
-            new_rows = date_groups[new_date]
-            old_rows = []
-            scan_info = f"Scan: {new_date}"
-
-        # Process
-        data = calculate_delta(new_rows, old_rows)
-        accounts = get_accounts(data)
+            built = map(build_dashboard, jobs)
 
-        stats = compute_stats(data, old_rows)
-        by_account = compute_by_account(data, accounts)
-        by_service = compute_by_service(data)
-        by_severity = compute_by_severity(data)
-        account_stats = compute_account_stats(data, accounts)  # Per-account stats for tabs
-        regions = sorted(set(r.get("region", "") for r in data if r.get("region")))
-        services = sorted(set(r.get("service", "") for r in data if r.get("service")))
-
-        findings = [extract_finding(r) for r in data]
-        for f in findings:
-            f["acct"] = accounts.get(f["acctId"], {}).get("short", "unknown")
-        findings = sort_findings(findings)
-
-        # Determine if multi-account mode
-        is_multi_account = len(accounts) > 1
-
-        dashboard_data = {
-            "scanInfo": scan_info,
-            "framework": fw,
-            "frameworkInfo": fw_info,  # Include framework metadata
-            "stats": stats,
-            "accountStats": account_stats,  # Per-account stats for tabs
-            "isMultiAccount": is_multi_account,
-            "byAccount": by_account,
-            "byService": by_service,
-            "bySeverity": by_severity,
-            "regions": regions,
-            "services": services,
-            "accounts": accounts,
-            "findings": findings,
-        }
-
-        # Generate HTML (pass fw_info for theming)
-        html = generate_html(dashboard_data, fw)
+        dashboards = {}
+        for dashboard in built:
+            print("\n" + "\n".join(dashboard['log']))
+            dashboards[dashboard['framework']] = dashboard
 
-        output_path = output_dir / f"{fw}_dashboard.html"
-        output_path.write_text(html, encoding="utf-8")
+    # Frameworks in input order, as they were first detected
+    fw_by_file = dict(known)
+    for result in processed_files_stats:
+        fw_by_file[result['filepath']] = result['framework']
+    fw_order = list(dict.fromkeys(fw_by_file[f] for f in files if f in fw_by_file))
 
-        sev_info = f"[{stats['critical']}C/{stats['high']}H/{stats['medium']}M/{stats['low']}L]"
-        print(f"  Stats: {stats['fail']} FAIL {sev_info}, {stats['pass']} PASS, {stats['fixed']} fixed")
-        print(f"  Output: {output_path}")
-
-        generated.append((fw, output_path, fw_info))  # Include fw_info
+    generated = []  # List of (framework_id, path, fw_info) tuples
+    stats_by_fw = {}  # Store stats for landing page
+    scan_info_combined = ""
+    for fw in fw_order:
+        if fw in dashboards:
+            dashboard = dashboards[fw]
+            output_path, stats, scan_info = Path(dashboard['output_path']), dashboard['stats'], dashboard['scan_info']
+        elif fw in manifest.get("dashboards", {}) and fw not in stale:
+            # Unchanged since the last incremental run: keep the existing file
+            kept = manifest["dashboards"][fw]
+            output_path, stats, scan_info = output_dir / kept["output"], kept["stats"], kept["scan_info"]
+            print(f"\n  ✓ {get_framework_info(fw)['name']}: unchanged, kept {output_path}")
+        else:
+            continue
+        generated.append((fw, output_path, get_framework_info(fw)))
         stats_by_fw[fw] = stats
         scan_info_combined = scan_info  # Use the last scan_info
 
+    if args['incremental']:
+        inputs = {}
+        for f in files:
+            path = os.path.abspath(f)
+            if f in known and known[f] not in stale:
+                inputs[path] = manifest["inputs"][path]
+        for result in processed_files_stats:
+            if result['filepath'] in digests:
+                inputs[os.path.abspath(result['filepath'])] = {
+                    "digest": digests[result['filepath']],
+                    "framework": result['framework'],
+                    "scan_date": result['scan_date'],
+                    "row_count": result['row_count'],
+                }
+        manifest_dashboards = {}
+        for fw, output_path, _fw_info in generated:
+            if fw in dashboards:
+                manifest_dashboards[fw] = {
+                    "output": output_path.name,
+                    "inputs": [p for p, entry in inputs.items() if entry["framework"] == fw],
+                    "stats": stats_by_fw[fw],
+                    "scan_info": dashboards[fw]['scan_info'],
+                }
+            else:
+                manifest_dashboards[fw] = manifest["dashboards"][fw]
+        new_manifest = {"version": VERSION, "options": options,
+                        "inputs": inputs, "dashboards": manifest_dashboards}
+        if new_manifest != manifest:
+            write_manifest(output_dir, new_manifest)
+
     # Generate landing page if we have dashboards
-    if generated:
+    landing_path = output_dir / "index.html"
+    landing_current = (args['incremental'] and not dashboards and landing_path.exists()
+                       and set(stats_by_fw) == set(manifest.get("dashboards", {})))
+    if generated and not landing_current:
         landing_html = generate_landing_page(generated, scan_info_combined, stats_by_fw)
-        landing_path = output_dir / "index.html"
         landing_path.write_text(landing_html, encoding="utf-8")
         print(f"\nLanding page: {landing_path}")
 
@@ -10,6 +10,17 @@ from unittest.mock import patch, mock_open, MagicMock
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from prowldash import safe_json_dumps, detect_framework, get_framework_info, parse_csv, detect_format, extract_mitre_techniques
+import pickle
+from prowldash import iter_csv_rows, process_single_file, normalize_row, extract_finding, Finding
+from prowldash import SymbolTable, ENCODED_COLUMNS
+import prowldash
+from prowldash import encode_batch, decode_batch, share_batch, load_batch, process_file_shared, collect_rows
+from prowldash import summarize_rows, merge_summaries, calculate_delta, get_accounts
+import tempfile
+import shutil
+import csv
+import random
+import time
 
 class TestCore(unittest.TestCase):
     def test_detect_format_compliance(self):
@@ -169,3 +180,695 @@ class TestMetadataExtraction(unittest.TestCase):
         """Test comma-separated IDs in single block."""
         s = "MITRE-ATTACK: T1552, T1059.001 | CIS-2.0: 1.4"
         self.assertEqual(set(extract_mitre_techniques(s)), {"T1552", "T1059.001"})
+
+
+class TestStreamingPipeline(unittest.TestCase):
+    """Test the generator-based read -> normalize pipeline."""
+
+    def setUp(self):
+        self.fixtures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+    def test_iter_csv_rows_is_lazy(self):
+        path = os.path.join(self.fixtures_dir, "generic_aws_scan.csv")
+        rows = iter_csv_rows(path)
+        self.assertFalse(isinstance(rows, list))
+        first = next(rows)
+        self.assertIn("CHECK_ID", first)
+        self.assertEqual(len(list(rows)), 1)
+
+    def test_mmap_rows_match_dictreader(self):
+        """The mmap tokenizer returns DictReader's values for the requested columns."""
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        tricky = os.path.join(tmp, "tricky.csv")
+        with open(tricky, "w", encoding="utf-8", newline="") as f:
+            f.write('ACCOUNT_UID;CHECK_ID;STATUS;RISK\r\n'
+                    '1;c1;FAIL;"plain"\r\n'
+                    '2;c2;PASS;"semi;colon"\r\n'
+                    '\r\n'
+                    '3;c3;FAIL;"multi\r\nline ""quoted"""\r\n'
+                    '4;c4;FAIL;the "root" account\r\n'
+                    '5;c5\r\n')
+        paths = [os.path.join(self.fixtures_dir, name) for name in sorted(os.listdir(self.fixtures_dir))]
+        for block_bytes in (prowldash.MMAP_BLOCK_BYTES, 16):
+            for path in paths + [tricky]:
+                with self.subTest(path=os.path.basename(path), block_bytes=block_bytes), \
+                        patch("prowldash.MMAP_BLOCK_BYTES", block_bytes):
+                    with open(path, encoding="utf-8") as f:
+                        expected = [{k: v for k, v in r.items() if k in prowldash.NORMALIZED_COLUMNS}
+                                    for r in csv.DictReader(f, delimiter=";")]
+                    rows = list(iter_csv_rows(path, "mmap", prowldash.NORMALIZED_COLUMNS))
+                    self.assertEqual(rows, expected)
+
+    def test_mmap_rows_match_dictreader_fuzzed(self):
+        """Random quote/separator/line-break soup, whole files and byte ranges."""
+        rng = random.Random(14)
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        path = os.path.join(tmp, "fuzz.csv")
+        columns = {"A", "B", "D"}
+        pieces = ['a', ';', '"', '""', '";', ';"', '\n', '\r\n', '\r', 'x;y\n']
+        for case in range(300):
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write("A;B;C;D\n" + "".join(rng.choice(pieces) for _ in range(rng.randrange(1, 40))))
+            with open(path, encoding="utf-8") as f:
+                expected = [{k: v for k, v in r.items() if k in columns} for r in csv.DictReader(f, delimiter=";")]
+            with self.subTest(case=case), patch("prowldash.MMAP_BLOCK_BYTES", rng.choice([8, 1 << 20])):
+                self.assertEqual(list(iter_csv_rows(path, "mmap", columns)), expected)
+                # Ranges cut after random newlines, each read from where the last one ended
+                fieldnames, start = prowldash.csv_header(path)
+                with open(path, "rb") as f:
+                    raw = f.read()
+                rows = []
+                while start < len(raw):
+                    cut = raw.find(b"\n", start + rng.randrange(20))
+                    ranged = prowldash._iter_mmap_rows(path, columns, (start, len(raw) if cut < 0 else cut + 1),
+                                                       fieldnames)
+                    while True:
+                        try:
+                            rows.append(next(ranged))
+                        except StopIteration as done:
+                            start = done.value[1]
+                            break
+                self.assertEqual(rows, expected)
+
+    def test_process_single_file_matches_parse_csv(self):
+        path = os.path.join(self.fixtures_dir, "cis_2.0_aws_compliance.csv")
+        rows, _ = parse_csv(path)
+        result = process_single_file((path, None, []))
+        self.assertNotIn("error", result)
+        self.assertEqual(result["row_count"], len(rows))
+        self.assertEqual(result["csv_format"], "compliance")
+        self.assertEqual([r["checkId"] for r in result["rows"]], [r["REQUIREMENTS_ID"] for r in rows])
+
+
+class TestKeepColumns(unittest.TestCase):
+    """Test that raw rows are dropped unless columns are explicitly kept."""
+
+    ROW = {"ACCOUNT_UID": "123", "CHECK_ID": "c1", "SEVERITY": "High", "STATUS": "FAIL", "PARTITION": "aws"}
+
+    def test_raw_row_not_retained(self):
+        normalized = normalize_row(self.ROW, "main")
+        self.assertNotIn("_raw", normalized)
+        self.assertNotIn("extra", normalized)
+        self.assertNotIn("extra", extract_finding(normalized))
+
+    def test_keep_columns_allowlist(self):
+        normalized = normalize_row(self.ROW, "main", ["PARTITION", "MISSING"])
+        self.assertEqual(normalized["extra"], {"PARTITION": "aws", "MISSING": ""})
+        self.assertEqual(extract_finding(normalized)["extra"], {"PARTITION": "aws", "MISSING": ""})
+
+
+class TestColumnProjection(unittest.TestCase):
+    """Test that parsing is driven by the per-format column manifest."""
+
+    class RecordingRow(dict):
+        def __init__(self):
+            super().__init__()
+            self.read = set()
+
+        def get(self, key, default=None):
+            self.read.add(key)
+            return super().get(key, default)
+
+    def test_manifest_matches_normalize_row(self):
+        for csv_format in ("main", "compliance"):
+            with self.subTest(csv_format=csv_format):
+                row = self.RecordingRow()
+                normalize_row(row, csv_format)
+                manifest = prowldash.FORMAT_COLUMNS[csv_format] | prowldash.DETAIL_COLUMNS[csv_format]
+                self.assertEqual(row.read, manifest)
+
+    def test_no_details_skips_text_columns(self):
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "generic_aws_scan.csv")
+        full = process_single_file((path, None, []))["rows"]
+        lean = process_single_file((path, None, [], None, None, False))["rows"]
+        self.assertTrue(any(r.remediation for r in full))
+        self.assertEqual({(r.risk, r.remediation, r.remediationUrl) for r in lean}, {("", "", "")})
+        self.assertEqual([r.resourceId for r in lean], [r.resourceId for r in full])
+
+    @patch("prowldash.os.path.getsize", return_value=15 * 1024 * 1024)
+    @patch("prowldash.USE_PANDAS", True)
+    @patch("prowldash.pd")
+    def test_pandas_reads_only_manifest_columns(self, mock_pd, mock_getsize):
+        mock_reader = MagicMock()
+        mock_reader.__enter__.return_value = mock_reader
+        chunk = MagicMock()
+        chunk.to_dict.return_value = [{"CHECK_ID": "c1"}]  # No rows would fall back to the csv module
+        mock_reader.__iter__.return_value = iter([chunk])
+        mock_pd.read_csv.return_value = mock_reader
+        parse_csv("huge.csv", prowldash.parse_columns(details=False))
+        usecols = mock_pd.read_csv.call_args.kwargs["usecols"]
+        self.assertTrue(usecols("CHECK_ID"))
+        self.assertFalse(usecols("RISK"))
+        self.assertFalse(usecols("RESOURCE_DETAILS"))
+
+
+class TestFindingRecord(unittest.TestCase):
+    """Test the compact Finding record used end-to-end."""
+
+    def setUp(self):
+        self.finding = normalize_row({
+            "ACCOUNT_UID": "123", "REGION": "us-east-1", "CHECK_ID": "c1", "CHECK_TITLE": "Check 1",
+            "STATUS": "FAIL", "SEVERITY": "High", "RESOURCE_UID": "arn:1", "COMPLIANCE": "MITRE-ATTACK: T1552",
+        }, "main")
+
+    def test_dict_style_access(self):
+        self.assertIsInstance(self.finding, Finding)
+        self.assertEqual(self.finding["checkId"], "c1")
+        self.assertEqual(self.finding["id"], "c1")  # display alias
+        self.assertEqual(self.finding.get("severity"), "high")
+        self.assertEqual(self.finding.get("delta", "unchanged"), "unchanged")
+        self.assertNotIn("delta", self.finding)
+        with self.assertRaises(KeyError):
+            self.finding["nope"]
+
+    def test_pickle_roundtrip(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.finding)), self.finding)
+
+    def test_json_emission(self):
+        self.finding["acct"] = "...0123"
+        loaded = json.loads(safe_json_dumps({"findings": [self.finding]}))["findings"][0]
+        self.assertEqual(loaded["id"], "c1")
+        self.assertEqual(loaded["resource"], "arn:1")
+        self.assertEqual(loaded["delta"], "unchanged")
+        self.assertEqual(loaded["mitre"], ["T1552"])
+        self.assertEqual(loaded["acct"], "...0123")
+        self.assertNotIn("extra", loaded)
+
+
+class TestDictionaryEncoding(unittest.TestCase):
+    """Test per-run interning and dictionary-encoded dashboard JSON."""
+
+    def _row(self, i):
+        # Build strings at runtime so equal values are distinct objects, as from a CSV reader
+        return {"ACCOUNT_UID": "".join(["123", "456"]), "REGION": "-".join(["us", "east", "1"]),
+                "CHECK_ID": "c1", "STATUS": "FAIL", "SEVERITY": "High", "RESOURCE_UID": f"arn:{i}"}
+
+    def test_symbol_table_codes(self):
+        table = SymbolTable()
+        self.assertEqual([table.code(v) for v in ["a", "b", "a", None]], [0, 1, 0, 2])
+        self.assertEqual(table.values, ["a", "b", None])
+
+    def test_normalize_row_interns_repeated_values(self):
+        symbols = SymbolTable()
+        a = normalize_row(self._row(1), "main", symbols=symbols)
+        b = normalize_row(self._row(2), "main", symbols=symbols)
+        self.assertIs(a.region, b.region)
+        self.assertIs(a.acctId, b.acctId)
+        self.assertIsNot(a.resourceId, b.resourceId)
+
+    def test_encoded_findings_roundtrip(self):
+        symbols = SymbolTable()
+        findings = [normalize_row(self._row(i), "main", symbols=symbols) for i in range(3)]
+        data = {"findings": findings, "dictionaries": {col: SymbolTable() for col in ENCODED_COLUMNS}}
+        loaded = json.loads(safe_json_dumps(data))
+        dicts = loaded["dictionaries"]
+        self.assertEqual(loaded["findings"][2]["region"], 0)
+        self.assertEqual(dicts["region"][loaded["findings"][2]["region"]], "us-east-1")
+        self.assertEqual(dicts["severity"], ["high"])
+        self.assertEqual(loaded["findings"][1]["resource"], "arn:1")
+
+    def test_column_oriented_findings(self):
+        symbols = SymbolTable()
+        findings = [normalize_row(self._row(i), "main", symbols=symbols) for i in range(3)]
+        dictionaries = {col: SymbolTable() for col in ENCODED_COLUMNS}
+        data = {"findings": prowldash.FindingColumns(findings, dictionaries), "dictionaries": dictionaries}
+        loaded = json.loads("".join(prowldash.iter_safe_json(data, chunk_rows=2)))
+        columns, dicts = loaded["findings"], loaded["dictionaries"]
+        self.assertEqual(columns["count"], 3)
+        self.assertEqual(columns["region"], [0, 0, 0])
+        self.assertEqual(columns["resource"], ["arn:0", "arn:1", "arn:2"])
+        self.assertEqual([dicts["delta"][c] for c in columns["delta"]], ["unchanged"] * 3)
+        self.assertNotIn("extra", columns)
+        rows = [{col: values[i] for col, values in columns.items() if col != "count"} for i in range(3)]
+        expected = json.loads(safe_json_dumps({"findings": findings, "dictionaries": {
+            col: SymbolTable() for col in ENCODED_COLUMNS}}))["findings"]
+        self.assertEqual(rows, expected)
+
+    def test_search_corpus(self):
+        findings = [
+            Finding(resourceId="arn:aws:s3:::Logs-Bucket", resourceName="logs-bucket", statusExt="Bucket\nnot encrypted"),
+            Finding(resourceId="i-0abc", resourceName="Web", statusExt=""),
+        ]
+        corpus = prowldash.SearchCorpus(findings)
+        self.assertEqual(corpus[:], ["arn:aws:s3:::logs-bucket bucket not encrypted", "i-0abc web"])
+        self.assertEqual(json.loads("".join(prowldash.iter_safe_json(corpus, chunk_rows=1))), corpus[:])
+
+
+class TestColumnarBatches(unittest.TestCase):
+    """Test the columnar worker -> parent transport."""
+
+    def setUp(self):
+        self.fixtures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+        self.findings = [
+            normalize_row({"ACCOUNT_UID": "1", "CHECK_ID": f"c{i % 2}", "STATUS": "FAIL", "SEVERITY": "Low",
+                           "RESOURCE_UID": f"arn:{i}", "COMPLIANCE": "MITRE-ATTACK: T1078", "PARTITION": "aws"},
+                          "main", ["PARTITION"])
+            for i in range(300)
+        ]
+        self.findings[0].delta = "fixed"
+
+    def test_encode_decode_roundtrip(self):
+        decoded = decode_batch(encode_batch(self.findings))
+        self.assertEqual(decoded, self.findings)
+        self.assertEqual(decoded[5].mitre, ("T1078",))
+        self.assertEqual(decoded[5].extra, {"PARTITION": "aws"})
+        self.assertIsNone(decoded[5].delta)
+        self.assertEqual(decode_batch(encode_batch([])), [])
+
+    def test_concat_matches_single_encode(self):
+        head, tail = self.findings[:100], self.findings[100:]
+        tail[0].region = "eu-west-1"
+        joined = prowldash.concat_batches([encode_batch(head), encode_batch([]), encode_batch(tail)])
+        self.assertEqual(joined, encode_batch(self.findings))
+
+    def test_streamed_encoding_matches_list(self):
+        payload, summary, count = prowldash.encode_findings(iter(self.findings))
+        self.assertEqual(payload, encode_batch(self.findings))
+        self.assertEqual(summary, prowldash.summarize_rows(self.findings))
+        self.assertEqual(count, 300)
+        self.assertEqual(prowldash.encode_findings(iter([]))[0], encode_batch([]))
+
+    @unittest.skipUnless(prowldash.USE_SHARED_MEMORY, "shared memory not available")
+    def test_shared_memory_roundtrip(self):
+        handle = share_batch(self.findings)
+        self.assertEqual(set(handle), {"shm", "size"})
+        self.assertEqual(load_batch(handle), self.findings)
+
+    def test_process_file_shared_matches_direct(self):
+        path = os.path.join(self.fixtures_dir, "generic_aws_scan.csv")
+        direct = process_single_file((path, None, []))
+        shared = process_file_shared((path, None, []))
+        if prowldash.USE_SHARED_MEMORY:
+            self.assertNotIn("rows", shared)
+        self.assertEqual(collect_rows(shared), direct["rows"])
+
+
+class TestSplitParsing(unittest.TestCase):
+    """Test parsing one CSV in byte ranges across a process pool."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.path = os.path.join(self.tmp, "org_scan.csv")
+        with open(self.path, "w", encoding="utf-8", newline="") as f:
+            f.write("ACCOUNT_UID;REGION;CHECK_ID;STATUS;SEVERITY;SERVICE_NAME;RESOURCE_UID;RISK\n")
+            for i in range(3000):
+                risk = f"risk {i}"
+                if i % 7 == 0:
+                    # Continuation lines that look like records, so some cuts land inside a field
+                    risk = '"multi\n' + "a;b;c;d;e;f;g;h\n" * (i % 3) + 'line ""quoted"";"'
+                f.write(f"{i % 5};us-east-1;check_{i % 40};{'FAIL' if i % 3 else 'PASS'};high;s3;arn:{i};{risk}\n")
+
+    def test_ranges_match_sequential_parse(self):
+        from concurrent.futures import ProcessPoolExecutor
+        expected = process_single_file((self.path, None, []))
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            for parts in (2, 5, 16):
+                with self.subTest(parts=parts):
+                    result = process_single_file((self.path, None, []), executor=executor, parts=parts)
+                    self.assertNotIn("error", result)
+                    self.assertEqual(result["rows"], expected["rows"])
+                    self.assertEqual(result["summary"], expected["summary"])
+                    self.assertEqual(result["row_count"], 3000)
+
+    @unittest.skipUnless(prowldash.USE_SHARED_MEMORY, "shared memory not available")
+    def test_interrupted_split_frees_pending_segments(self):
+        from concurrent.futures import Future
+        import threading
+
+        handles = []
+
+        class StalledExecutor:
+            """First range is interrupted, the second finishes late, the rest never start."""
+
+            def __init__(self):
+                self.submitted = 0
+
+            def submit(self, fn, job):
+                future = Future()
+                self.submitted += 1
+                if self.submitted == 1:
+                    future.set_exception(KeyboardInterrupt())
+                elif self.submitted == 2:
+                    future.set_running_or_notify_cancel()
+
+                    def finish():
+                        time.sleep(0.05)
+                        try:
+                            result = fn(job)
+                        except Exception as e:
+                            future.set_exception(e)
+                            return
+                        handles.append(result["batch"])
+                        future.set_result(result)
+                    threading.Thread(target=finish).start()
+                return future
+
+        path = os.path.join(self.tmp, "plain_scan.csv")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write("ACCOUNT_UID;REGION;CHECK_ID;STATUS;SEVERITY;SERVICE_NAME;RESOURCE_UID\n")
+            for i in range(3000):
+                f.write(f"{i % 5};us-east-1;check_{i % 40};FAIL;high;s3;arn:{i}\n")
+        with self.assertRaises(KeyboardInterrupt):
+            prowldash.parse_csv_ranges(StalledExecutor(), path, prowldash.parse_columns(), "main", [], 4)
+        self.assertEqual(len(handles), 1)
+        with self.assertRaises(FileNotFoundError):
+            prowldash.load_payload(handles[0])
+
+    def test_split_count(self):
+        self.assertEqual(prowldash.split_count(self.path, 8), 1)
+        with patch("prowldash.SPLIT_RANGE_BYTES", 32 * 1024):
+            self.assertGreater(prowldash.split_count(self.path, 8), 1)
+            self.assertEqual(prowldash.split_count(self.path, 1), 1)
+
+
+class TestParserCalibration(unittest.TestCase):
+    """Test the calibrated parser selection that replaces the fixed 10MB cutoff."""
+
+    def setUp(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        path_patch = patch("prowldash.calibration_path", return_value=prowldash.Path(tmp) / "calibration.json")
+        path_patch.start()
+        self.addCleanup(path_patch.stop)
+        prowldash.parser_thresholds.cache_clear()
+        self.addCleanup(prowldash.parser_thresholds.cache_clear)
+
+    def test_crossover_threshold(self):
+        sizes = [1, 4, 16, 64]
+        self.assertEqual(prowldash.crossover_threshold(sizes, [1, 4, 16, 64], [2, 5, 12, 40]), 8)
+        self.assertEqual(prowldash.crossover_threshold(sizes, [1, 4, 16, 64], [0, 3, 12, 40]), 0)
+        # A win that does not hold at larger sizes does not count
+        self.assertEqual(prowldash.crossover_threshold(sizes, [1, 4, 16, 64], [0, 3, 17, 40]), 32)
+        self.assertIsNone(prowldash.crossover_threshold(sizes, [1, 4, 16, 64], [0, 3, 12, 70]))
+
+    def test_calibration_is_stored_per_interpreter(self):
+        with patch("sys.stdout"):
+            entry = prowldash.calibrate_parsers(sizes=(8 * 1024, 32 * 1024), repeat=1)
+        self.assertEqual(len(entry["times"]["mmap"]), 2)
+        with open(prowldash.calibration_path(), encoding="utf-8") as f:
+            self.assertIn(prowldash.runtime_key(), json.load(f))
+
+    @patch("prowldash.os.path.getsize", return_value=2 * 1024 * 1024)
+    @patch("prowldash.USE_PANDAS", True)
+    @patch("prowldash.pd")
+    def test_choose_parser_uses_calibrated_threshold(self, mock_pd, mock_getsize):
+        mock_pd.__version__ = "2.2.0"
+        self.assertEqual(prowldash.choose_parser("scan.csv", ()), "mmap")  # Default 10MB cutoff
+
+        def calibrate(thresholds, version="2.2.0"):
+            calibration = {prowldash.runtime_key(): {"engines": {"pandas": version}, "thresholds": thresholds}}
+            with open(prowldash.calibration_path(), "w", encoding="utf-8") as f:
+                json.dump(calibration, f)
+            prowldash.parser_thresholds.cache_clear()
+
+        calibrate({"pandas": 1024 * 1024})
+        self.assertEqual(prowldash.choose_parser("scan.csv", ()), "pandas")
+        calibrate({"pandas": None})
+        self.assertEqual(prowldash.choose_parser("scan.csv", ()), "mmap")
+        calibrate({"pandas": 1024 * 1024}, version="1.5.0")  # Stale: measured with another pandas
+        self.assertEqual(prowldash.choose_parser("scan.csv", ()), "mmap")
+
+
+@unittest.skipUnless(prowldash.USE_PANDAS, "pandas not installed")
+class TestPandasFramePath(unittest.TestCase):
+    """Test that the vectorized Pandas path matches normalize_row and summarize_rows."""
+
+    def setUp(self):
+        self.fixtures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+    def test_frames_match_row_path(self):
+        fields = prowldash.FINDING_FIELDS
+        for name in ("generic_aws_scan.csv", "cis_2.0_aws_compliance.csv", "mitre_multiple.csv"):
+            for keep_columns in ([], ["CHECK_ID"]):
+                with self.subTest(name=name, keep_columns=keep_columns):
+                    path = os.path.join(self.fixtures_dir, name)
+                    columns = prowldash.parse_columns(keep_columns)
+                    parsed = prowldash.parse_csv_frames(path, columns, keep_columns)
+                    rows = list(iter_csv_rows(path, "mmap", columns))
+                    expected = [normalize_row(r, parsed["csv_format"], keep_columns) for r in rows]
+                    actual = decode_batch(parsed["payload"])
+                    self.assertEqual([[getattr(f, k) for k in fields] for f in actual],
+                                     [[getattr(f, k) for k in fields] for f in expected])
+                    self.assertEqual(parsed["summary"], summarize_rows(expected))
+
+    def test_process_single_file_uses_frames(self):
+        path = os.path.join(self.fixtures_dir, "cis_2.0_aws_compliance.csv")
+        vectorized = process_single_file((path, None, []), parser="pandas")
+        rows = process_single_file((path, None, []), parser="mmap")
+        self.assertEqual(vectorized["parser"], prowldash.PARSER_NAMES["pandas"])
+        self.assertEqual([[getattr(f, k) for k in prowldash.FINDING_FIELDS] for f in vectorized["rows"]],
+                         [[getattr(f, k) for k in prowldash.FINDING_FIELDS] for f in rows["rows"]])
+
+    def test_no_manifest_column_falls_back_to_rows(self):
+        # Comma-separated: no ";"-split header name is in the manifest, so Pandas drops every row
+        path = os.path.join(self.fixtures_dir, "visual_docs_data.csv")
+        columns = prowldash.parse_columns([])
+        self.assertIsNone(prowldash.parse_csv_frames(path, columns))
+        expected = process_single_file((path, None, []), parser="stdlib")
+        for parser in ("pandas", "mmap"):
+            with self.subTest(parser=parser):
+                result = process_single_file((path, None, []), parser=parser)
+                self.assertNotIn("error", result)
+                self.assertEqual(result["row_count"], expected["row_count"])
+                self.assertEqual(result["summary"], expected["summary"])
+                self.assertEqual(result["rows"], expected["rows"])
+        self.assertEqual(len(list(iter_csv_rows(path, "pandas", columns))), expected["row_count"])
+
+
+# Row-by-row statistics as computed before the fused aggregation pass,
+# kept independent of prowldash so the fused pass is checked against them
+def _reference_counts(rows):
+    counts = {
+        "total": len(rows),
+        "fail": sum(1 for r in rows if r.get("status") == "FAIL"),
+        "pass": sum(1 for r in rows if r.get("status") == "PASS"),
+        "manual": sum(1 for r in rows if r.get("status") == "MANUAL"),
+        "fixed": sum(1 for r in rows if r.get("delta") == "fixed"),
+        "newFail": sum(1 for r in rows if r.get("delta") == "new-fail"),
+    }
+    for sev in ("critical", "high", "medium", "low"):
+        counts[sev] = sum(1 for r in rows if r.get("status") == "FAIL" and r.get("severity") == sev)
+    return counts
+
+
+def reference_stats(data, old_data):
+    stats = _reference_counts(data)
+    stats["failDelta"] = stats["fail"] - sum(1 for r in old_data if r.get("status") == "FAIL")
+    stats["passDelta"] = stats["pass"] - sum(1 for r in old_data if r.get("status") == "PASS")
+    stats["hasComparison"] = True
+    return stats
+
+
+def reference_by_account(data, accounts):
+    by_acct = {}
+    for r in data:
+        acct_id = r.get("acctId", "unknown")
+        bar = by_acct.setdefault(accounts.get(acct_id, {}).get("short", acct_id), {"fail": 0, "pass": 0, "total": 0})
+        bar["total"] += 1
+        if r.get("status") == "FAIL":
+            bar["fail"] += 1
+        elif r.get("status") == "PASS":
+            bar["pass"] += 1
+    return by_acct
+
+
+def reference_account_stats(data, accounts):
+    stats = {}
+    for acct_id in accounts:
+        rows = [r for r in data if r.get("acctId") == acct_id]
+        if rows:
+            stats[acct_id] = _reference_counts(rows)
+    return stats
+
+
+def reference_by_service(data):
+    by_svc = {}
+    for r in data:
+        svc = r.get("service") or "Unknown"
+        if r.get("status") == "FAIL":
+            by_svc.setdefault(svc, {"fail": 0, "pass": 0})["fail"] += 1
+        elif r.get("status") == "PASS":
+            by_svc.setdefault(svc, {"fail": 0, "pass": 0})["pass"] += 1
+    top = sorted(by_svc.items(), key=lambda x: x[1]["fail"], reverse=True)[:6]
+    return [{"name": n, **v} for n, v in top]
+
+
+def reference_by_severity(data):
+    by_sev = {s: 0 for s in ("critical", "high", "medium", "low")}
+    for r in data:
+        sev = (r.get("severity") or "").lower()
+        if r.get("status") == "FAIL" and sev in by_sev:
+            by_sev[sev] += 1
+    return [{"name": s, "count": n} for s, n in by_sev.items()]
+
+
+class TestPartialAggregates(unittest.TestCase):
+    """Test that merged worker summaries reproduce the row-based statistics."""
+
+    def setUp(self):
+        self.fixtures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+        self.old = process_single_file((os.path.join(self.fixtures_dir, "cis_2.0_aws_compliance.csv"), None, []))["rows"]
+        self.new = [Finding.from_dict(dict(r, status="PASS")) if i % 3 == 0 else r for i, r in enumerate(self.old)]
+
+    def test_merge_matches_single_summary(self):
+        half = len(self.new) // 2
+        merged = merge_summaries([summarize_rows(self.new[:half]), summarize_rows(self.new[half:])])
+        self.assertEqual(merged, summarize_rows(self.new))
+        self.assertEqual(list(merged), list(summarize_rows(self.new)))
+
+    def test_summary_stats_match_compute_functions(self):
+        data = calculate_delta(self.new, self.old)
+        # A service whose findings are all MANUAL gets no service bar
+        data += [Finding(acctId=data[0].acctId, region="us-east-1", checkId=f"manual_{i}", status="MANUAL",
+                         service="zz-manual-only") for i in range(50)]
+        accounts = get_accounts(data)
+        agg = prowldash.aggregate_summary(summarize_rows(data), accounts, summarize_rows(self.old))
+
+        self.assertEqual(agg["stats"], reference_stats(data, self.old))
+        self.assertEqual(agg["by_account"], reference_by_account(data, accounts))
+        self.assertEqual(agg["account_stats"], reference_account_stats(data, accounts))
+        self.assertEqual(agg["by_service"], reference_by_service(data))
+        self.assertNotIn("zz-manual-only", [s["name"] for s in agg["by_service"]])
+        self.assertEqual(agg["by_severity"], reference_by_severity(data))
+        self.assertEqual(agg["regions"], sorted({r["region"] for r in data if r["region"]}))
+        self.assertFalse(prowldash.compute_stats(data, [])["hasComparison"])
+
+    def test_fixture_stats_match_reference(self):
+        for name in sorted(os.listdir(self.fixtures_dir)):
+            if not name.endswith(".csv"):
+                continue
+            with self.subTest(fixture=name):
+                result = process_single_file((os.path.join(self.fixtures_dir, name), None, []))
+                if "rows" not in result:
+                    continue
+                data = result["rows"]
+                accounts = get_accounts(data)
+                agg = prowldash.aggregate_summary(result["summary"], accounts)
+                self.assertEqual(agg["by_service"], reference_by_service(data))
+                self.assertEqual(agg["by_account"], reference_by_account(data, accounts))
+                self.assertEqual(agg["account_stats"], reference_account_stats(data, accounts))
+                self.assertEqual(agg["by_severity"], reference_by_severity(data))
+
+    def test_fused_pass_matches_naive_counts(self):
+        data = calculate_delta(self.new, self.old)
+        accounts = get_accounts(data)
+        agg = prowldash.aggregate_findings(data, accounts, self.old)
+
+        def naive(rows):
+            return {
+                "total": len(rows),
+                "fail": sum(1 for r in rows if r["status"] == "FAIL"),
+                "pass": sum(1 for r in rows if r["status"] == "PASS"),
+                "manual": sum(1 for r in rows if r["status"] == "MANUAL"),
+                "fixed": sum(1 for r in rows if r.get("delta") == "fixed"),
+                "newFail": sum(1 for r in rows if r.get("delta") == "new-fail"),
+                **{s: sum(1 for r in rows if r["status"] == "FAIL" and r["severity"] == s)
+                   for s in ("critical", "high", "medium", "low")},
+            }
+
+        expected = naive(data)
+        self.assertGreater(expected["fixed"], 0)
+        self.assertEqual({k: agg["stats"][k] for k in expected}, expected)
+        self.assertEqual(agg["stats"]["failDelta"], expected["fail"] - naive(self.old)["fail"])
+        for acct_id in accounts:
+            self.assertEqual(agg["account_stats"][acct_id], naive([r for r in data if r["acctId"] == acct_id]))
+
+    def test_worker_result_carries_summary(self):
+        result = process_single_file((os.path.join(self.fixtures_dir, "generic_aws_scan.csv"), None, []))
+        self.assertEqual(result["summary"], summarize_rows(result["rows"]))
+        self.assertEqual(sum(result["summary"].values()), result["row_count"])
+
+
+class TestParseCache(unittest.TestCase):
+    """Test the persistent parse cache."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp, "cache")
+        os.mkdir(self.cache_dir)
+        fixture = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "generic_aws_scan.csv")
+        self.path = os.path.join(self.tmp, "scan.csv")
+        shutil.copy(fixture, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_hit_matches_fresh_parse(self):
+        fresh = process_single_file((self.path, None, [], self.cache_dir))
+        cached = process_single_file((self.path, None, [], self.cache_dir))
+        self.assertNotIn("cached", fresh)
+        self.assertTrue(cached["cached"])
+        self.assertEqual(cached["rows"], fresh["rows"])
+        self.assertEqual(cached["summary"], fresh["summary"])
+        for field in ("framework", "csv_format", "scan_date", "row_count"):
+            self.assertEqual(cached[field], fresh[field])
+
+    def test_shared_path_uses_cached_payload(self):
+        process_single_file((self.path, None, [], self.cache_dir))
+        direct = process_single_file((self.path, None, [], None))
+        shared = process_file_shared((self.path, None, [], self.cache_dir))
+        self.assertTrue(shared["cached"])
+        self.assertNotIn("payload", shared)
+        self.assertEqual(collect_rows(shared), direct["rows"])
+
+    def test_key_tracks_content_and_options(self):
+        key = prowldash.cache_key(self.path, None, [], self.cache_dir)
+        self.assertEqual(prowldash.cache_key(self.path, None, [], self.cache_dir), key)
+        self.assertNotEqual(prowldash.cache_key(self.path, "hipaa", [], self.cache_dir), key)
+        self.assertNotEqual(prowldash.cache_key(self.path, None, ["PARTITION"], self.cache_dir), key)
+        with patch.object(prowldash, "CACHE_SCHEMA", prowldash.CACHE_SCHEMA + 1):
+            self.assertNotEqual(prowldash.cache_key(self.path, None, [], self.cache_dir), key)
+        with patch.object(prowldash, "FINDING_FIELDS", prowldash.FINDING_FIELDS + ("newField",)):
+            self.assertNotEqual(prowldash.cache_key(self.path, None, [], self.cache_dir), key)
+        with open(self.path, "a") as f:
+            f.write("\n")
+        self.assertNotEqual(prowldash.cache_key(self.path, None, [], self.cache_dir), key)
+
+    def test_prune_evicts_least_recently_used(self):
+        for i, name in enumerate(["old", "mid", "new"]):
+            path = os.path.join(self.cache_dir, f"{name}.pdc")
+            with open(path, "wb") as f:
+                f.write(b"x" * 100)
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+        self.assertEqual(prowldash.prune_cache(self.cache_dir, max_bytes=250), 1)
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ["mid.pdc", "new.pdc"])
+
+
+class TestScanFiles(unittest.TestCase):
+    """Test the columnar scan export format."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "generic_aws_scan.csv")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_pdscan_roundtrip(self):
+        rows = process_single_file((self.path, None, []))["rows"]
+        payload = prowldash.encode_batch(rows)
+        for compress in (True, False):
+            path = os.path.join(self.tmp, f"scan-{compress}.pdscan")
+            prowldash.write_scan_file(path, {"framework": "cis"}, payload, compress=compress)
+            meta, body = prowldash.read_scan_file(path)
+            self.assertEqual(meta, {"framework": "cis"})
+            self.assertEqual(prowldash.decode_batch(body), rows)
+
+    def test_export_reads_back_like_csv(self):
+        fresh = process_single_file((self.path, None, [], None, self.tmp))
+        self.assertTrue(os.path.exists(fresh["export"]))
+        exported = process_single_file((fresh["export"], None, []))
+        self.assertEqual(exported["rows"], fresh["rows"])
+        self.assertEqual(exported["summary"], fresh["summary"])
+        for field in ("framework", "csv_format", "scan_date", "row_count"):
+            self.assertEqual(exported[field], fresh[field])
+        self.assertEqual(process_single_file((fresh["export"], "hipaa", []))["framework"], "hipaa")
+
+    def test_rejects_foreign_file(self):
+        path = os.path.join(self.tmp, "bogus.pdscan")
+        with open(path, "wb") as f:
+            f.write(b"not a scan file")
+        self.assertIn("error", process_single_file((path, None, [])))
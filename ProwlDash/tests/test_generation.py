@@ -1,9 +1,14 @@
 
 import unittest
 import os
+import json
+import gzip
+import base64
 import shutil
 import tempfile
-from prowldash import generate_html, parse_csv
+from prowldash import generate_html, parse_csv, process_single_file, build_dashboard
+from prowldash import iter_safe_json, write_html, safe_json_dumps
+from prowldash import Finding, FindingColumns, SymbolTable
 
 class TestDashboardGeneration(unittest.TestCase):
     def setUp(self):
@@ -50,6 +55,14 @@ class TestDashboardGeneration(unittest.TestCase):
         self.assertIn("function init()", html_output, "init() function missing")
         self.assertIn("renderTable()", html_output, "renderTable call missing")
         
+    def test_table_is_windowed(self):
+        """The findings table renders a window of rows with one delegated click listener."""
+        html_output = generate_html({"findings": []}, "cis")
+        self.assertIn("function renderTableWindow()", html_output)
+        self.assertIn("getElementById('tableBody').addEventListener('click'", html_output)
+        self.assertNotIn("querySelectorAll('tr').forEach", html_output,
+                         "Regression: per-row listeners on every rendered row")
+
     def test_no_export_buttons(self):
         """Ensure Export buttons are really gone (V5.1 Simplification)."""
         if not os.path.exists(self.cis_path):
@@ -62,5 +75,86 @@ class TestDashboardGeneration(unittest.TestCase):
         self.assertNotIn("exportPDF", html_output, "exportPDF() function still present")
         self.assertNotIn("html2canvas", html_output, "html2canvas library still present")
 
+    def test_build_dashboard_writes_output(self):
+        """build_dashboard is self-contained so it can run in a pool worker."""
+        if not os.path.exists(self.cis_path):
+            self.skipTest("CIS fixture not found")
+
+        result = process_single_file((self.cis_path, None, []))
+        entry = {"filepath": self.cis_path, "scan_date": result["scan_date"], "rows": result["rows"]}
+        built = build_dashboard(("cis", [entry], self.test_dir))
+
+        self.assertEqual(built["framework"], "cis")
+        self.assertEqual(built["stats"]["total"], 2)
+        self.assertTrue(os.path.exists(built["output_path"]))
+        self.assertIn("Generating", built["log"][0])
+
+    def test_removed_findings_embedded(self):
+        """Old-scan findings with no match in the new scan are listed in DATA.removed."""
+        def scan(ids):
+            return [Finding(acctId="111122223333", region="us-east-1", checkId=f"check_{i}", status="FAIL",
+                            severity="high", resourceId=f"arn:aws:s3:::bucket-{i}") for i in ids]
+        entries = [{"filepath": "old.csv", "scan_date": "Jan 01, 2026", "rows": scan([1, 2, 3])},
+                   {"filepath": "new.csv", "scan_date": "Feb 01, 2026", "rows": scan([1])}]
+        built = build_dashboard(("cis", entries, self.test_dir))
+        self.assertEqual(built["stats"]["removed"], 2)
+
+        with open(built["output_path"], encoding="utf-8") as f:
+            data = json.loads(f.read().split("const DATA = ", 1)[1].split(";\n", 1)[0])
+        removed = data["removed"]
+        self.assertEqual(removed["count"], 2)
+        self.assertEqual(removed["resource"], ["arn:aws:s3:::bucket-2", "arn:aws:s3:::bucket-3"])
+        self.assertEqual([data["dictionaries"]["id"][c] for c in removed["id"]], ["check_2", "check_3"])
+        self.assertNotIn("delta", removed)
+        self.assertEqual(data["findings"]["count"], 1)
+
+    def test_streamed_json_matches_single_dump(self):
+        """Findings are encoded and escaped in chunks without changing the output."""
+        findings = [{"id": f"check_{i}", "statusExt": "</script><b>"} for i in range(5)]
+        data = {"scanInfo": "a/b", "findings": findings, "empty": [], "stats": {"total": 5}}
+        expected = json.dumps(data, separators=(",", ":"))
+        expected = expected.replace("/", "\\/").replace("<", "\\u003c").replace(">", "\\u003e")
+        for chunk_rows in (1, 2, 1000):
+            with self.subTest(chunk_rows=chunk_rows):
+                self.assertEqual("".join(iter_safe_json(data, chunk_rows)), expected)
+        self.assertEqual(safe_json_dumps({}), "{}")
+
+    def test_write_html_streams_generate_html(self):
+        if not os.path.exists(self.cis_path):
+            self.skipTest("CIS fixture not found")
+
+        data = {"findings": process_single_file((self.cis_path, None, []))["rows"], "stats": {}}
+        path = os.path.join(self.test_dir, "cis_dashboard.html")
+        write_html(data, "cis", path)
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), generate_html(data, "cis"))
+
+    def test_compressed_html_embeds_gzip_data(self):
+        """--compress embeds the same escaped JSON, gzipped and base64-encoded."""
+        findings = [{"id": f"check_{i}", "statusExt": "</script>" * i} for i in range(3000)]
+        data = {"scanInfo": "Scan", "findings": findings}
+        html_output = generate_html(data, "cis", compress=True)
+        self.assertNotIn("const DATA = ", html_output)
+        encoded = html_output.split('const DATA_GZIP = "', 1)[1].split('";', 1)[0]
+        self.assertEqual(gzip.decompress(base64.b64decode(encoded)).decode("utf-8"), safe_json_dumps(data))
+        self.assertIn("new DecompressionStream('gzip')", html_output)
+
+    def test_detail_text_embedded_once_per_check(self):
+        """Risk/remediation text moves out of DATA into the lazily parsed detail block."""
+        findings = [Finding(checkId=f"check_{i % 3}", resourceId=f"arn:{i}", risk=f"Risk {i % 3} </script>",
+                            remediation=f"Fix {i % 3}") for i in range(30)]
+        details = SymbolTable()
+        data = {"findings": FindingColumns(findings, {}, details)}
+        html_output = generate_html(data, "cis", blocks={"detailData": details.values})
+        embedded = json.loads(html_output.split('const DATA = ', 1)[1].split(';\n', 1)[0])
+        self.assertNotIn("risk", embedded["findings"])
+        self.assertNotIn("Risk 0", html_output.split('id="detailData">', 1)[0])
+        block = html_output.split('id="detailData">', 1)[1].split("</script>", 1)[0]
+        self.assertNotIn("<", block)
+        table = json.loads(block)
+        self.assertEqual(len(table), 3)
+        for code, finding in zip(embedded["findings"]["detail"], findings):
+            self.assertEqual(table[code][:2], [finding.risk, finding.remediation])
+
 if __name__ == "__main__":
     unittest.main()
@@ -11,12 +11,13 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import main function (we'll run it via subprocess or direct call if possible, 
 # but direct call mimics usage better if we patch sys.argv)
-from prowldash import main
+from prowldash import main, load_manifest
 
 class TestIntegration(unittest.TestCase):
     def setUp(self):
         self.test_dir = tempfile.mkdtemp()
         self.csv_path = os.path.join(self.test_dir, "test_scan.csv")
+        self.cache_dir = os.path.join(self.test_dir, "cache")
         
         # Create a dummy CSV
         with open(self.csv_path, "w") as f:
@@ -36,6 +37,7 @@ class TestIntegration(unittest.TestCase):
             "prowldash.py", 
             "--output", output_dir, 
             "--no-timestamp", 
+            "--cache-dir", self.cache_dir,
             self.csv_path
         ]
         
@@ -50,5 +52,92 @@ class TestIntegration(unittest.TestCase):
         # CIS should be detected from "CIS-1.0" in compliance column
         self.assertTrue(os.path.exists(os.path.join(output_dir, "cis_dashboard.html")))
 
+    def test_multiple_frameworks_built_in_parallel(self):
+        """Each framework's dashboard is built by the worker pool."""
+        output_dir = os.path.join(self.test_dir, "output")
+        hipaa_path = os.path.join(self.test_dir, "hipaa_scan.csv")
+        with open(hipaa_path, "w") as f:
+            f.write("ACCOUNT_UID;CHECK_ID;STATUS;SEVERITY;TIMESTAMP;COMPLIANCE\n")
+            f.write("123456789012;check-3;FAIL;medium;2025-01-01T12:00:00Z;HIPAA: 164_308\n")
+
+        sys.argv = ["prowldash.py", "--output", output_dir, "--no-timestamp", "--cache-dir", self.cache_dir,
+                    self.csv_path, hipaa_path]
+        try:
+            main()
+        except SystemExit as e:
+            self.assertEqual(e.code, 0)
+
+        self.assertTrue(os.path.exists(os.path.join(output_dir, "cis_dashboard.html")))
+        self.assertTrue(os.path.exists(os.path.join(output_dir, "hipaa_dashboard.html")))
+        with open(os.path.join(output_dir, "index.html")) as f:
+            landing = f.read()
+        self.assertIn("hipaa_dashboard.html", landing)
+
+    def test_second_run_uses_parse_cache(self):
+        """Unchanged inputs are loaded from the cache and produce the same dashboard."""
+        outputs = []
+        for run in ("first", "second"):
+            output_dir = os.path.join(self.test_dir, run)
+            sys.argv = ["prowldash.py", "--output", output_dir, "--no-timestamp", "--cache-dir", self.cache_dir,
+                        self.csv_path]
+            main()
+            with open(os.path.join(output_dir, "cis_dashboard.html")) as f:
+                outputs.append(f.read())
+
+        self.assertTrue(any(name.endswith(".pdc") for name in os.listdir(self.cache_dir)))
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_dashboard_from_export_matches_csv(self):
+        """Scan files written by --export produce the same dashboard as the CSV."""
+        export_dir = os.path.join(self.test_dir, "scans")
+        outputs = []
+        for name in ("from_csv", "from_export"):
+            if name == "from_csv":
+                inputs = ["--export", export_dir, self.csv_path]
+            else:
+                inputs = [os.path.join(export_dir, f) for f in os.listdir(export_dir)]  # .pdscan or .parquet
+            output_dir = os.path.join(self.test_dir, name)
+            sys.argv = ["prowldash.py", "--output", output_dir, "--no-timestamp", "--no-cache", *inputs]
+            try:
+                main()
+            except SystemExit as e:
+                self.assertEqual(e.code, 0)
+            with open(os.path.join(output_dir, "cis_dashboard.html"), encoding="utf-8") as f:
+                outputs.append(f.read())
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_incremental_rebuilds_only_changed_framework(self):
+        """--incremental rewrites only the dashboards whose inputs changed."""
+        output_dir = os.path.join(self.test_dir, "output")
+        hipaa_path = os.path.join(self.test_dir, "hipaa_scan.csv")
+        with open(hipaa_path, "w") as f:
+            f.write("ACCOUNT_UID;CHECK_ID;STATUS;SEVERITY;TIMESTAMP;COMPLIANCE\n")
+            f.write("123456789012;check-3;FAIL;medium;2025-01-01T12:00:00Z;HIPAA: 164_308\n")
+        sys.argv = ["prowldash.py", "--output", output_dir, "--incremental", "--cache-dir", self.cache_dir,
+                    self.csv_path, hipaa_path]
+
+        def mtimes():
+            return {name: os.stat(os.path.join(output_dir, name)).st_mtime_ns
+                    for name in ("cis_dashboard.html", "hipaa_dashboard.html", "index.html")}
+
+        main()
+        manifest = load_manifest(output_dir)
+        self.assertEqual(set(manifest["dashboards"]), {"cis", "hipaa"})
+        for entry in manifest["inputs"].values():
+            self.assertNotIn("summary", entry)  # Rebuilds take per-account data from the parse cache
+        first = mtimes()
+
+        main()
+        self.assertEqual(mtimes(), first)
+
+        with open(hipaa_path, "a") as f:
+            f.write("123456789012;check-4;PASS;low;2025-01-01T12:00:00Z;HIPAA: 164_308\n")
+        main()
+        third = mtimes()
+        self.assertEqual(third["cis_dashboard.html"], first["cis_dashboard.html"])
+        self.assertNotEqual(third["hipaa_dashboard.html"], first["hipaa_dashboard.html"])
+        with open(os.path.join(output_dir, "index.html")) as f:
+            self.assertIn("cis_dashboard.html", f.read())
+
 if __name__ == "__main__":
     unittest.main()
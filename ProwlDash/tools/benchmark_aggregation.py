@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Aggregation benchmark for ProwlDash.
+Computes the dashboard statistics for a synthetic multi-account scan twice -
+once with the legacy multi-pass compute_* functions (one scan per counter and a
+filtered copy per account) and once with the fused `prowldash.aggregate_findings`
+pass - checks both agree and reports the speedup.
+"""
+
+import sys
+import time
+import random
+import argparse
+from collections import defaultdict
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import prowldash  # noqa: E402
+
+
+def synthetic_findings(count, accounts):
+    """Build annotated Finding records spread over `accounts` accounts."""
+    statuses = ["PASS", "FAIL", "MANUAL"]
+    severities = ["critical", "high", "medium", "low"]
+    regions = ["us-east-1", "us-west-2", "eu-west-1", "ap-south-1"]
+    services = ["iam", "s3", "ec2", "rds", "kms", "cloudtrail", "lambda", "eks"]
+    deltas = ["unchanged"] * 8 + ["fixed", "new-fail"]
+    symbols = prowldash.SymbolTable()
+    findings = []
+    for i in range(count):
+        acct = symbols.intern(f"{100000000000 + i % accounts}")
+        findings.append(prowldash.Finding(
+            acctId=acct, acctName=acct, region=random.choice(regions), checkId=f"check_{i % 200}",
+            status=random.choice(statuses), severity=random.choice(severities),
+            service=random.choice(services), resourceId=f"arn:{i}", delta=random.choice(deltas),
+        ))
+    return findings
+
+
+def legacy_aggregate(data, old_data):
+    """Pre-fusion aggregation: every counter and every account is its own pass."""
+    def count(rows):
+        return {
+            "total": len(rows),
+            "fail": sum(1 for r in rows if r.get("status") == "FAIL"),
+            "pass": sum(1 for r in rows if r.get("status") == "PASS"),
+            "manual": sum(1 for r in rows if r.get("status") == "MANUAL"),
+            "fixed": sum(1 for r in rows if r.get("delta") == "fixed"),
+            "newFail": sum(1 for r in rows if r.get("delta") == "new-fail"),
+            "critical": sum(1 for r in rows if r.get("status") == "FAIL" and r.get("severity") == "critical"),
+            "high": sum(1 for r in rows if r.get("status") == "FAIL" and r.get("severity") == "high"),
+            "medium": sum(1 for r in rows if r.get("status") == "FAIL" and r.get("severity") == "medium"),
+            "low": sum(1 for r in rows if r.get("status") == "FAIL" and r.get("severity") == "low"),
+        }
+
+    accounts = prowldash.get_accounts(data)
+    stats = count(data)
+    stats["failDelta"] = stats["fail"] - sum(1 for r in old_data if r.get("status") == "FAIL")
+    stats["passDelta"] = stats["pass"] - sum(1 for r in old_data if r.get("status") == "PASS")
+    stats["hasComparison"] = True
+
+    account_stats = {}
+    for acct_id in accounts:
+        acct_data = [r for r in data if r.get("acctId") == acct_id]
+        if acct_data:
+            account_stats[acct_id] = count(acct_data)
+
+    by_svc = defaultdict(lambda: {"fail": 0, "pass": 0})
+    for r in data:
+        svc = r.get("service") or "Unknown"
+        if r.get("status") == "FAIL":
+            by_svc[svc]["fail"] += 1
+        elif r.get("status") == "PASS":
+            by_svc[svc]["pass"] += 1
+    return stats, account_stats, dict(by_svc)
+
+
+def fused_aggregate(data, old_data):
+    """Current aggregation: one summarizing pass, then one pass over the summary."""
+    agg = prowldash.aggregate_findings(data, prowldash.get_accounts(data), old_data)
+    return agg["stats"], agg["account_stats"], agg["by_service"]
+
+
+def timed(fn, *args):
+    start = time.time()
+    result = fn(*args)
+    return result, time.time() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--accounts", type=int, default=300)
+    args = parser.parse_args()
+
+    random.seed(42)
+    data = synthetic_findings(args.rows, args.accounts)
+    old_data = synthetic_findings(args.rows // 10, args.accounts)
+
+    print("=" * 40)
+    print(f"Aggregation benchmark: {args.rows} findings, {args.accounts} accounts")
+    print("=" * 40)
+
+    (legacy_stats, legacy_accts, _), legacy_time = timed(legacy_aggregate, data, old_data)
+    print(f"Legacy multi-pass : {legacy_time:8.2f}s")
+    (fused_stats, fused_accts, _), fused_time = timed(fused_aggregate, data, old_data)
+    print(f"Fused single-pass : {fused_time:8.2f}s")
+
+    if legacy_stats != fused_stats or legacy_accts != fused_accts:
+        print("❌ Results differ between legacy and fused aggregation")
+        sys.exit(1)
+    print(f"\n✓ Identical results, {legacy_time / fused_time:.1f}x faster")
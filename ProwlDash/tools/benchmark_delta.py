@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Delta matching benchmark for ProwlDash.
+Generates an old and a new synthetic scan with known ground truth (unchanged,
+status-flipped, renamed, removed and newly created resources), then runs the
+previous many-to-one matcher and the one-to-one `prowldash.diff_scans` on it
+and reports delta accuracy, removed-resource detection and runtime.
+"""
+
+import sys
+import time
+import random
+import argparse
+from collections import defaultdict
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import prowldash  # noqa: E402
+
+
+def synthetic_scans(count, accounts):
+    """
+    Return (old_rows, new_rows, truth) where truth[i] is the index of the old
+    finding new_rows[i] really corresponds to, or None for a new resource.
+    """
+    regions = ["us-east-1", "eu-west-1"]
+    words = ["logs", "data", "backup", "app", "web", "etl", "audit", "build"]
+    old_rows = []
+    while len(old_rows) < count:
+        acct = f"{100000000000 + random.randrange(accounts)}"
+        region = random.choice(regions)
+        check = f"check_{random.randrange(60)}"
+        # Mostly small buckets, a few large ones (IAM users, S3 buckets under one check)
+        size = 1 if random.random() < 0.2 else random.choice([3, 8, 20, 50, 400])
+        for _ in range(min(size, count - len(old_rows))):
+            name = f"{random.choice(words)}-{random.choice(words)}-{random.randrange(10 ** 6)}"
+            old_rows.append(prowldash.Finding(
+                acctId=acct, region=region, checkId=check, status=random.choice(["PASS", "FAIL"]),
+                severity="high", resourceId=f"arn:aws:s3:::{name}", resourceName=name,
+            ))
+
+    new_rows, truth = [], []
+    for i, old in enumerate(old_rows):
+        roll = random.random()
+        if roll < 0.05:
+            continue  # Removed
+        status = old.status if random.random() < 0.85 else ("PASS" if old.status == "FAIL" else "FAIL")
+        rid, name = old.resourceId, old.resourceName
+        if roll < 0.11:
+            # Renamed: ARN and name change slightly, only fuzzy matching can pair it
+            name = name[:-2] + f"{random.randrange(100):02d}" + "-v2"
+            rid = f"arn:aws:s3:::{name}"
+        new_rows.append(prowldash.Finding(
+            acctId=old.acctId, region=old.region, checkId=old.checkId, status=status,
+            severity="high", resourceId=rid, resourceName=name,
+        ))
+        truth.append(i)
+        if random.random() < 0.04:
+            # Newly created resource in the same bucket
+            name = f"new-{random.choice(words)}-{random.randrange(10 ** 6)}"
+            new_rows.append(prowldash.Finding(
+                acctId=old.acctId, region=old.region, checkId=old.checkId, status=random.choice(["PASS", "FAIL"]),
+                severity="high", resourceId=f"arn:aws:s3:::{name}", resourceName=name,
+            ))
+            truth.append(None)
+    return old_rows, new_rows, truth
+
+
+def expected_delta(new, old):
+    if old is None:
+        return "new-fail" if new.status == "FAIL" else "unchanged"
+    if old.status == "FAIL" and new.status == "PASS":
+        return "fixed"
+    if old.status == "PASS" and new.status == "FAIL":
+        return "new-fail"
+    return "unchanged"
+
+
+def many_to_one(new_rows, old_rows):
+    """Previous calculate_delta matching: every strategy may reuse an old finding."""
+    index = {id(r): i for i, r in enumerate(old_rows)}
+    strict = {prowldash.create_key(r): r for r in old_rows}
+    by_name = {f"{r.acctId}|{r.region}|{r.checkId}|{r.resourceName}": r for r in old_rows if r.resourceName}
+    buckets = defaultdict(list)
+    for r in old_rows:
+        buckets[f"{r.acctId}|{r.region}|{r.checkId}"].append(r)
+    matchers = {}
+
+    matched = []
+    for row in new_rows:
+        old = strict.get(prowldash.create_key(row))
+        if not old and row.resourceName:
+            old = by_name.get(f"{row.acctId}|{row.region}|{row.checkId}|{row.resourceName}")
+        if not old:
+            key = f"{row.acctId}|{row.region}|{row.checkId}"
+            candidates = buckets.get(key, [])
+            if len(candidates) == 1:
+                old = candidates[0]
+            elif len(candidates) > 1:
+                if key not in matchers:
+                    matchers[key] = prowldash.FuzzyMatcher(candidates)
+                old = matchers[key].best_match(row.resourceId)
+        matched.append(old)
+
+    deltas = [expected_delta(row, old) for row, old in zip(new_rows, matched)]
+    used = {index[id(old)] for old in matched if old is not None}
+    reused = sum(1 for old in matched if old is not None) - len(used)
+    removed = [i for i in range(len(old_rows)) if i not in used]
+    return deltas, removed, reused
+
+
+def one_to_one(new_rows, old_rows):
+    """Current matcher: `prowldash.diff_scans`."""
+    index = {id(r): i for i, r in enumerate(old_rows)}
+    data, removed = prowldash.diff_scans(new_rows, old_rows)
+    return [r.delta for r in data], [index[id(r)] for r in removed], 0
+
+
+def report(label, deltas, removed, reused, duration, truth_deltas, truth_removed):
+    correct = sum(1 for a, b in zip(deltas, truth_deltas) if a == b)
+    hits = len(truth_removed & set(removed))
+    print(f"\n{label} ({duration:.2f}s)")
+    print(f"  Delta accuracy : {correct / len(truth_deltas):.3%} ({len(truth_deltas) - correct} wrong)")
+    print(f"  Fixed / new-fail: {deltas.count('fixed')} / {deltas.count('new-fail')} "
+          f"(truth {truth_deltas.count('fixed')} / {truth_deltas.count('new-fail')})")
+    print(f"  Removed        : {len(removed)} reported, {hits}/{len(truth_removed)} correct")
+    print(f"  Old findings matched more than once: {reused}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--accounts", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(42)
+    old_rows, new_rows, truth = synthetic_scans(args.rows, args.accounts)
+    truth_deltas = [expected_delta(row, None if i is None else old_rows[i]) for row, i in zip(new_rows, truth)]
+    truth_removed = set(range(len(old_rows))) - {i for i in truth if i is not None}
+
+    print("=" * 40)
+    print(f"Delta benchmark: {len(old_rows)} old / {len(new_rows)} new findings")
+    print("=" * 40)
+
+    for label, matcher in (("Many-to-one (previous)", many_to_one), ("One-to-one diff_scans", one_to_one)):
+        start = time.time()
+        deltas, removed, reused = matcher(new_rows, old_rows)
+        report(label, deltas, removed, reused, time.time() - start, truth_deltas, truth_removed)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+XSS-safe JSON encoding benchmark for ProwlDash.
+Encodes the dashboard findings of a synthetic scan with the previous
+whole-document `json.dumps` + three `str.replace` passes, with two
+single-pass variants that escape each string value inside the C encoder (a
+translation table, and a cache of escaped literals), and with
+`prowldash.safe_json_dumps` (one encoder call and escape per chunk of
+findings). Checks all variants produce the same output.
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import prowldash  # noqa: E402
+
+ESCAPES = str.maketrans({"/": "\\/", "<": "\\u003c", ">": "\\u003e"})
+
+
+def synthetic_display(count):
+    """Build dashboard data for `count` findings, already dictionary-encoded."""
+    statuses = ["PASS", "FAIL", "MANUAL"]
+    severities = ["critical", "high", "medium", "low"]
+    dictionaries = {col: prowldash.SymbolTable() for col in prowldash.ENCODED_COLUMNS}
+    findings = []
+    for i in range(count):
+        check = f"iam_check_{i % 200}"
+        findings.append(prowldash.Finding(
+            acctId=f"1234567890{i % 100:02d}", region="us-east-1", checkId=check,
+            checkTitle=f"Ensure {check} is configured", status=random.choice(statuses),
+            statusExt=f"User user-{i} has no MFA device <enabled>", severity=random.choice(severities),
+            service="iam", resourceId=f"arn:aws:iam::123456789012:user/user-{i}", resourceName=f"user-{i}",
+            risk=f"Risk text for {check}. " * 10, remediation=f"Run aws iam ... </b> for {check}. " * 8,
+            remediationUrl="https://docs.aws.amazon.com/IAM/latest/UserGuide/id_credentials_mfa.html",
+        ).to_display(dictionaries))
+    return {"findings": findings, "dictionaries": {col: t.values for col, t in dictionaries.items()}}
+
+
+def replace_passes(data):
+    """Previous safe_json_dumps: encode, then rescan the output three times."""
+    json_str = json.dumps(data, separators=(",", ":"))
+    return json_str.replace("/", "\\/").replace("<", "\\u003c").replace(">", "\\u003e")
+
+
+def encode_strings_with(string_encoder, data):
+    """Run the C encoder with `string_encoder` producing every string literal."""
+    encode = json.encoder.c_make_encoder(None, None, string_encoder, None, ":", ",", False, False, True)
+    return "".join(encode(data, 0))
+
+
+def translate_per_string(data):
+    """Single pass: translation table applied to each string as it is encoded."""
+    ascii_literal = json.encoder.encode_basestring_ascii
+    return encode_strings_with(lambda s: ascii_literal(s).translate(ESCAPES), data)
+
+
+class EscapedLiterals(dict):
+    """String -> escaped literal; C-level lookups for repeated strings and keys."""
+
+    def __missing__(self, value):
+        literal = json.encoder.encode_basestring_ascii(value)
+        literal = literal.replace("/", "\\/").replace("<", "\\u003c").replace(">", "\\u003e")
+        self[value] = literal
+        return literal
+
+
+def cached_per_string(data):
+    """Single pass: escaped literals cached per distinct string."""
+    return encode_strings_with(EscapedLiterals().__getitem__, data)
+
+
+def timed(encoder, data, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = encoder(data)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(42)
+    data = synthetic_display(args.rows)
+
+    encoders = [("json.dumps + 3x replace", replace_passes), ("safe_json_dumps", prowldash.safe_json_dumps)]
+    if json.encoder.c_make_encoder is not None:  # Not on PyPy
+        encoders[1:1] = [("Translate per string", translate_per_string), ("Cached per string", cached_per_string)]
+
+    print("=" * 62)
+    print(f"JSON escaping benchmark: {args.rows} findings")
+    print("=" * 62)
+    reference, baseline = None, None
+    for label, encoder in encoders:
+        result, duration = timed(encoder, data, args.repeat)
+        reference = reference or result
+        baseline = baseline or duration
+        if result != reference:
+            print(f"❌ {label} output differs")
+            sys.exit(1)
+        print(f"{label:<26} {duration:8.3f}s {baseline / duration:6.2f}x  ({len(result) / 2 ** 20:.0f}MB)")
+    print("\n✓ Identical output")
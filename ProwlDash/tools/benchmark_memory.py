@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for ProwlDash finding records.
+Builds the in-memory finding set for a synthetic scan twice - once with the
+legacy dict-per-stage pipeline and once with `prowldash.Finding` - and reports
+retained bytes per finding.
+"""
+
+import sys
+import gc
+import time
+import random
+import argparse
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import prowldash  # noqa: E402
+
+
+def synthetic_rows(count):
+    """Yield Prowler main-format rows with fresh strings, like a CSV reader."""
+    statuses = ["PASS", "FAIL", "MANUAL"]
+    severities = ["Critical", "High", "Medium", "Low"]
+    regions = ["us-east-1", "us-west-2", "eu-west-1", "ap-south-1"]
+    for i in range(count):
+        acct = f"1234567890{i % 100:02d}"
+        check = f"iam_check_{i % 200}"
+        yield {
+            "ACCOUNT_UID": acct,
+            "ACCOUNT_NAME": f"Account {acct}",
+            "REGION": random.choice(regions),
+            "CHECK_ID": check,
+            "CHECK_TITLE": f"Ensure {check} is configured",
+            "STATUS": random.choice(statuses),
+            "STATUS_EXTENDED": f"User user-{i} has no MFA device",
+            "SEVERITY": random.choice(severities),
+            "SERVICE_NAME": "iam",
+            "RESOURCE_UID": f"arn:aws:iam::{acct}:user/user-{i}",
+            "RESOURCE_NAME": f"user-{i}",
+            "RISK": f"Risk text for {check}",
+            "REMEDIATION_RECOMMENDATION_TEXT": f"Remediation for {check}",
+            "REMEDIATION_RECOMMENDATION_URL": "https://docs.aws.amazon.com/",
+            "COMPLIANCE": "CIS-2.0: 1.10 | MITRE-ATTACK: T1078",
+            "TIMESTAMP": "2025-01-01T12:00:00Z",
+        }
+
+
+def legacy_pipeline(rows):
+    """Pre-Finding pipeline: normalize dict (+_raw), delta copy, display dict."""
+    normalized = []
+    for row in rows:
+        normalized.append({
+            "acctId": row.get("ACCOUNT_UID", ""),
+            "acctName": row.get("ACCOUNT_NAME", ""),
+            "region": row.get("REGION", ""),
+            "checkId": row.get("CHECK_ID", ""),
+            "checkTitle": row.get("CHECK_TITLE", ""),
+            "status": row.get("STATUS", ""),
+            "statusExt": row.get("STATUS_EXTENDED", ""),
+            "severity": row.get("SEVERITY", "").lower(),
+            "service": row.get("SERVICE_NAME", ""),
+            "resourceId": row.get("RESOURCE_UID", ""),
+            "resourceName": row.get("RESOURCE_NAME", ""),
+            "risk": row.get("RISK", ""),
+            "remediation": row.get("REMEDIATION_RECOMMENDATION_TEXT", ""),
+            "remediationUrl": row.get("REMEDIATION_RECOMMENDATION_URL", ""),
+            "compliance": row.get("COMPLIANCE", ""),
+            "mitre": prowldash.extract_mitre_techniques(row.get("COMPLIANCE", "")),
+            "_raw": row,
+        })
+    data = [dict(r, delta="unchanged", oldStatus=None) for r in normalized]
+    findings = [{
+        "id": r.get("checkId", ""), "title": r.get("checkTitle", ""), "status": r.get("status", ""),
+        "severity": r.get("severity", ""), "delta": r.get("delta", "unchanged"),
+        "oldStatus": r.get("oldStatus"), "oldSeverity": r.get("oldSeverity"), "acctId": r.get("acctId", ""),
+        "region": r.get("region", ""), "service": r.get("service", ""), "resource": r.get("resourceId", ""),
+        "resourceName": r.get("resourceName", ""), "statusExt": r.get("statusExt", ""), "risk": r.get("risk", ""),
+        "remediation": r.get("remediation", ""), "remediationUrl": r.get("remediationUrl", ""),
+        "profile": r.get("profile", ""), "section": r.get("section", ""), "rationale": r.get("rationale", ""),
+        "mitre": r.get("mitre", []),
+    } for r in data]
+    return normalized, data, findings
+
+
+def finding_pipeline(rows):
+    """Current pipeline: one interned Finding per row, annotated in place."""
+    symbols = prowldash.SymbolTable()
+    normalized = [prowldash.normalize_row(r, "main", symbols=symbols) for r in rows]
+    data = prowldash.calculate_delta(normalized, [])
+    findings = [prowldash.extract_finding(r) for r in data]
+    return normalized, data, findings
+
+
+def measure(pipeline, count, seed):
+    """Return (bytes retained per finding, seconds)."""
+    random.seed(seed)
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    retained = pipeline(synthetic_rows(count))
+    duration = time.time() - start
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+    gc.collect()
+    return current / count, duration
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print("=" * 40)
+    print(f"Memory benchmark: {args.rows} findings")
+    print("=" * 40)
+
+    legacy_bytes, legacy_time = measure(legacy_pipeline, args.rows, seed=42)
+    print(f"Legacy dicts : {legacy_bytes:8.0f} bytes/finding ({legacy_time:.2f}s)")
+    record_bytes, record_time = measure(finding_pipeline, args.rows, seed=42)
+    print(f"Finding      : {record_bytes:8.0f} bytes/finding ({record_time:.2f}s)")
+    print(f"\nReduction: {legacy_bytes / record_bytes:.1f}x "
+          f"({(legacy_bytes - record_bytes) * args.rows / (1024 * 1024):.0f}MB saved at {args.rows} rows)")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+CSV tokenizer benchmark for ProwlDash.
+For every fixture in tests/fixtures, times `csv.DictReader` (the previous stdlib
+path) against the memory-mapped tokenizer used by `process_single_file`, both
+on the fixture as shipped (many repetitions) and with its rows tiled up to a
+larger scan, plus the main-format fixture widened to Prowler's full column
+layout. Checks both parsers return the same values for the columns ProwlDash
+reads.
+"""
+
+import sys
+import csv
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import prowldash  # noqa: E402
+
+FIXTURES_DIR = PROJECT_ROOT / "tests" / "fixtures"
+
+
+def dictreader_rows(path):
+    """Previous stdlib path: full dict per row over a text file object."""
+    with open(path, "r", encoding="utf-8") as f:
+        return list(csv.DictReader(f, delimiter=";", quotechar='"'))
+
+
+def mmap_rows(path):
+    """Current stdlib path: memory-mapped tokenizer, normalized columns only."""
+    return list(prowldash.iter_csv_rows(path, "mmap", prowldash.NORMALIZED_COLUMNS))
+
+
+def tile(path, rows, out_dir):
+    """Write a copy of `path` with its data lines repeated up to `rows` lines."""
+    with open(path, "rb") as f:
+        header, *lines = f.read().splitlines(keepends=True)
+    lines = [line if line.endswith(b"\n") else line + b"\n" for line in lines]
+    target = Path(out_dir) / path.name
+    with open(target, "wb") as f:
+        f.write(header)
+        for i in range(rows):
+            f.write(lines[i % len(lines)])
+    return target
+
+
+# Column layout of Prowler's main CSV output (v4/v5): the fixtures are narrow,
+# real scans carry ~40 columns of which ProwlDash reads 16
+PROWLER_MAIN_COLUMNS = (
+    "AUTH_METHOD;TIMESTAMP;ACCOUNT_UID;ACCOUNT_NAME;ACCOUNT_EMAIL;ACCOUNT_ORGANIZATION_UID;"
+    "ACCOUNT_ORGANIZATION_NAME;ACCOUNT_TAGS;FINDING_UID;PROVIDER;CHECK_ID;CHECK_TITLE;CHECK_TYPE;STATUS;"
+    "STATUS_EXTENDED;MUTED;SERVICE_NAME;SUBSERVICE_NAME;SEVERITY;RESOURCE_TYPE;RESOURCE_UID;RESOURCE_NAME;"
+    "RESOURCE_DETAILS;RESOURCE_TAGS;PARTITION;REGION;DESCRIPTION;RISK;RELATED_URL;"
+    "REMEDIATION_RECOMMENDATION_TEXT;REMEDIATION_RECOMMENDATION_URL;REMEDIATION_CODE_NATIVEIAC;"
+    "REMEDIATION_CODE_TERRAFORM;REMEDIATION_CODE_CLI;REMEDIATION_CODE_OTHER;COMPLIANCE;CATEGORIES;"
+    "DEPENDS_ON;RELATED_TO;NOTES;PROWLER_VERSION"
+).split(";")
+
+
+def widen(path, out_dir):
+    """Rewrite a main-format fixture with the full Prowler column layout."""
+    target = Path(out_dir) / f"wide_{path.name}"
+    with open(path, "r", encoding="utf-8") as src, open(target, "w", encoding="utf-8", newline="") as dst:
+        writer = csv.writer(dst, delimiter=";")
+        writer.writerow(PROWLER_MAIN_COLUMNS)
+        for row in csv.DictReader(src, delimiter=";"):
+            writer.writerow([row.get(col) or f"{col.lower()} placeholder text" for col in PROWLER_MAIN_COLUMNS])
+    return target
+
+
+def timed(parser, path, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rows = parser(path)
+    return rows, (time.perf_counter() - start) / repeat
+
+
+def compare(label, path, repeat, totals):
+    # Best of three runs; single-CPU runners are noisy
+    reference, dict_time = min((timed(dictreader_rows, path, repeat) for _ in range(3)), key=lambda r: r[1])
+    rows, mmap_time = min((timed(mmap_rows, path, repeat) for _ in range(3)), key=lambda r: r[1])
+    projected = [{k: v for k, v in r.items() if k in prowldash.NORMALIZED_COLUMNS} for r in reference]
+    status = "✓" if projected == rows else "❌ rows differ"
+    print(f"{label:<32} {dict_time * 1000:10.2f}ms {mmap_time * 1000:10.2f}ms {dict_time / mmap_time:7.2f}x  {status}")
+    totals[0] += dict_time
+    totals[1] += mmap_time
+    return projected == rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows per tiled fixture")
+    parser.add_argument("--repeat", type=int, default=2000, help="Repetitions for the fixtures as shipped")
+    args = parser.parse_args()
+
+    fixtures = sorted(FIXTURES_DIR.glob("*.csv"))
+    print("=" * 78)
+    print(f"Tokenizer benchmark: {len(fixtures)} fixtures, as shipped and tiled to {args.rows} rows")
+    print("=" * 78)
+    print(f"{'Fixture':<32} {'DictReader':>12} {'mmap':>12} {'Speedup':>8}")
+
+    ok = True
+    shipped, tiled = [0.0, 0.0], [0.0, 0.0]
+    tmp = tempfile.mkdtemp()
+    try:
+        for path in fixtures:
+            ok &= compare(path.name, path, args.repeat, shipped)
+        for path in fixtures:
+            ok &= compare(f"{path.stem[:22]} x{args.rows}", tile(path, args.rows, tmp), 1, tiled)
+        wide = widen(FIXTURES_DIR / "generic_aws_scan.csv", tmp)
+        ok &= compare(f"generic, 41 columns x{args.rows}", tile(wide, args.rows, tmp), 1, [0.0, 0.0])
+    finally:
+        shutil.rmtree(tmp)
+
+    for label, (dict_time, mmap_time) in (("All fixtures, as shipped", shipped), ("All fixtures, tiled", tiled)):
+        print(f"{label:<32} {dict_time * 1000:10.2f}ms {mmap_time * 1000:10.2f}ms {dict_time / mmap_time:7.2f}x")
+
+    if not ok:
+        sys.exit(1)
+    print(f"\n✓ Identical values for all {len(prowldash.NORMALIZED_COLUMNS)} normalized columns")
@@ -81,6 +81,84 @@ class TestProwlDash(unittest.TestCase):
         # Should match bucket-100 (similarity > 0.7 likely)
         self.assertEqual(delta[0]['delta'], 'fixed') 
         
+    def test_fuzzy_matcher_matches_linear_scan(self):
+        # Small buckets are scored exhaustively: same pick as the old difflib loop, ties included
+        import difflib
+        ids = ['bucket-100', 'bucket-200', 'bucket-10', 'logs-100', 'bucket-100', 'x']
+        old_rows = [dict(self.old_row, resourceId=rid) for rid in ids]
+        matcher = prowldash.FuzzyMatcher(old_rows)
+        for rid in ['bucket-101', 'bucket-20', 'logs-10', 'zzz', 'bucket-1000', '']:
+            best_ratio, best = 0, None
+            for cand in old_rows:
+                ratio = difflib.SequenceMatcher(None, rid, cand['resourceId']).ratio()
+                if ratio > best_ratio:
+                    best_ratio, best = ratio, cand
+            expected = best if best_ratio > prowldash.FUZZY_THRESHOLD else None
+            self.assertIs(matcher.best_match(rid), expected, rid)
+
+    def test_fuzzy_matcher_indexed_bucket(self):
+        # Large buckets go through the trigram shortlist
+        old_rows = [dict(self.old_row, resourceId=f'arn:aws:s3:::data-{i * 7919 % 100003}')
+                    for i in range(200)]
+        matcher = prowldash.FuzzyMatcher(old_rows)
+        self.assertIs(matcher.best_match('arn:aws:s3:::data-7919x'), old_rows[1])
+        self.assertIsNone(matcher.best_match('completely-unrelated-resource'))
+
+    def test_fuzzy_matcher_large_bucket_vs_exhaustive(self):
+        # Shortlisted matching is approximate: never better than scoring every candidate,
+        # never a below-threshold pick, and in practice identical on renamed resources
+        import random
+        from unittest.mock import patch
+        rng = random.Random(2)
+        words = ['data', 'logs', 'backup', 'prod', 'dev', 'media', 'assets', 'archive']
+        ids = [f"arn:aws:s3:::{rng.choice(words)}-{rng.choice(words)}-{rng.randrange(10**6):06d}"
+               for _ in range(300)]
+        old_rows = [dict(self.old_row, resourceId=rid) for rid in ids]
+        renamed = [rid[:-2] + f"{n % 100:02d}-v2" for n, rid in enumerate(ids[::3])]
+        unrelated = [f"arn:aws:s3:::{rng.choice(words)}-{rng.randrange(10**6):06d}" for _ in range(50)]
+
+        shortlist = prowldash.FuzzyMatcher(old_rows)
+        with patch.object(prowldash, 'FUZZY_SCAN_LIMIT', 10**9):
+            exhaustive = prowldash.FuzzyMatcher(old_rows)
+            expected = {rid: exhaustive.best_index(rid) for rid in renamed + unrelated}
+
+        same = 0
+        for rid in renamed + unrelated:
+            idx, ratio = shortlist.best_index(rid)
+            exp_idx, exp_ratio = expected[rid]
+            self.assertLessEqual(ratio, exp_ratio, rid)
+            if exp_idx is not None:
+                self.assertIsNotNone(idx, rid)
+            if idx is not None:
+                self.assertGreater(ratio, prowldash.FUZZY_THRESHOLD, rid)
+            same += rid in renamed and ratio == exp_ratio
+        self.assertGreaterEqual(same, 0.98 * len(renamed))
+
+    def test_diff_scans_one_to_one(self):
+        # Both renamed resources are closest to bucket-100; the better pair (0.95) wins it
+        # and bucket-101 falls back to bucket-900 (0.8) instead of reusing bucket-100
+        old_rows = [dict(self.old_row, resourceId='bucket-100', resourceName=''),
+                    dict(self.old_row, resourceId='bucket-900', resourceName='', status='PASS')]
+        new_rows = [dict(self.old_row, resourceId=rid, resourceName='', status='PASS')
+                    for rid in ['bucket-101', 'bucket-100x']]
+        data, removed = prowldash.diff_scans(new_rows, old_rows)
+        self.assertEqual([r['delta'] for r in data], ['unchanged', 'fixed'])
+        self.assertEqual([r['oldStatus'] for r in data], ['PASS', 'FAIL'])
+        self.assertEqual(removed, [])
+
+    def test_diff_scans_reports_removed(self):
+        gone = dict(self.old_row, checkId='cis_9.9', resourceId='arn:gone')
+        data, removed = prowldash.diff_scans([self.old_row.copy()], [self.old_row, gone])
+        self.assertEqual(data[0]['delta'], 'unchanged')
+        self.assertEqual(removed, [gone])
+
+    def test_diff_scans_singleton_used_once(self):
+        first = dict(self.old_row, resourceId='arn:a', resourceName='a', status='PASS')
+        second = dict(self.old_row, resourceId='arn:b', resourceName='b', status='PASS')
+        data, removed = prowldash.diff_scans([first, second], [self.old_row])
+        self.assertEqual([r['delta'] for r in data], ['fixed', 'unchanged'])
+        self.assertEqual(removed, [])
+
     def test_stats_remediation(self):
         data = [
             {'status': 'PASS', 'delta': 'fixed', 'oldSeverity': 'critical'},
@@ -4,6 +4,8 @@ import os
 import csv
 from collections import defaultdict
 import difflib
+import random
+import time
 
 # Add parent dir to path to import prowldash
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -129,9 +131,82 @@ def advanced_match(new_rows, old_rows):
 
     return matches, results
 
+def benchmark_fuzzy(new_rows, old_rows):
+    """
+    Compare brute-force fuzzy matching (difflib against every bucket candidate)
+    with prowldash.FuzzyMatcher on the rows that reach the fuzzy stage.
+    """
+    from ProwlDash.prowldash import create_key
+
+    strict_keys = {create_key(r) for r in old_rows}
+    context_map = defaultdict(list)
+    for r in old_rows:
+        context_map[f"{r['acctId']}|{r['region']}|{r['checkId']}"].append(r)
+
+    fuzzy_rows = [
+        r for r in new_rows
+        if create_key(r) not in strict_keys
+        and len(context_map.get(f"{r['acctId']}|{r['region']}|{r['checkId']}", [])) > 1
+    ]
+
+    start = time.time()
+    brute = []
+    for row in fuzzy_rows:
+        best_ratio, best_cand = 0, None
+        for cand in context_map[f"{row['acctId']}|{row['region']}|{row['checkId']}"]:
+            ratio = similarity(row['resourceId'], cand['resourceId'])
+            if ratio > best_ratio:
+                best_ratio, best_cand = ratio, cand
+        brute.append((best_cand, best_ratio) if best_ratio > prowldash.FUZZY_THRESHOLD else (None, best_ratio))
+    brute_time = time.time() - start
+
+    start = time.time()
+    matchers = {}
+    indexed = []
+    for row in fuzzy_rows:
+        key = f"{row['acctId']}|{row['region']}|{row['checkId']}"
+        if key not in matchers:
+            matchers[key] = prowldash.FuzzyMatcher(context_map[key])
+        indexed.append(matchers[key].best_match(row['resourceId']))
+    indexed_time = time.time() - start
+
+    disagree = [ratio for (a, ratio), b in zip(brute, indexed) if a is not b]
+    agree = len(fuzzy_rows) - len(disagree)
+    print("\n--- Fuzzy Matcher Benchmark ---")
+    print(f"Rows reaching fuzzy stage: {len(fuzzy_rows)}")
+    print(f"Brute force: {brute_time:.2f}s ({sum(1 for b, _ in brute if b)} matched)")
+    print(f"Indexed:     {indexed_time:.2f}s ({sum(1 for b in indexed if b)} matched)")
+    if fuzzy_rows:
+        print(f"Agreement:   {agree}/{len(fuzzy_rows)} ({agree / len(fuzzy_rows):.2%})")
+        weak = sum(1 for ratio in disagree if ratio < 0.8)
+        print(f"Disagreements where brute force scored < 0.8 (noise matches): {weak}/{len(disagree)}")
+
+
+def synthetic_scans(count):
+    """One account/region/check bucket of `count` S3 buckets; ~70% renamed slightly."""
+    random.seed(42)
+    base = {"acctId": "123456789012", "region": "us-east-1", "checkId": "s3_bucket_public_access",
+            "status": "FAIL", "resourceName": ""}
+    old_rows, new_rows = [], []
+    for i in range(count):
+        name = f"{random.choice(['logs', 'data', 'backup', 'app'])}-{random.choice(['prod', 'dev'])}-{i * 7919 % 1000003}"
+        old_rows.append(dict(base, resourceId=f"arn:aws:s3:::{name}"))
+        if random.random() < 0.7:
+            name = name[:-1] + random.choice("ab")
+        else:
+            name = f"tmp-{random.randint(0, 10 ** 9)}"
+        new_rows.append(dict(base, resourceId=f"arn:aws:s3:::{name}", status="PASS"))
+    return old_rows, new_rows
+
+
 def main():
-    old_path = "ProwlDash/tests/data/old_scan.csv"
-    new_path = "ProwlDash/tests/data/new_scan.csv"
+    if len(sys.argv) == 3 and sys.argv[1] == "--synthetic":
+        old_rows, new_rows = synthetic_scans(int(sys.argv[2]))
+        benchmark_fuzzy(new_rows, old_rows)
+        return
+
+    old_path, new_path = (sys.argv[1:3] if len(sys.argv) == 3
+                          else ("ProwlDash/tests/data/old_scan.csv", "ProwlDash/tests/data/new_scan.csv"))
     
     if not os.path.exists(old_path) or not os.path.exists(new_path):
         print("Error: Test data not found.")
@@ -159,5 +234,7 @@ def main():
     for r in new_fails[:10]:
         print(f"[New] {r['check']} - {r['resource']}")
 
+    benchmark_fuzzy(new_rows, old_rows)
+
 if __name__ == "__main__":
     main()